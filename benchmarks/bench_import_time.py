@@ -0,0 +1,65 @@
+"""
+Measures how long importing the client takes, and which heavy dependencies
+the import pulls in, each in a fresh interpreter. With ``--max-ms`` the
+script fails if the median import takes longer, so it can guard against an
+eager import creeping back in.
+
+Run from the repository root::
+
+    python benchmarks/bench_import_time.py [--max-ms 50]
+"""
+import argparse
+import subprocess
+import sys
+
+RUNS = 15
+
+HEAVY_MODULES = ["requests", "yaml", "numpy", "pypif"]
+
+STATEMENTS = [
+    "import citrination_client",
+    "from citrination_client import Filter",
+    "from citrination_client import CitrinationClient"
+]
+
+SCRIPT = """
+import sys, time
+start = time.time()
+{}
+elapsed = time.time() - start
+print(elapsed * 1000)
+print(",".join(m for m in {!r} if m in sys.modules))
+"""
+
+
+def time_import(statement):
+    """
+    The import time in milliseconds, and the heavy modules imported, of a
+    statement run in a fresh interpreter.
+    """
+    output = subprocess.check_output([sys.executable, "-c", SCRIPT.format(statement, HEAVY_MODULES)])
+    elapsed, modules = output.decode("utf-8").splitlines()
+    return float(elapsed), modules
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-ms", type=float, help="Fail if importing the package takes longer")
+    args = parser.parse_args()
+
+    medians = {}
+    for statement in STATEMENTS:
+        timings = []
+        for _ in range(RUNS):
+            elapsed, modules = time_import(statement)
+            timings.append(elapsed)
+        medians[statement] = sorted(timings)[len(timings) // 2]
+        print("{:50s} {:8.1f} ms   imports: {}".format(statement, medians[statement], modules or "-"))
+
+    if args.max_ms is not None and medians[STATEMENTS[0]] > args.max_ms:
+        sys.exit("Importing the package took {:.1f} ms, more than {:.1f} ms".format(
+            medians[STATEMENTS[0]], args.max_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Compares the CPU cost of preparing the request body for one page of a
+paginated search: copying and re-encoding the whole query tree, as search
+pagination used to, against splicing the page into a :class:`CompiledQuery`.
+
+Run from the repository root::
+
+    python benchmarks/bench_query_pagination.py
+"""
+from citrination_client.search.compiled_query import CompiledQuery
+from citrination_client.search.query_encoder import QueryEncoder
+from query_trees import large_pif_system_query
+
+from copy import deepcopy
+import json
+import timeit
+
+PAGES = 200
+
+
+def deepcopy_page(query, from_index):
+    sub_query = deepcopy(query)
+    sub_query.from_index = from_index
+    return json.dumps(sub_query, cls=QueryEncoder)
+
+
+def main():
+    query = large_pif_system_query()
+
+    copied = timeit.timeit(lambda: deepcopy_page(query, 100), number=PAGES) / PAGES
+    compiled_query = CompiledQuery(query)
+    compiled = timeit.timeit(lambda: compiled_query.serialize(100, 100), number=PAGES) / PAGES
+    compile_once = timeit.timeit(lambda: CompiledQuery(query), number=PAGES) / PAGES
+
+    print("deepcopy + encode per page: {:10.1f} us".format(copied * 1e6))
+    print("compiled query per page:    {:10.1f} us".format(compiled * 1e6))
+    print("one-time compilation:       {:10.1f} us".format(compile_once * 1e6))
+    print("CPU saved per page:         {:10.1f} us".format((copied - compiled) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
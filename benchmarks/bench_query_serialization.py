@@ -0,0 +1,35 @@
+"""
+Compares the CPU cost of serializing a large query tree with pypif's
+``as_dictionary``, which camel cases every attribute of every node, against
+the serializers compiled once per query class that :class:`QueryEncoder`
+now uses. Both produce the same JSON.
+
+Run from the repository root::
+
+    python benchmarks/bench_query_serialization.py
+"""
+from citrination_client.search.query_encoder import QueryEncoder
+from query_trees import large_pif_system_query
+
+import json
+import timeit
+
+ROUNDS = 200
+
+
+def main():
+    query = large_pif_system_query()
+
+    reference = json.dumps(query.as_dictionary())
+    assert json.dumps(query, cls=QueryEncoder) == reference
+
+    pypif = timeit.timeit(lambda: json.dumps(query.as_dictionary()), number=ROUNDS) / ROUNDS
+    compiled = timeit.timeit(lambda: json.dumps(query, cls=QueryEncoder), number=ROUNDS) / ROUNDS
+
+    print("as_dictionary + encode:     {:10.1f} us".format(pypif * 1e6))
+    print("compiled serializers:       {:10.1f} us".format(compiled * 1e6))
+    print("speedup:                    {:10.2f}x".format(pypif / compiled))
+
+
+if __name__ == "__main__":
+    main()
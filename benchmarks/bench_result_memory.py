@@ -0,0 +1,51 @@
+"""
+Compares the memory held by a large prediction's predicted values, which
+store their fields in slots, with the same values stored in a per-instance
+dictionary.
+
+Search hits are not measured: they extend pypif's Serializable, which has no
+slots and serializes from the instance dictionary, so they keep it.
+
+Run from the repository root::
+
+    python benchmarks/bench_result_memory.py
+"""
+from citrination_client.models import PredictedValue
+
+import tracemalloc
+
+VALUES = 20000
+
+
+class DictPredictedValue(PredictedValue):
+    """
+    A predicted value whose fields are stored in a per-instance dictionary,
+    as they were before PredictedValue declared slots.
+    """
+
+
+def bytes_per_object(build):
+    """
+    The memory allocated per object by ``build``, excluding the memory of
+    the values the objects refer to, which is allocated before tracing.
+    """
+    values = [1.0 / (i + 1) for i in range(VALUES)]
+    tracemalloc.start()
+    objects = [build(v) for v in values]
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return allocated / float(VALUES)
+
+
+def main():
+    results = [
+        ("dictionary", bytes_per_object(lambda v: DictPredictedValue("band_gap", v, 0.1))),
+        ("PredictedValue", bytes_per_object(lambda v: PredictedValue("band_gap", v, 0.1)))
+    ]
+    for name, size in results:
+        print("{:24s} {:8.1f} bytes per object".format(name + ":", size))
+
+
+if __name__ == "__main__":
+    main()
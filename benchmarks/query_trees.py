@@ -0,0 +1,29 @@
+"""
+Builders for large query trees shared by the benchmarks in this directory.
+"""
+from citrination_client.search import *
+
+
+def large_pif_system_query(num_properties=50, num_filters=20):
+    """
+    Builds a :class:`PifSystemReturningQuery` with ``num_properties``
+    property queries, each with ``num_filters`` filters on its value.
+    """
+    properties = []
+    for i in range(num_properties):
+        properties.append(PropertyQuery(
+            name=FieldQuery(extract_as="property_{}".format(i), filter=Filter(equal="Property {}".format(i))),
+            value=FieldQuery(
+                extract_as="value_{}".format(i),
+                filter=[Filter(min=j, max=j + 1, logic="SHOULD") for j in range(num_filters)]),
+            units=FieldQuery(extract_as="units_{}".format(i))))
+
+    return PifSystemReturningQuery(
+        query=DataQuery(
+            dataset=DatasetQuery(id=[Filter(equal=str(i)) for i in range(10)]),
+            system=PifSystemQuery(
+                names=FieldQuery(extract_as="name", filter=Filter(exists=True)),
+                chemical_formula=ChemicalFieldQuery(extract_as="formula", filter=ChemicalFilter(equal="GaN")),
+                properties=properties)),
+        size=100,
+        return_system=False)
@@ -1,5 +1,23 @@
-from .client import CitrinationClient
-from citrination_client.base import *
-from citrination_client.search import *
-from citrination_client.data import *
-from citrination_client.models import *
\ No newline at end of file
+from citrination_client import base, search, data, models
+from citrination_client.util.lazy import lazy_attributes
+
+import sys
+
+# The classes and submodules of each subpackage are available from the top
+# level package, imported only when first accessed
+_attributes = {"CitrinationClient": "citrination_client.client"}
+_submodules = {}
+for _package in [base, search, data, models]:
+    for _name in _package.__all__:
+        _attributes[_name] = _package.__name__
+    _submodules.update(_package._submodules)
+_submodules["util"] = "citrination_client.util"
+
+# The asynchronous client uses async generators, which require Python 3.6
+if sys.version_info >= (3, 6):
+    _attributes["AsyncCitrinationClient"] = "citrination_client.aio"
+    _submodules["aio"] = "citrination_client.aio"
+
+lazy_attributes(globals(), _attributes, _submodules)
+
+del lazy_attributes, sys, _package, _name
@@ -0,0 +1,6 @@
+from citrination_client.aio.transport import AsyncTransport, AsyncResponse, AiohttpTransport
+from citrination_client.aio.base_client import AsyncBaseClient
+from citrination_client.aio.models import AsyncModelsClient
+from citrination_client.aio.search import AsyncSearchClient
+from citrination_client.aio.data import AsyncDataClient
+from citrination_client.aio.client import AsyncCitrinationClient
@@ -0,0 +1,137 @@
+from citrination_client.aio.transport import AiohttpTransport
+from citrination_client.base.base_client import DEFAULT_FAILURE_MESSAGE, _default_headers
+from citrination_client.base.json_backend import default_json_backend
+from citrination_client.base.response_handling import raise_on_response, check_general_success, get_response_json
+from citrination_client.base.retry_policy import RetryPolicy, RetryStats, RETRYABLE_EXCEPTIONS
+
+import asyncio
+
+
+class AsyncBaseClient(object):
+    """
+    Base class for the asynchronous clients, mirroring :class:`BaseClient`
+    with awaitable request methods.
+    """
+
+    def __init__(self, api_key, webserver_host, api_members=[], suppress_warnings=False, transport=None,
+                 retry_policy=None, json_backend=None):
+        """
+        Constructor.
+
+        :param api_key: Authentication token for the Citrination site
+        :type api_key: str
+        :param webserver_host: The base URL of the citrination site, e.g. https://citrination.com
+        :type webserver_host: str
+        :param api_members: The names of the member methods for this client
+        :type api_members: str[]
+        :param suppress_warnings: A flag indicating whether or not warning
+            messages to stdout should be printed
+        :type suppress_warnings: bool
+        :param transport: The transport used for all requests made by this
+            client. If not supplied, a new :class:`AiohttpTransport` is created.
+        :type transport: :class:`AsyncTransport`
+        :param retry_policy: The policy used to retry rate limited and failed
+            requests. If not supplied, a default :class:`RetryPolicy` is used.
+        :type retry_policy: :class:`RetryPolicy`
+        :param json_backend: The backend used to encode request bodies and
+            decode response bodies. If not supplied, the standard library's
+            json module is used.
+        :type json_backend: :class:`JsonBackend`
+        """
+        self.headers = _default_headers(api_key)
+        self.suppress_warnings = suppress_warnings
+        self.api_url = webserver_host + '/api'
+        self.api_members = api_members
+        if transport is None:
+            transport = AiohttpTransport()
+        self.transport = transport
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        if json_backend is None:
+            json_backend = default_json_backend()
+        self.json_backend = json_backend
+
+    def _handle_response(self, response, failure_message=DEFAULT_FAILURE_MESSAGE):
+        raise_on_response(response)
+        check_general_success(response, failure_message)
+        return response
+
+    def _get_success_json(self, response):
+        return get_response_json(response, self.json_backend)
+
+    def _get_qualified_route(self, route):
+        return "{}/{}".format(self.api_url, route)
+
+    def _warn(self, message):
+        if not self.suppress_warnings:
+            print("Citrination Client Warning - {}".format(message))
+
+    def _get_headers(self, headers=None):
+        if headers:
+            return headers
+        else:
+            return self.headers
+
+    async def _get(self, route, headers=None, failure_message=None):
+        return await self._request("GET", route, headers=headers, failure_message=failure_message, idempotent=True)
+
+    async def _post_json(self, route, data, headers=None, failure_message=None, idempotent=False,
+                         retry_policy=None):
+        return await self._post(route, self.json_backend.dumps(data), headers, failure_message, idempotent,
+                                retry_policy)
+
+    async def _post(self, route, data, headers=None, failure_message=None, idempotent=False, retry_policy=None):
+        return await self._request("POST", route, data=data, headers=headers, failure_message=failure_message,
+                                   idempotent=idempotent, retry_policy=retry_policy)
+
+    async def _put(self, route, data, headers=None, failure_message=None):
+        return await self._request("PUT", route, data=data, headers=headers, failure_message=failure_message,
+                                   idempotent=True)
+
+    async def _delete(self, route, headers=None, failure_message=None):
+        return await self._request("DELETE", route, headers=headers, failure_message=failure_message,
+                                   idempotent=True)
+
+    async def _request(self, method, route, data=None, headers=None, failure_message=None, idempotent=False,
+                       retry_policy=None):
+        url = self._get_qualified_route(route)
+        headers = self._get_headers(headers)
+        response = await self._send(lambda: self.transport.request(method, url, headers=headers, data=data),
+                                    idempotent=idempotent, retry_policy=retry_policy)
+        return self._handle_response(response, failure_message)
+
+    async def _send(self, request, idempotent=False, retry_policy=None):
+        """
+        Sends a request, retrying it according to this client's retry policy
+        without blocking the event loop between attempts.
+
+        :param request: A callable taking no arguments which returns an
+            awaitable of the response
+        :param idempotent: Whether the request can safely be repeated after a
+            server or connection error
+        :param retry_policy: The policy to retry this request with, in place
+            of the client's
+        :return: The final response
+        """
+        policy = retry_policy or self.retry_policy
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await request()
+            except RETRYABLE_EXCEPTIONS:
+                delay = policy.after_attempt(attempt, None, idempotent, self.retry_stats)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            delay = policy.after_attempt(attempt, response, idempotent, self.retry_stats)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+
+    def __repr__(self):
+        return "{}".format(self.api_members)
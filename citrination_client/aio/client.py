@@ -0,0 +1,84 @@
+from citrination_client.aio.data import AsyncDataClient
+from citrination_client.aio.models import AsyncModelsClient
+from citrination_client.aio.search import AsyncSearchClient
+from citrination_client.aio.transport import AiohttpTransport
+from citrination_client.base.retry_policy import RetryPolicy
+from citrination_client.base.json_backend import default_json_backend
+from citrination_client.client import _generate_lambda_proxy_method
+from citrination_client.util.credentials import get_preferred_credentials
+
+
+class AsyncCitrinationClient(object):
+    """
+    The asynchronous counterpart of :class:`CitrinationClient`, whose methods
+    return awaitables and whose paginated searches are asynchronous
+    generators. All of the sub-clients share a single transport, so many
+    concurrent requests can be made from one event loop.
+
+    The client should be closed when it is no longer needed, either by
+    awaiting :meth:`close` or by using it as an asynchronous context manager.
+    """
+
+    def __init__(self, api_key=None, site=None, suppress_warnings=False, transport=None, retry_policy=None,
+                 json_backend=None):
+        """
+        Constructor.
+
+        :param api_key: Your API key for Citrination
+        :type api_key: str
+        :param site: The domain name of your Citrination deployment
+            (the default is https://citrination.com)
+        :type site: str
+        :param suppress_warnings: A flag allowing you to suppress warning
+            statements guarding against misuse printed to stdout.
+        :type suppress_warnings: bool
+        :param transport: The transport shared by all of the sub-clients. If
+            not supplied, an :class:`AiohttpTransport` is created, which
+            requires the aiohttp package.
+        :type transport: :class:`AsyncTransport`
+        :param retry_policy: The policy used by every sub-client to retry rate
+            limited and failed requests
+        :type retry_policy: :class:`RetryPolicy`
+        :param json_backend: The backend used by every sub-client to encode
+            request bodies and decode response bodies
+        :type json_backend: :class:`JsonBackend`
+        """
+        api_key, site = get_preferred_credentials(api_key, site)
+        if transport is None:
+            transport = AiohttpTransport()
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        if json_backend is None:
+            json_backend = default_json_backend()
+        self.models = AsyncModelsClient(api_key, site, suppress_warnings=suppress_warnings, transport=transport,
+                                        retry_policy=retry_policy, json_backend=json_backend)
+        self.search = AsyncSearchClient(api_key, site, suppress_warnings=suppress_warnings, transport=transport,
+                                        retry_policy=retry_policy, json_backend=json_backend)
+        self.data = AsyncDataClient(api_key, site, suppress_warnings=suppress_warnings, transport=transport,
+                                    retry_policy=retry_policy, json_backend=json_backend)
+
+        clients = [self.models, self.search, self.data]
+
+        for client in clients:
+            client_methods = [a for a in dir(client) if not a.startswith('_')]
+            for method in client_methods:
+                setattr(self, method, _generate_lambda_proxy_method(client, method))
+
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.json_backend = json_backend
+
+    async def close(self):
+        """
+        Closes the transport shared by the sub-clients.
+        """
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __repr__(self):
+        return "['models', 'search', 'data']"
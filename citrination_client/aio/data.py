@@ -0,0 +1,193 @@
+from citrination_client.aio.base_client import AsyncBaseClient
+from citrination_client.data import DatasetVersion
+from citrination_client.data import routes as routes
+from citrination_client.data.client import _list_files_body, _matched_files_body, _dataset_files_from_versions, \
+    _dataset_body, _dataset_from_response_dict
+
+from pypif import pif
+
+
+class AsyncDataClient(AsyncBaseClient):
+    """
+    An asynchronous client for data management on Citrination, mirroring the
+    dataset and file listing methods of :class:`DataClient`. File uploads and
+    downloads read and write the local filesystem, and remain on
+    :class:`DataClient`.
+    """
+
+    def __init__(self, api_key, host="https://citrination.com", suppress_warnings=False, transport=None,
+                 retry_policy=None, json_backend=None):
+        """
+        Constructor.
+
+        :param api_key: A users API key, as a string
+        :type api_key: str
+        :param host: The base URL of the citrination site, e.g. https://citrination.com
+        :type host: str
+        :param suppress_warnings: Whether or not usage warnings should be
+            printed to stdout
+        :type suppress_warnings: bool
+        :param transport: The transport to make requests with
+        :type transport: :class:`AsyncTransport`
+        :param retry_policy: The policy used to retry rate limited and failed
+            requests
+        :type retry_policy: :class:`RetryPolicy`
+        :param json_backend: The backend used to encode request bodies and
+            decode response bodies
+        :type json_backend: :class:`JsonBackend`
+        """
+        members = [
+            "list_files",
+            "matched_file_count",
+            "get_dataset_files",
+            "get_dataset_file",
+            "create_dataset",
+            "create_dataset_version"
+        ]
+        super(AsyncDataClient, self).__init__(api_key, host, members, suppress_warnings=suppress_warnings,
+                                              transport=transport, retry_policy=retry_policy,
+                                              json_backend=json_backend)
+
+    async def list_files(self, dataset_id, glob=".", is_dir=False):
+        """
+        List matched filenames in a dataset on Citrination.
+
+        :param dataset_id: The ID of the dataset to search for files.
+        :type dataset_id: int
+        :param glob: A pattern which will be matched against files in the dataset.
+        :type glob: str
+        :param is_dir: A boolean indicating whether or not the pattern should match against the beginning of paths in the dataset.
+        :type is_dir: bool
+        :return: A list of filepaths in the dataset matching the provided glob.
+        :rtype: list of strings
+        """
+        failure_message = "Failed to list files for dataset {}".format(dataset_id)
+        response = await self._post_json(routes.list_files(dataset_id), _list_files_body(glob, is_dir),
+                                         failure_message=failure_message)
+        return self._get_success_json(response)['files']
+
+    async def matched_file_count(self, dataset_id, glob=".", is_dir=False):
+        """
+        Returns the number of files matching a pattern in a dataset.
+
+        :param dataset_id: The ID of the dataset to search for files.
+        :type dataset_id: int
+        :param glob: A pattern which will be matched against files in the dataset.
+        :type glob: str
+        :param is_dir: A boolean indicating whether or not the pattern should match against the beginning of paths in the dataset.
+        :type is_dir: bool
+        :return: The number of matching files
+        :rtype: int
+        """
+        return len(await self.list_files(dataset_id, glob, is_dir))
+
+    async def get_dataset_files(self, dataset_id, glob=".", is_dir=False, version_number=None):
+        """
+        Retrieves URLs for the files matched by a glob or a path to a directory
+        in a given dataset.
+
+        :param dataset_id: The id of the dataset to retrieve files from
+        :type dataset_id: int
+        :param glob: A regex used to select one or more files in the dataset
+        :type glob: str
+        :param is_dir: Whether or not the supplied pattern should be treated as a directory to search in
+        :type is_dir: bool
+        :param version_number: The version number of the dataset to retrieve files from
+        :type version_number: int
+        :return: A list of dataset files whose paths match the provided pattern.
+        :rtype: list of :class:`DatasetFile`
+        """
+        failure_message = "Failed to get matched files in dataset {}".format(dataset_id)
+        response = await self._post_json(routes.matched_files(dataset_id),
+                                         _matched_files_body(glob, is_dir, version_number),
+                                         failure_message=failure_message)
+        return _dataset_files_from_versions(self._get_success_json(response)['versions'], version_number)
+
+    async def get_dataset_file(self, dataset_id, file_path, version=None):
+        """
+        Retrieves a dataset file matching a provided file path
+
+        :param dataset_id: The id of the dataset to retrieve file from
+        :type dataset_id: int
+        :param file_path: The file path within the dataset
+        :type file_path: str
+        :param version: The dataset version to look for the file in. If nothing is supplied, the latest dataset version will be searched
+        :type version: int
+        :return: A dataset file matching the filepath provided
+        :rtype: :class:`DatasetFile`
+        """
+        return (await self.get_dataset_files(dataset_id, "^{}$".format(file_path), version_number=version))[0]
+
+    async def get_pif(self, dataset_id, uid, dataset_version=None):
+        """
+        Retrieves a PIF from a given dataset.
+
+        :param dataset_id: The id of the dataset to retrieve PIF from
+        :type dataset_id: int
+        :param uid: The uid of the PIF to retrieve
+        :type uid: str
+        :param dataset_version: The dataset version to look for the PIF in. If nothing is supplied, the latest dataset version will be searched
+        :type dataset_version: int
+        :return: A :class:`Pif` object
+        :rtype: :class:`Pif`
+        """
+        failure_message = "An error occurred retrieving PIF {}".format(uid)
+        if dataset_version == None:
+            route = routes.pif_dataset_uid(dataset_id, uid)
+        else:
+            route = routes.pif_dataset_version_uid(dataset_id, dataset_version, uid)
+        response = await self._get(route, failure_message=failure_message)
+
+        return pif.loads(response.content.decode("utf-8"))
+
+    async def create_dataset(self, name=None, description=None, public=False):
+        """
+        Create a new data set.
+
+        :param name: name of the dataset
+        :type name: str
+        :param description: description for the dataset
+        :type description: str
+        :param public: A boolean indicating whether or not the dataset should be public.
+        :type public: bool
+        :return: The newly created dataset.
+        :rtype: :class:`Dataset`
+        """
+        response = await self._post_json(routes.create_dataset(), _dataset_body(name, description, public),
+                                         failure_message="Unable to create dataset")
+        return _dataset_from_response_dict(self._get_success_json(response))
+
+    async def update_dataset(self, dataset_id, name=None, description=None, public=None):
+        """
+        Update a data set.
+
+        :param dataset_id: The ID of the dataset to update
+        :type dataset_id: int
+        :param name: name of the dataset
+        :type name: str
+        :param description: description for the dataset
+        :type description: str
+        :param public: A boolean indicating whether or not the dataset should
+            be public.
+        :type public: bool
+        :return: The updated dataset.
+        :rtype: :class:`Dataset`
+        """
+        failure_message = "Failed to update dataset {}".format(dataset_id)
+        response = await self._post_json(routes.update_dataset(dataset_id), _dataset_body(name, description, public),
+                                         failure_message=failure_message)
+        return _dataset_from_response_dict(self._get_success_json(response))
+
+    async def create_dataset_version(self, dataset_id):
+        """
+        Create a new data set version.
+
+        :param dataset_id: The ID of the dataset for which the version must be bumped.
+        :type dataset_id: int
+        :return: The new dataset version.
+        :rtype: :class:`DatasetVersion`
+        """
+        failure_message = "Failed to create dataset version for dataset {}".format(dataset_id)
+        response = await self._post_json(routes.create_dataset_version(dataset_id), {},
+                                         failure_message=failure_message)
+        return DatasetVersion(number=self._get_success_json(response)['dataset_scoped_id'])
@@ -0,0 +1,241 @@
+from citrination_client.aio.base_client import AsyncBaseClient
+from citrination_client.models import PredictionTable
+from citrination_client.models import routes as routes
+from citrination_client.models.client import DEFAULT_PREDICT_CHUNK_SIZE, \
+    _get_predict_body, _predict_chunks, _check_prediction_count, _get_prediction_result_from_candidate, \
+    _tsne_from_analysis, _design_run_body, _process_status_from_response, _design_results_from_response, \
+    _data_view_from_response, _data_view_status_from_response
+from citrination_client.models.design import DesignRun
+
+import asyncio
+
+
+class AsyncModelsClient(AsyncBaseClient):
+    """
+    An asynchronous client for models on Citrination, mirroring
+    :class:`ModelsClient`.
+    """
+
+    def __init__(self, api_key, webserver_host="https://citrination.com", suppress_warnings=False, transport=None,
+                 retry_policy=None, json_backend=None):
+        """
+        Constructor.
+
+        :param api_key: A users API key, as a string
+        :type api_key: str
+        :param webserver_host: The base URL of the citrination site, e.g. https://citrination.com
+        :type webserver_host: str
+        :param suppress_warnings: Whether or not usage warnings should be
+            printed to stdout
+        :type suppress_warnings: bool
+        :param transport: The transport to make requests with
+        :type transport: :class:`AsyncTransport`
+        :param retry_policy: The policy used to retry rate limited and failed
+            requests
+        :type retry_policy: :class:`RetryPolicy`
+        :param json_backend: The backend used to encode request bodies and
+            decode response bodies
+        :type json_backend: :class:`JsonBackend`
+        """
+        members = [
+            "tsne",
+            "predict",
+            "predict_batch",
+            "predict_table"
+        ]
+        super(AsyncModelsClient, self).__init__(api_key, webserver_host, members, suppress_warnings=suppress_warnings,
+                                                transport=transport, retry_policy=retry_policy,
+                                                json_backend=json_backend)
+
+    async def tsne(self, data_view_id):
+        """
+        Get the t-SNE projection, including responses and tags.
+
+        :param data_view_id: The ID of the data view to retrieve TSNE from
+        :type data_view_id: int
+        :return: The TSNE analysis
+        :rtype: :class:`Tsne`
+        """
+        failure_message = "Error while retrieving data analysis for data view {}".format(data_view_id)
+        response = await self._get(routes.data_analysis(data_view_id), failure_message=failure_message)
+        return _tsne_from_analysis(self._get_success_json(response))
+
+    async def predict(self, data_view_id, candidates, method="scalar", use_prior=True):
+        """
+        Predict endpoint
+
+        :param data_view_id: The ID of the data view to use for prediction
+        :type data_view_id: str
+        :param candidates: A list of candidates to make predictions on
+        :type candidates: list of dicts
+        :param method: Method for propagating predictions through model
+            graphs
+        :type method: str ("scalar" or "from_distribution")
+        :param use_prior:  Whether to apply prior values implied by the property descriptors
+        :type use_prior: bool
+        :return: The results of the prediction
+        :rtype: list of :class:`PredictionResult`
+        """
+        candidate_dicts = await self._predict_candidates(data_view_id, candidates, method, use_prior)
+        return [_get_prediction_result_from_candidate(c) for c in candidate_dicts]
+
+    async def predict_batch(self, data_view_id, candidates, method="scalar", use_prior=True,
+                            chunk_size=DEFAULT_PREDICT_CHUNK_SIZE, max_workers=4, max_attempts=3):
+        """
+        Predict endpoint for large sets of candidates. The candidates are split
+        into chunks which are sent concurrently, and a chunk which fails with a
+        transient error is retried on its own.
+
+        :param data_view_id: The ID of the data view to use for prediction
+        :type data_view_id: str
+        :param candidates: A list of candidates to make predictions on
+        :type candidates: list of dicts
+        :param method: Method for propagating predictions through model
+            graphs
+        :type method: str ("scalar" or "from_distribution")
+        :param use_prior:  Whether to apply prior values implied by the property descriptors
+        :type use_prior: bool
+        :param chunk_size: The maximum number of candidates sent per request
+        :type chunk_size: int
+        :param max_workers: The maximum number of requests in flight at once
+        :type max_workers: int
+        :param max_attempts: The number of times a chunk is sent before its
+            error is raised, in place of the retry policy's ``max_attempts``
+        :type max_attempts: int
+        :return: The results of the prediction, in the same order as the
+            candidates
+        :rtype: list of :class:`PredictionResult`
+        """
+        candidate_dicts = await self._predict_candidates_in_chunks(
+            data_view_id, candidates, method, use_prior, chunk_size, max_workers, max_attempts)
+        return [_get_prediction_result_from_candidate(c) for c in candidate_dicts]
+
+    async def predict_table(self, data_view_id, candidates, method="scalar", use_prior=True,
+                            chunk_size=DEFAULT_PREDICT_CHUNK_SIZE, max_workers=4, max_attempts=3):
+        """
+        Predict endpoint which returns the predictions for every candidate as
+        a single table of per-output arrays. Candidates are sent in chunks as
+        with :meth:`predict_batch`.
+
+        :return: The results of the prediction, in the same order as the
+            candidates
+        :rtype: :class:`PredictionTable`
+        """
+        candidate_dicts = await self._predict_candidates_in_chunks(
+            data_view_id, candidates, method, use_prior, chunk_size, max_workers, max_attempts)
+        return PredictionTable.from_candidates(candidate_dicts)
+
+    async def _predict_candidates(self, data_view_id, candidates, method="scalar", use_prior=True,
+                                  retry_policy=None):
+        body = _get_predict_body(candidates, method, use_prior)
+        failure_message = "Error while making prediction for data view {}".format(data_view_id)
+        response = await self._post_json(routes.data_view_predict(data_view_id), data=body,
+                                         failure_message=failure_message, idempotent=True,
+                                         retry_policy=retry_policy)
+        return self._get_success_json(response)["candidates"]
+
+    async def _predict_candidates_in_chunks(self, data_view_id, candidates, method, use_prior,
+                                            chunk_size, max_workers, max_attempts):
+        chunks = _predict_chunks(candidates, method, use_prior, chunk_size, max_workers, max_attempts)
+        retry_policy = self.retry_policy.with_max_attempts(max_attempts)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def predict_chunk(chunk):
+            async with semaphore:
+                candidate_dicts = await self._predict_candidates(data_view_id, chunk, method, use_prior,
+                                                                 retry_policy)
+            return _check_prediction_count(data_view_id, chunk, candidate_dicts)
+
+        chunk_results = await asyncio.gather(*[predict_chunk(chunk) for chunk in chunks])
+        return [c for chunk_result in chunk_results for c in chunk_result]
+
+    async def submit_design_run(self, data_view_id, num_candidates, effort, target=None, constraints=[],
+                                sampler="Default"):
+        """
+        Submits a new experimental design run
+
+        :param data_view_id: The ID number of the data view to which the
+            run belongs, as a string
+        :type data_view_id: str
+        :param num_candidates: The number of candidates to return
+        :type num_candidates: int
+        :param target: An :class:``Target`` instance representing
+            the design run optimization target
+        :type target: :class:``Target``
+        :param constraints: An array of design constraints (instances of
+            objects which extend :class:``BaseConstraint``)
+        :type constraints: list of :class:``BaseConstraint``
+        :param sampler: The name of the sampler to use during the design run:
+            either "Default" or "This view"
+        :type sampler: str
+        :return: A :class:`DesignRun` instance containing the UID of the
+            new run
+        """
+        body = _design_run_body(num_candidates, effort, target, constraints, sampler)
+        response = await self._post_json(routes.submit_data_view_design(data_view_id), body)
+        return DesignRun(self._get_success_json(response)["data"]["design_run"]["uid"])
+
+    async def get_design_run_status(self, data_view_id, run_uuid):
+        """
+        Retrieves the status of an in progress or completed design run
+
+        :param data_view_id: The ID number of the data view to which the
+            run belongs, as a string
+        :type data_view_id: str
+        :param run_uuid: The UUID of the design run to retrieve status for
+        :type run_uuid: str
+        :return: A :class:`ProcessStatus` object
+        """
+        response = await self._get(routes.get_data_view_design_status(data_view_id, run_uuid))
+        return _process_status_from_response(self._get_success_json(response))
+
+    async def get_design_run_results(self, data_view_id, run_uuid):
+        """
+        Retrieves the results of an existing designrun
+
+        :param data_view_id: The ID number of the data view to which the
+            run belongs, as a string
+        :type data_view_id: str
+        :param run_uuid: The UUID of the design run to retrieve results from
+        :type run_uuid: str
+        :return: A :class:`DesignResults` object
+        """
+        response = await self._get(routes.get_data_view_design_results(data_view_id, run_uuid))
+        return _design_results_from_response(self._get_success_json(response))
+
+    async def get_data_view(self, data_view_id):
+        """
+        Retrieves a summary of information for a given data view
+
+        :param data_view_id: The ID number of the data view, as a string
+        :type data_view_id: str
+        :rtype: :class:`DataView`
+        """
+        response = await self._get(routes.get_data_view(data_view_id))
+        return _data_view_from_response(data_view_id, self._get_success_json(response))
+
+    async def kill_design_run(self, data_view_id, run_uuid):
+        """
+        Kills an in progress experimental design run
+
+        :param data_view_id: The ID number of the data view to which the
+            run belongs, as a string
+        :type data_view_id: str
+        :param run_uuid: The UUID of the design run to kill
+        :type run_uuid: str
+        :return: The UUID of the design run
+        """
+        response = await self._delete(routes.kill_data_view_design_run(data_view_id, run_uuid))
+        return self._get_success_json(response)["data"]["uid"]
+
+    async def get_data_view_service_status(self, data_view_id):
+        """
+        Retrieves the status for all of the services associated with a data view
+
+        :param data_view_id: The ID number of the data view, as a string
+        :type data_view_id: str
+        :return: A :class:`DataViewStatus`
+        :rtype: DataViewStatus
+        """
+        response = await self._get(routes.get_data_view_status(data_view_id))
+        return _data_view_status_from_response(self._get_success_json(response))
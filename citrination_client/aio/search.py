@@ -0,0 +1,239 @@
+from citrination_client.aio.base_client import AsyncBaseClient
+from citrination_client.search import PifSearchResult, DatasetSearchResult, PifMultiSearchResult, ExtractedColumns
+from citrination_client.search import routes as routes
+from citrination_client.search.client import DEFAULT_FAILURE_MESSAGE, _validate_search_query, _search_bounds, \
+    _search_route, _return_system_override
+from citrination_client.search.compiled_query import CompiledQuery
+from citrination_client.search.query_encoder import encode_query
+from citrination_client.search.result_decoder import decode_search_result, decode_pif_multi_search_result
+from citrination_client.base.errors import CitrinationClientError, RequestTimeoutException
+
+
+from collections import deque
+import asyncio
+
+
+class AsyncSearchClient(AsyncBaseClient):
+    """
+    An asynchronous client for searching Citrination, mirroring
+    :class:`SearchClient`.
+    """
+
+    def __init__(self, api_key, webserver_host="https://citrination.com", suppress_warnings=False, transport=None,
+                 retry_policy=None, json_backend=None):
+        members = [
+            "pif_search",
+            "iter_pif_search",
+            "pif_search_columns",
+            "pif_multi_search",
+            "dataset_search",
+            "iter_dataset_search"
+        ]
+        super(AsyncSearchClient, self).__init__(api_key, webserver_host, members, suppress_warnings=suppress_warnings,
+                                                transport=transport, retry_policy=retry_policy,
+                                                json_backend=json_backend)
+
+    def _handle_response(self, response, failure_message=DEFAULT_FAILURE_MESSAGE):
+        if response.status_code == 204:
+            raise RequestTimeoutException()
+
+        return super(AsyncSearchClient, self)._handle_response(response, failure_message)
+
+    async def pif_search(self, pif_system_returning_query, parallelism=1, include_system=True):
+        """
+        Run a PIF query against Citrination.
+
+        :param pif_system_returning_query: The PIF system query to execute.
+        :type pif_system_returning_query: :class:`PifSystemReturningQuery`
+        :param parallelism: The number of result pages to fetch concurrently
+            once the total number of hits is known
+        :type parallelism: int
+        :param include_system: Whether the matched PIF systems should be
+            returned
+        :type include_system: bool
+        :return: :class:`PifSearchResult` object with the results of the query.
+        :rtype: :class:`PifSearchResult`
+        """
+        _validate_search_query(pif_system_returning_query)
+        return await self._execute_search_query(
+            pif_system_returning_query,
+            PifSearchResult,
+            parallelism=parallelism,
+            return_system=_return_system_override(include_system)
+        )
+
+    async def pif_search_columns(self, pif_system_returning_query, include_paths=False, parallelism=1):
+        """
+        Run a PIF query against Citrination and collect the extracted values
+        of every hit into one typed column per extracted key.
+
+        :param pif_system_returning_query: The PIF system query to execute.
+        :type pif_system_returning_query: :class:`PifSystemReturningQuery`
+        :param include_paths: Whether to also collect the extracted paths
+        :type include_paths: bool
+        :param parallelism: The number of result pages to fetch concurrently
+            once the total number of hits is known
+        :type parallelism: int
+        :return: The extracted values, by column
+        :rtype: :class:`ExtractedColumns`
+        """
+        columns = ExtractedColumns(include_paths=include_paths)
+        async for hit in self.iter_pif_search(
+                pif_system_returning_query, parallelism=parallelism, include_system=False):
+            columns.add_hit(hit)
+        return columns
+
+    async def dataset_search(self, dataset_returning_query, parallelism=1):
+        """
+        Run a dataset query against Citrination.
+
+        :param dataset_returning_query: :class:`DatasetReturningQuery` to execute.
+        :type dataset_returning_query: :class:`DatasetReturningQuery`
+        :param parallelism: The number of result pages to fetch concurrently
+            once the total number of hits is known
+        :type parallelism: int
+        :return: Dataset search result object with the results of the query.
+        :rtype: :class:`DatasetSearchResult`
+        """
+        _validate_search_query(dataset_returning_query)
+        return await self._execute_search_query(
+            dataset_returning_query,
+            DatasetSearchResult,
+            parallelism=parallelism
+        )
+
+    def iter_pif_search(self, pif_system_returning_query, parallelism=1, include_system=True):
+        """
+        Run a PIF query against Citrination, yielding hits page by page as
+        they arrive. Use with ``async for``.
+
+        :param pif_system_returning_query: The PIF system query to execute.
+        :type pif_system_returning_query: :class:`PifSystemReturningQuery`
+        :param parallelism: The number of result pages to fetch concurrently
+            once the total number of hits is known
+        :type parallelism: int
+        :param include_system: Whether the matched PIF systems should be
+            returned
+        :type include_system: bool
+        :return: An asynchronous generator of the hits matching the query.
+        :rtype: async generator of :class:`PifSearchHit`
+        """
+        _validate_search_query(pif_system_returning_query)
+        return self._iter_search_hits(
+            pif_system_returning_query,
+            PifSearchResult,
+            parallelism=parallelism,
+            return_system=_return_system_override(include_system)
+        )
+
+    def iter_dataset_search(self, dataset_returning_query, parallelism=1):
+        """
+        Run a dataset query against Citrination, yielding hits page by page
+        as they arrive. Use with ``async for``.
+
+        :param dataset_returning_query: :class:`DatasetReturningQuery` to execute.
+        :type dataset_returning_query: :class:`DatasetReturningQuery`
+        :param parallelism: The number of result pages to fetch concurrently
+            once the total number of hits is known
+        :type parallelism: int
+        :return: An asynchronous generator of the hits matching the query.
+        :rtype: async generator of :class:`DatasetSearchHit`
+        """
+        _validate_search_query(dataset_returning_query)
+        return self._iter_search_hits(
+            dataset_returning_query,
+            DatasetSearchResult,
+            parallelism=parallelism
+        )
+
+    async def pif_multi_search(self, multi_query):
+        """
+        Run each in a list of PIF queries against Citrination.
+
+        :param multi_query: :class:`MultiQuery` object to execute.
+        :return: :class:`PifMultiSearchResult` object with the results of the query.
+        """
+        failure_message = "Error while making PIF multi search request"
+        response = await self._post(routes.pif_multi_search, data=encode_query(multi_query, self.json_backend),
+                                    failure_message=failure_message, idempotent=True)
+
+        return decode_pif_multi_search_result(self._get_success_json(response)['results'])
+
+    async def _execute_search_query(self, returning_query, result_class, parallelism=1, return_system=None):
+        time = 0.0
+        hits = []
+        total = None
+        async for partial_results in self._iter_search_pages(returning_query, result_class, parallelism,
+                                                             return_system):
+            total = partial_results.total_num_hits
+            time += partial_results.took or 0.0
+            if partial_results.hits is not None:
+                hits.extend(partial_results.hits)
+
+        return result_class(hits=hits, total_num_hits=total, took=time)
+
+    async def _iter_search_hits(self, returning_query, result_class, parallelism=1, return_system=None):
+        async for partial_results in self._iter_search_pages(returning_query, result_class, parallelism,
+                                                             return_system):
+            for hit in partial_results.hits or []:
+                yield hit
+
+    async def _iter_search_pages(self, returning_query, result_class, parallelism=1, return_system=None):
+        """
+        Asynchronous generator over the pages of results for a query, in order.
+
+        :param returning_query: :class:`BaseReturningQuery` to execute.
+        :param result_class: The class of each page of results.
+        :param parallelism: The number of pages to request concurrently.
+        :param return_system: If not None, overrides the return_system flag
+            of the query.
+        :return: An asynchronous generator of ``result_class`` objects, one per page.
+        """
+        if parallelism < 1:
+            raise CitrinationClientError("parallelism must be at least 1")
+
+        from_index, size = _search_bounds(returning_query)
+
+        if size != returning_query.size:
+            self._warn("Query size greater than max system size - only {} results will be returned".format(size))
+
+        compiled_query = CompiledQuery(returning_query, return_system=return_system,
+                                       json_backend=self.json_backend)
+
+        first_results = await self._search_compiled(compiled_query, result_class, from_index, compiled_query.size)
+        yield first_results
+
+        total = first_results.total_num_hits
+        page_size = len(first_results.hits or [])
+        end_index = min(from_index + size, total)
+        if page_size == 0 or from_index + page_size >= end_index:
+            return
+
+        def fetch_page(page_from_index):
+            page_size_requested = min(page_size, end_index - page_from_index)
+            return asyncio.ensure_future(
+                self._search_compiled(compiled_query, result_class, page_from_index, page_size_requested))
+
+        # Pages are requested at most ``parallelism`` ahead of the consumer
+        page_indices = iter(range(from_index + page_size, end_index, page_size))
+        pending = deque()
+        try:
+            for page_from_index in page_indices:
+                pending.append(fetch_page(page_from_index))
+                if len(pending) >= parallelism:
+                    break
+            while pending:
+                partial_results = await pending.popleft()
+                for page_from_index in page_indices:
+                    pending.append(fetch_page(page_from_index))
+                    break
+                yield partial_results
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _search_compiled(self, compiled_query, result_class, from_index, size):
+        route, failure_message = _search_route(result_class)
+        response = await self._post(route, data=compiled_query.serialize(from_index, size),
+                                    failure_message=failure_message, idempotent=True)
+        return decode_search_result(self._get_success_json(response)['results'], result_class)
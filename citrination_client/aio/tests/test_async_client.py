@@ -0,0 +1,169 @@
+from citrination_client.aio import AsyncCitrinationClient, AsyncTransport, AsyncResponse
+from citrination_client.base import RetryPolicy
+from citrination_client.base.errors import CitrinationClientError
+from citrination_client.search import PifSystemReturningQuery, PifSearchResult
+import asyncio
+import json
+import pytest
+import requests
+
+site = "mock://citrination"
+
+
+class FakeTransport(AsyncTransport):
+    """
+    A transport which answers requests with callbacks registered per method
+    and URL, recording every request it receives.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.requests = []
+        self.closed = False
+
+    def register(self, method, url, callback):
+        self.handlers[(method, url)] = callback
+
+    async def request(self, method, url, headers=None, data=None):
+        self.requests.append((method, url, data))
+        await asyncio.sleep(0)
+        status_code, body = self.handlers[(method, url)](data)
+        return AsyncResponse(status_code, json.dumps(body).encode("utf-8"), url=url)
+
+    async def close(self):
+        self.closed = True
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def _client(transport, **kwargs):
+    return AsyncCitrinationClient("key", site, transport=transport,
+                                  retry_policy=RetryPolicy(base_delay=0), **kwargs)
+
+
+def _search_handler(total, page_cap=100):
+    def handler(data):
+        body = json.loads(data)
+        from_index = body.get("from") or 0
+        size = body.get("size")
+        if size is None:
+            size = page_cap
+        end_index = min(total, from_index + min(size, page_cap))
+        hits = [{"id": str(i), "extracted": {"index": i}} for i in range(from_index, end_index)]
+        return 200, {"results": {"took": 1, "totalNumHits": total, "hits": hits}}
+    return handler
+
+
+def test_pif_search_collects_every_page():
+    transport = FakeTransport()
+    transport.register("POST", site + "/api/search/pif_search", _search_handler(total=250))
+    client = _client(transport, suppress_warnings=True)
+
+    result = _run(client.pif_search(PifSystemReturningQuery(), parallelism=3))
+
+    assert isinstance(result, PifSearchResult)
+    assert [h.id for h in result.hits] == [str(i) for i in range(250)]
+    assert result.total_num_hits == 250
+    assert len(transport.requests) == 3
+
+
+def test_iter_pif_search_is_an_async_generator():
+    transport = FakeTransport()
+    transport.register("POST", site + "/api/search/pif_search", _search_handler(total=150))
+    client = _client(transport)
+
+    async def collect():
+        return [hit.id async for hit in client.search.iter_pif_search(PifSystemReturningQuery(size=120))]
+
+    assert _run(collect()) == [str(i) for i in range(120)]
+
+
+def test_search_validation_is_eager():
+    client = _client(FakeTransport())
+    with pytest.raises(CitrinationClientError):
+        client.search.iter_pif_search(PifSystemReturningQuery(from_index=-1))
+
+
+def test_concurrent_predictions_on_one_loop():
+    transport = FakeTransport()
+    def predict(data):
+        candidates = json.loads(data)["predictionRequest"]["candidates"]
+        return 200, {"candidates": [{"y": [c["x"] * 2.0, 0.1]} for c in candidates]}
+    transport.register("POST", site + "/api/data_views/42/predict", predict)
+    client = _client(transport)
+
+    async def predict_all():
+        return await asyncio.gather(*[client.predict(42, [{"x": i}]) for i in range(20)])
+
+    results = _run(predict_all())
+    assert [r[0].get_value("y").value for r in results] == [i * 2.0 for i in range(20)]
+
+    table = _run(client.models.predict_table(42, [{"x": i} for i in range(10)], chunk_size=3))
+    assert list(table["y"].values) == [i * 2.0 for i in range(10)]
+
+
+def test_server_errors_are_retried_for_idempotent_requests():
+    transport = FakeTransport()
+    responses = iter([(503, {}), (200, {"files": ["a.json"]})])
+    transport.register("POST", site + "/api/datasets/1/list_filepaths", lambda data: next(responses))
+    client = _client(transport)
+
+    with pytest.raises(CitrinationClientError):
+        _run(client.list_files(1))
+
+    responses = iter([(503, {}), (200, {"data": {"status": _service_status()}})])
+    transport.register("GET", site + "/api/data_views/42/status", lambda data: next(responses))
+    status = _run(client.get_data_view_service_status(42))
+    assert status.predict.ready
+    assert client.models.retry_stats.retries == 1
+
+
+def test_prediction_chunks_are_retried_only_through_the_retry_policy():
+    transport = FakeTransport()
+    transport.register("POST", site + "/api/data_views/42/predict", lambda data: (500, {}))
+    client = _client(transport)
+
+    with pytest.raises(CitrinationClientError):
+        _run(client.models.predict_batch(42, [{"x": 1}], max_attempts=2))
+    assert len(transport.requests) == 2
+    assert client.models.retry_stats.retries == 1
+
+
+def test_connection_errors_are_raised_as_requests_errors():
+    class FailingTransport(FakeTransport):
+        async def request(self, method, url, headers=None, data=None):
+            self.requests.append((method, url, data))
+            raise requests.exceptions.ConnectionError()
+
+    transport = FailingTransport()
+    client = _client(transport)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        _run(client.get_data_view_service_status(42))
+    assert len(transport.requests) == 4
+
+
+def test_context_manager_closes_transport():
+    transport = FakeTransport()
+
+    async def use():
+        async with _client(transport):
+            pass
+
+    _run(use())
+    assert transport.closed
+
+
+def _service_status():
+    ready = {"ready": True, "context": "success", "reason": "Ready"}
+    return {
+        "predict": ready,
+        "experimental_design": ready,
+        "data_reports": ready,
+        "model_reports": ready
+    }
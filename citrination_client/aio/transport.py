@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+import requests
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_TIMEOUT = 300
+
+
+class AsyncResponse(object):
+    """
+    A response from an :class:`AsyncTransport`, with the parts of the
+    ``requests.Response`` interface used by the response handling helpers.
+    """
+
+    def __init__(self, status_code, content=b"", headers=None, url=None):
+        """
+        Constructor.
+
+        :param status_code: The HTTP status code of the response
+        :type status_code: int
+        :param content: The body of the response
+        :type content: bytes
+        :param headers: The headers of the response
+        :type headers: dict
+        :param url: The URL which was requested
+        :type url: str
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.url = url
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncTransport(object):
+    """
+    Sends HTTP requests for an asynchronous client. Subclasses implement
+    :meth:`request`, and should raise ``requests.exceptions.ConnectionError``
+    or ``requests.exceptions.Timeout`` when a request cannot be completed so
+    that connection failures are handled the same way as in the synchronous
+    clients.
+    """
+
+    async def request(self, method, url, headers=None, data=None):
+        """
+        Sends a request.
+
+        :param method: The HTTP method, e.g. "GET"
+        :type method: str
+        :param url: The fully qualified URL to request
+        :type url: str
+        :param headers: The headers to send
+        :type headers: dict
+        :param data: The body of the request
+        :type data: str or bytes
+        :return: The response
+        :rtype: :class:`AsyncResponse`
+        """
+        raise NotImplementedError()
+
+    async def close(self):
+        """
+        Releases any connections held by the transport.
+        """
+        pass
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    A transport backed by an ``aiohttp.ClientSession``, which keeps a pool of
+    connections open across requests. Requires the aiohttp package.
+    """
+
+    def __init__(self, connection_limit=DEFAULT_CONNECTION_LIMIT, timeout=DEFAULT_TIMEOUT, verify_ssl=False):
+        """
+        Constructor.
+
+        :param connection_limit: The maximum number of connections open at once
+        :type connection_limit: int
+        :param timeout: The total number of seconds a request may take
+        :type timeout: float
+        :param verify_ssl: Whether SSL certificates are verified. The
+            synchronous clients do not verify certificates, so neither does
+            this transport by default.
+        :type verify_ssl: bool
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("The aiohttp package is required to use AiohttpTransport")
+        self._aiohttp = aiohttp
+        self._connection_limit = connection_limit
+        self._timeout = timeout
+        self._verify_ssl = verify_ssl
+        self._session = None
+
+    def _get_session(self):
+        # The session is created lazily so that it is bound to the event loop
+        # the requests are made on
+        if self._session is None or self._session.closed:
+            connector = self._aiohttp.TCPConnector(limit=self._connection_limit, ssl=None if self._verify_ssl else False)
+            self._session = self._aiohttp.ClientSession(
+                connector=connector, timeout=self._aiohttp.ClientTimeout(total=self._timeout))
+        return self._session
+
+    async def request(self, method, url, headers=None, data=None):
+        session = self._get_session()
+        try:
+            async with session.request(method, url, headers=headers, data=data) as response:
+                content = await response.read()
+                return AsyncResponse(response.status, content, dict(response.headers), url)
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(str(e))
+        except self._aiohttp.ClientConnectionError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
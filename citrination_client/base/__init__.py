@@ -1,2 +1,24 @@
-from .base_client import BaseClient
-from .errors import *
\ No newline at end of file
+from .errors import *
+from citrination_client.util.lazy import lazy_attributes
+
+# Submodules are attributes of the package too, imported when first accessed
+_submodules = {
+    "base_client": "citrination_client.base.base_client",
+    "errors": "citrination_client.base.errors",
+    "json_backend": "citrination_client.base.json_backend",
+    "response_handling": "citrination_client.base.response_handling",
+    "retry_policy": "citrination_client.base.retry_policy",
+    "session": "citrination_client.base.session"
+}
+
+# Attributes are imported from their modules when first accessed
+lazy_attributes(globals(), {
+    "BaseClient": "citrination_client.base.base_client",
+    "create_session": "citrination_client.base.session",
+    "RetryPolicy": "citrination_client.base.retry_policy",
+    "RetryStats": "citrination_client.base.retry_policy",
+    "JsonBackend": "citrination_client.base.json_backend",
+    "get_json_backend": "citrination_client.base.json_backend"
+}, _submodules)
+
+del lazy_attributes
@@ -1,8 +1,10 @@
 import requests
-import json
 from citrination_client.util.quote_finder import quote
-from citrination_client.base.response_handling import raise_on_response, check_general_success, check_for_rate_limiting, get_response_json
+from citrination_client.base.response_handling import raise_on_response, check_general_success, get_response_json
+from citrination_client.base.retry_policy import RetryPolicy, RetryStats
 from citrination_client.base.errors import *
+from citrination_client.base.session import create_session
+from citrination_client.base.json_backend import default_json_backend
 
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
@@ -15,7 +17,8 @@ class BaseClient(object):
     Base class that holds the universal constructor, utilities, etc
     """
 
-    def __init__(self, api_key, webserver_host, api_members=[], suppress_warnings=False):
+    def __init__(self, api_key, webserver_host, api_members=[], suppress_warnings=False, session=None, retry_policy=None,
+                 json_backend=None):
         """
         Constructor.
 
@@ -28,18 +31,31 @@ class BaseClient(object):
         :param suppress_warnings: A flag indicating whether or not warning
             messages to stdout should be printed
         :type suppress_warnings: bool
+        :param session: The HTTP session used for all requests made by this
+            client. If not supplied, a new pooled session is created.
+        :type session: requests.Session
+        :param retry_policy: The policy used to retry rate limited and failed
+            requests. If not supplied, a default :class:`RetryPolicy` is used.
+        :type retry_policy: :class:`RetryPolicy`
+        :param json_backend: The backend used to encode request bodies and
+            decode response bodies. If not supplied, the standard library's
+            json module is used.
+        :type json_backend: :class:`JsonBackend`
         """
-        if api_key == None or len(api_key) == 0:
-            raise CitrinationClientError("API key must be present to instantiate the client")
-
-        self.headers = {
-            'X-API-Key': quote(api_key),
-            'Content-Type': 'application/json',
-            'X-Citrination-API-Version': '1.0.0'
-        }
+        self.headers = _default_headers(api_key)
         self.suppress_warnings = suppress_warnings
         self.api_url = webserver_host + '/api'
         self.api_members = api_members
+        if session is None:
+            session = create_session()
+        self.session = session
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        if json_backend is None:
+            json_backend = default_json_backend()
+        self.json_backend = json_backend
 
     # ==== Private Utilities ===
 
@@ -49,7 +65,7 @@ class BaseClient(object):
         return response
 
     def _get_success_json(self, response):
-        return get_response_json(response)
+        return get_response_json(response, self.json_backend)
 
     def _get_qualified_route(self, route):
         """
@@ -76,27 +92,31 @@ class BaseClient(object):
         :return:
         """
         headers = self._get_headers(headers)
-        response_lambda = (lambda: requests.get(self._get_qualified_route(route), headers=headers, verify=False))
-        response = check_for_rate_limiting(response_lambda(), response_lambda)
+        response_lambda = (lambda: self.session.get(self._get_qualified_route(route), headers=headers, verify=False))
+        response = self._send(response_lambda, idempotent=True)
         return self._handle_response(response, failure_message)
 
-    def _post_json(self, route, data, headers=None, failure_message=None):
-        return self._post(route, json.dumps(data), headers)
+    def _post_json(self, route, data, headers=None, failure_message=None, idempotent=False, retry_policy=None):
+        return self._post(route, self.json_backend.dumps(data), headers, failure_message, idempotent, retry_policy)
 
-    def _post(self, route, data, headers=None, failure_message=None):
+    def _post(self, route, data, headers=None, failure_message=None, idempotent=False, retry_policy=None):
         """
         Execute a post request and return the result
         :param data:
         :param headers:
+        :param idempotent: whether the request can safely be repeated after
+            a server or connection error
+        :param retry_policy: the policy to retry this request with, in place
+            of the client's
         :return:
         """
         headers = self._get_headers(headers)
-        response_lambda = (lambda: requests.post(self._get_qualified_route(route), headers=headers, data=data, verify=False))
-        response = check_for_rate_limiting(response_lambda(), response_lambda)
+        response_lambda = (lambda: self.session.post(self._get_qualified_route(route), headers=headers, data=data, verify=False))
+        response = self._send(response_lambda, idempotent=idempotent, retry_policy=retry_policy)
         return self._handle_response(response, failure_message)
 
     def _put_json(self, route, data, headers=None, failure_message=None):
-        return self._put(route, json.dumps(data), headers)
+        return self._put(route, self.json_backend.dumps(data), headers)
 
     def _put(self, route, data, headers=None, failure_message=None):
         """
@@ -106,8 +126,8 @@ class BaseClient(object):
         :return:
         """
         headers = self._get_headers(headers)
-        response_lambda = (lambda: requests.put(self._get_qualified_route(route), headers=headers, data=data, verify=False))
-        response = check_for_rate_limiting(response_lambda(), response_lambda)
+        response_lambda = (lambda: self.session.put(self._get_qualified_route(route), headers=headers, data=data, verify=False))
+        response = self._send(response_lambda, idempotent=True)
         return self._handle_response(response, failure_message)
 
     def _delete(self, route, headers=None, failure_message=None):
@@ -117,9 +137,36 @@ class BaseClient(object):
         :return:
         """
         headers = self._get_headers(headers)
-        response_lambda = (lambda: requests.delete(self._get_qualified_route(route), headers=headers, verify=False))
-        response = check_for_rate_limiting(response_lambda(), response_lambda)
+        response_lambda = (lambda: self.session.delete(self._get_qualified_route(route), headers=headers, verify=False))
+        response = self._send(response_lambda, idempotent=True)
         return self._handle_response(response, failure_message)
 
+    def _send(self, response_lambda, idempotent=False, retry_policy=None):
+        """
+        Sends a request, retrying it according to this client's retry policy
+        :param response_lambda: a callable taking no arguments that sends the request
+        :param idempotent: whether the request can safely be repeated after
+            a server or connection error
+        :param retry_policy: the policy to retry this request with, in place
+            of the client's
+        :return: the final response
+        """
+        policy = retry_policy or self.retry_policy
+        return policy.execute(response_lambda, idempotent=idempotent, stats=self.retry_stats)
+
     def __repr__(self):
-        return "{}".format(self.api_members)
\ No newline at end of file
+        return "{}".format(self.api_members)
+
+
+def _default_headers(api_key):
+    """
+    The headers sent with every request to the Citrination API.
+    """
+    if api_key == None or len(api_key) == 0:
+        raise CitrinationClientError("API key must be present to instantiate the client")
+
+    return {
+        'X-API-Key': quote(api_key),
+        'Content-Type': 'application/json',
+        'X-Citrination-API-Version': '1.0.0'
+    }
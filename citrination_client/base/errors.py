@@ -39,3 +39,8 @@ class RateLimitingException(CitrinationClientError):
 
     def __init__(self, message="Rate limit hit, throttle requests", server_response=None):
         super(RateLimitingException, self).__init__(message)
+
+class DesignRunTimeoutException(CitrinationClientError):
+
+    def __init__(self, message="Design run did not finish before the deadline", server_response=None):
+        super(DesignRunTimeoutException, self).__init__(message)
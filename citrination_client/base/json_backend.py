@@ -0,0 +1,188 @@
+"""
+Libraries used to encode request bodies and decode response bodies.
+
+Each client uses a :class:`JsonBackend`, chosen when it is constructed. By
+default the standard library is used. Faster libraries are opt-in, since
+they do not all encode values such as ``NaN`` the way the standard library
+does.
+"""
+import json
+
+# Backend names, in order of preference
+BACKEND_NAMES = ["orjson", "ujson", "simplejson", "json"]
+
+
+class JsonBackend(object):
+    """
+    Encodes and decodes JSON with the standard library. Subclasses using a
+    faster library fall back to the standard library for anything their
+    library cannot handle, so the choice of backend never changes what can
+    be sent or received.
+    """
+
+    name = "json"
+
+    def dumps(self, obj, default=None):
+        """
+        Encodes an object as JSON.
+
+        :param obj: The object to encode
+        :param default: Called with any object which cannot be encoded, to
+            return an encodable version of it
+        :type default: function
+        :return: The UTF-8 encoded document
+        :rtype: bytes
+        """
+        encoded = json.dumps(obj, default=default)
+        return encoded if isinstance(encoded, bytes) else encoded.encode("utf-8")
+
+    def loads(self, data):
+        """
+        Decodes a JSON document.
+
+        :param data: The UTF-8 encoded document
+        :type data: bytes or str
+        :return: The decoded document
+        """
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+
+class _FastJsonBackend(JsonBackend):
+    """
+    A backend using a faster library, falling back to the standard library
+    when that library rejects an object or document.
+    """
+
+    def dumps(self, obj, default=None):
+        try:
+            return self._dumps(obj, default)
+        except (TypeError, ValueError, OverflowError):
+            return super(_FastJsonBackend, self).dumps(obj, default)
+
+    def loads(self, data):
+        try:
+            return self._loads(data)
+        except ValueError:
+            return super(_FastJsonBackend, self).loads(data)
+
+
+class OrjsonBackend(_FastJsonBackend):
+    """
+    Encodes and decodes JSON with orjson, which encodes straight to bytes.
+    Unlike the standard library, orjson encodes ``NaN`` and infinite floats
+    as ``null``.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps(self, obj, default):
+        return self._orjson.dumps(obj, default=default, option=self._options)
+
+    def _loads(self, data):
+        return self._orjson.loads(data)
+
+
+class UjsonBackend(_FastJsonBackend):
+    """
+    Encodes and decodes JSON with ujson.
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def _dumps(self, obj, default):
+        if default is None:
+            encoded = self._ujson.dumps(obj)
+        else:
+            encoded = self._ujson.dumps(obj, default=default)
+        return encoded.encode("utf-8")
+
+    def _loads(self, data):
+        return self._ujson.loads(data)
+
+
+class SimplejsonBackend(_FastJsonBackend):
+    """
+    Encodes and decodes JSON with simplejson.
+    """
+
+    name = "simplejson"
+
+    def __init__(self):
+        import simplejson
+        self._simplejson = simplejson
+
+    def _dumps(self, obj, default):
+        encoded = self._simplejson.dumps(obj, default=default)
+        return encoded if isinstance(encoded, bytes) else encoded.encode("utf-8")
+
+    def _loads(self, data):
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return self._simplejson.loads(data)
+
+
+_BACKEND_CLASSES = {
+    "orjson": OrjsonBackend,
+    "ujson": UjsonBackend,
+    "simplejson": SimplejsonBackend,
+    "json": JsonBackend
+}
+
+_default_backend = None
+
+
+def get_json_backend(name=None):
+    """
+    Creates a JSON backend.
+
+    :param name: The name of the library to use, one of "orjson", "ujson",
+        "simplejson" or "json". If None, the fastest installed library is
+        used, in the order orjson, ujson, simplejson and the standard library.
+    :type name: str
+    :return: The backend
+    :rtype: :class:`JsonBackend`
+    """
+    if name is not None:
+        if name not in _BACKEND_CLASSES:
+            raise ValueError("Unknown JSON backend {}, expected one of {}".format(name, ", ".join(BACKEND_NAMES)))
+        return _BACKEND_CLASSES[name]()
+    for backend_name in BACKEND_NAMES:
+        try:
+            return _BACKEND_CLASSES[backend_name]()
+        except ImportError:
+            pass
+
+
+def default_json_backend():
+    """
+    The backend used by clients which are not given one, using the standard
+    library.
+
+    :rtype: :class:`JsonBackend`
+    """
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = JsonBackend()
+    return _default_backend
+
+
+def loads(data):
+    """
+    Decodes a JSON document with the default backend.
+
+    :param data: The UTF-8 encoded document
+    :type data: bytes or str
+    :return: The decoded document
+    """
+    return default_json_backend().loads(data)
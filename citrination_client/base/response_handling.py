@@ -1,30 +1,27 @@
 from citrination_client.base.errors import *
-from time import sleep
+from citrination_client.base.retry_policy import RetryPolicy
+from citrination_client.base.json_backend import default_json_backend
 
-def check_for_rate_limiting(response, response_lambda, timeout=1, attempts=0):
+def check_for_rate_limiting(response, response_lambda, retry_policy=None, retry_stats=None):
     """
-    Takes an initial response, and a way to repeat the request that produced it and retries the request with an increasing sleep period between requests if rate limiting resposne codes are encountered.
+    Takes an initial response, and a way to repeat the request that produced it and retries the request with a backoff between requests if rate limiting response codes are encountered.
 
-    If more than 3 attempts are made, a RateLimitingException is raised
+    If the request is still rate limited once the retry policy's attempts are exhausted, a RateLimitingException is raised
 
     :param response: A response from Citrination
     :type response: requests.Response
-    :param response_lambda: a callable that runs the request that returned the
-        response
+    :param response_lambda: a callable taking no arguments that runs the
+        request that returned the response
     :type response_lambda: function
-    :param timeout: the time to wait before retrying
-    :type timeout: int
-    :param attempts: the number of the retry being executed
-    :type attempts: int
+    :param retry_policy: the policy deciding how often and how long to wait
+        before retrying. Defaults to a :class:`RetryPolicy` with four attempts.
+    :type retry_policy: :class:`RetryPolicy`
+    :param retry_stats: counters to record retries in
+    :type retry_stats: :class:`RetryStats`
     """
-    if attempts >= 3:
-        raise RateLimitingException()
-    if response.status_code == 429:
-        sleep(timeout)
-        new_timeout = timeout + 1
-        new_attempts = attempts + 1
-        return check_for_rate_limiting(response_lambda(timeout, attempts), response_lambda, timeout=new_timeout, attempts=new_attempts)
-    return response
+    if retry_policy is None:
+        retry_policy = RetryPolicy()
+    return retry_policy.retry(response, response_lambda, stats=retry_stats)
 
 def check_general_success(response, failure_message):
     if response.status_code >= 400:
@@ -33,8 +30,19 @@ def check_general_success(response, failure_message):
         )
     return response
 
-def get_response_json(response):
-    return response.json()
+def get_response_json(response, json_backend=None):
+    """
+    Decodes the JSON body of a response.
+
+    :param response: A response from Citrination
+    :param json_backend: The backend used to decode the body. If not
+        supplied, the default backend is used.
+    :type json_backend: :class:`JsonBackend`
+    :return: The decoded body
+    """
+    if json_backend is None:
+        json_backend = default_json_backend()
+    return json_backend.loads(response.content)
 
 def raise_on_response(response):
     _check_response_for_version_mismatch(response)
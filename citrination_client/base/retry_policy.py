@@ -0,0 +1,325 @@
+from citrination_client.base.errors import RateLimitingException
+
+from email.utils import parsedate_tz, mktime_tz
+
+import copy
+import random
+import requests
+import threading
+import time
+
+RATE_LIMITED_STATUS = 429
+
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout
+)
+
+
+class RetryStats(object):
+    """
+    Thread safe counters describing the retries made by a client.
+    """
+
+    COUNTERS = ("requests", "retries", "rate_limited", "server_errors", "connection_errors", "exhausted")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def increment(self, counter):
+        """
+        Adds one to a counter.
+
+        :param counter: The name of the counter, one of ``COUNTERS``
+        :type counter: str
+        """
+        with self._lock:
+            self._counts[counter] += 1
+
+    def reset(self):
+        """
+        Sets every counter back to zero.
+        """
+        with self._lock:
+            self._counts = dict((c, 0) for c in self.COUNTERS)
+
+    def as_dict(self):
+        """
+        :return: The current value of every counter
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def _get(self, counter):
+        with self._lock:
+            return self._counts[counter]
+
+    @property
+    def requests(self):
+        return self._get("requests")
+
+    @property
+    def retries(self):
+        return self._get("retries")
+
+    @property
+    def rate_limited(self):
+        return self._get("rate_limited")
+
+    @property
+    def server_errors(self):
+        return self._get("server_errors")
+
+    @property
+    def connection_errors(self):
+        return self._get("connection_errors")
+
+    @property
+    def exhausted(self):
+        return self._get("exhausted")
+
+    def __repr__(self):
+        return "RetryStats({})".format(self.as_dict())
+
+
+class RetryPolicy(object):
+    """
+    Decides whether and when a request to Citrination is retried.
+
+    Rate limited responses (429) are always retried. Server errors (5xx,
+    including the 524 timeout) and connection errors are only retried for
+    idempotent requests. The delay before each retry is drawn uniformly from
+    zero up to a capped exponential backoff ("full jitter"), so that many
+    workers which are throttled together do not retry in lockstep. A
+    ``Retry-After`` header on the response takes precedence over the backoff.
+    """
+
+    def __init__(self, max_attempts=4, base_delay=1.0, max_delay=30.0, jitter=True,
+                 retry_server_errors=True, respect_retry_after=True, sleep=time.sleep):
+        """
+        Constructor.
+
+        :param max_attempts: The maximum number of times a request is sent,
+            including the first
+        :type max_attempts: int
+        :param base_delay: The backoff before the first retry, in seconds
+        :type base_delay: float
+        :param max_delay: The largest delay between attempts, in seconds
+        :type max_delay: float
+        :param jitter: Whether delays are drawn at random from zero up to the
+            exponential backoff, rather than being the backoff itself
+        :type jitter: bool
+        :param retry_server_errors: Whether server errors are retried for
+            idempotent requests
+        :type retry_server_errors: bool
+        :param respect_retry_after: Whether the ``Retry-After`` header of a
+            response is used as the delay before retrying it
+        :type respect_retry_after: bool
+        :param sleep: The function used to wait between attempts
+        :type sleep: function
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_server_errors = retry_server_errors
+        self.respect_retry_after = respect_retry_after
+        self.sleep = sleep
+
+    def with_max_attempts(self, max_attempts):
+        """
+        A copy of the policy which sends each request at most
+        ``max_attempts`` times.
+
+        :param max_attempts: The maximum number of times a request is sent,
+            including the first
+        :type max_attempts: int
+        :rtype: :class:`RetryPolicy`
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        policy = copy.copy(self)
+        policy.max_attempts = max_attempts
+        return policy
+
+    def backoff(self, attempt):
+        """
+        The delay before retrying a request which has failed ``attempt`` times.
+
+        :param attempt: The number of attempts made so far
+        :type attempt: int
+        :return: The delay, in seconds
+        :rtype: float
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        if self.jitter:
+            return random.uniform(0, ceiling)
+        return ceiling
+
+    def delay(self, attempt, response=None):
+        """
+        The delay before retrying a response, honoring its ``Retry-After``
+        header if it has one. Delays never exceed ``max_delay``.
+
+        :param attempt: The number of attempts made so far
+        :type attempt: int
+        :param response: The response being retried
+        :type response: requests.Response
+        :return: The delay, in seconds
+        :rtype: float
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(response)
+            if retry_after is not None:
+                return min(self.max_delay, retry_after)
+        return self.backoff(attempt)
+
+    def should_retry(self, response, idempotent=False):
+        """
+        Whether a response warrants another attempt.
+
+        :param response: The response to a request
+        :type response: requests.Response
+        :param idempotent: Whether the request is safe to repeat
+        :type idempotent: bool
+        :rtype: bool
+        """
+        if response.status_code == RATE_LIMITED_STATUS:
+            return True
+        return idempotent and self.retry_server_errors and response.status_code >= 500
+
+    def after_attempt(self, attempt, response=None, idempotent=False, stats=None):
+        """
+        Records an attempt at sending a request and decides whether it is
+        retried. Callers which send requests themselves, rather than through
+        :meth:`execute`, call this after every attempt and wait for the
+        returned delay before the next one.
+
+        :param attempt: The number of attempts made so far, including this one
+        :type attempt: int
+        :param response: The response to the attempt, or None if it failed
+            with a connection error
+        :type response: requests.Response
+        :param idempotent: Whether the request is safe to repeat
+        :type idempotent: bool
+        :param stats: Counters to record the attempt in
+        :type stats: :class:`RetryStats`
+        :return: The delay before the next attempt, in seconds, or None if
+            the request is not retried, in which case the caller returns the
+            response or raises the connection error
+        :rtype: float
+        :raises RateLimitingException: If the request is still rate limited
+            after ``max_attempts`` attempts
+        """
+        _record(stats, "requests")
+        if response is None:
+            _record(stats, "connection_errors")
+            if not idempotent or attempt >= self.max_attempts:
+                _record(stats, "exhausted")
+                return None
+            _record(stats, "retries")
+            return self.backoff(attempt)
+
+        if not self.should_retry(response, idempotent):
+            return None
+
+        if response.status_code == RATE_LIMITED_STATUS:
+            _record(stats, "rate_limited")
+        else:
+            _record(stats, "server_errors")
+
+        if attempt >= self.max_attempts:
+            _record(stats, "exhausted")
+            if response.status_code == RATE_LIMITED_STATUS:
+                raise RateLimitingException()
+            return None
+
+        _record(stats, "retries")
+        return self.delay(attempt, response)
+
+    def execute(self, request, idempotent=False, stats=None):
+        """
+        Sends a request, retrying it according to the policy.
+
+        :param request: A callable taking no arguments which sends the request
+            and returns its response
+        :type request: function
+        :param idempotent: Whether the request is safe to repeat
+        :type idempotent: bool
+        :param stats: Counters to record the retries in
+        :type stats: :class:`RetryStats`
+        :return: The final response
+        :rtype: requests.Response
+        """
+        return self.retry(None, request, idempotent=idempotent, stats=stats)
+
+    def retry(self, response, request, idempotent=False, stats=None):
+        """
+        Retries a request which has already been sent once, if its response
+        warrants it.
+
+        If the request is still rate limited after ``max_attempts`` attempts,
+        a :class:`RateLimitingException` is raised. For other errors, the
+        final response is returned for the caller to handle.
+
+        :param response: The response to the first attempt, or None if the
+            request has not been sent yet
+        :type response: requests.Response
+        :param request: A callable taking no arguments which sends the request
+            and returns its response
+        :type request: function
+        :param idempotent: Whether the request is safe to repeat
+        :type idempotent: bool
+        :param stats: Counters to record the retries in
+        :type stats: :class:`RetryStats`
+        :return: The final response
+        :rtype: requests.Response
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            if response is None:
+                try:
+                    response = request()
+                except RETRYABLE_EXCEPTIONS:
+                    delay = self.after_attempt(attempt, None, idempotent, stats)
+                    if delay is None:
+                        raise
+                    self.sleep(delay)
+                    continue
+
+            delay = self.after_attempt(attempt, response, idempotent, stats)
+            if delay is None:
+                return response
+            self.sleep(delay)
+            response = None
+
+
+def _record(stats, counter):
+    if stats is not None:
+        stats.increment(counter)
+
+
+def _parse_retry_after(response):
+    """
+    Reads the ``Retry-After`` header of a response, which may be either a
+    number of seconds or an HTTP date.
+
+    :return: The number of seconds to wait, or None if there is no valid header
+    :rtype: float
+    """
+    value = response.headers.get("Retry-After") if response.headers is not None else None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(0.0, mktime_tz(parsed) - time.time())
@@ -0,0 +1,31 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+def create_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False, keep_alive=True):
+    """
+    Builds a requests session with a pooled connection adapter mounted for
+    both http and https. Clients that share a session reuse warm connections
+    instead of performing a new TCP/TLS handshake for every request.
+
+    :param pool_connections: The number of per-host connection pools to cache
+    :type pool_connections: int
+    :param pool_maxsize: The maximum number of connections kept alive per host
+    :type pool_maxsize: int
+    :param pool_block: Whether requests should block when every connection in
+        a host's pool is in use, rather than opening a throwaway connection
+    :type pool_block: bool
+    :param keep_alive: Whether connections should be kept open between requests
+    :type keep_alive: bool
+    :return: A configured session
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
@@ -1,5 +1,9 @@
-from citrination_client.base import BaseClient
+from citrination_client.base import BaseClient, RetryPolicy, create_session
 from citrination_client.base.errors import CitrinationClientError
+from citrination_client.base.session import DEFAULT_POOL_MAXSIZE
+from citrination_client.client import CitrinationClient
+import requests
+import requests_mock
 
 def test_none_api_key():
   """
@@ -21,4 +25,66 @@ def test_zero_length_api_key():
     client = BaseClient("", "mycitrinationsite")
     assert False
   except CitrinationClientError:
-    assert True
\ No newline at end of file
+    assert True
+
+def test_requests_use_client_session():
+  """
+  Tests that requests are routed through the session the client was
+  constructed with
+  """
+  session = requests.Session()
+  client = BaseClient("key", "mock://mycitrinationsite", session=session)
+  assert client.session is session
+  with requests_mock.mock() as m:
+    m.get("mock://mycitrinationsite/api/thing", json={})
+    client._get("thing")
+    assert m.call_count == 1
+
+def test_default_session_is_pooled():
+  """
+  Tests that a client builds its own pooled session when none is supplied
+  """
+  client = BaseClient("key", "mycitrinationsite")
+  adapter = client.session.get_adapter("https://citrination.com")
+  assert isinstance(client.session, requests.Session)
+  assert adapter._pool_maxsize == DEFAULT_POOL_MAXSIZE
+
+def test_create_session_pool_size():
+  """
+  Tests that the connection pool parameters are applied to the session
+  """
+  session = create_session(pool_connections=2, pool_maxsize=32, keep_alive=False)
+  adapter = session.get_adapter("https://citrination.com")
+  assert adapter._pool_connections == 2
+  assert adapter._pool_maxsize == 32
+  assert session.headers["Connection"] == "close"
+
+def test_sub_clients_share_session():
+  """
+  Tests that all of the sub clients of a CitrinationClient share one session
+  """
+  client = CitrinationClient("key", "mycitrinationsite", pool_maxsize=4)
+  assert client.models.session is client.session
+  assert client.search.session is client.session
+  assert client.data.session is client.session
+  assert client.session.get_adapter("https://citrination.com")._pool_maxsize == 4
+
+def test_idempotent_requests_retry_server_errors():
+  """
+  Tests that GETs are retried after a server error while POSTs are not,
+  unless they are marked as idempotent
+  """
+  client = BaseClient("key", "mock://mycitrinationsite",
+                      retry_policy=RetryPolicy(sleep=lambda seconds: None))
+  with requests_mock.mock() as m:
+    m.get("mock://mycitrinationsite/api/thing", [{"status_code": 502}, {"json": {}}])
+    assert client._get("thing").status_code == 200
+
+    m.post("mock://mycitrinationsite/api/thing", [{"status_code": 502}, {"json": {}}])
+    try:
+      client._post("thing", "{}")
+      assert False
+    except CitrinationClientError:
+      assert True
+  assert client.retry_stats.retries == 1
+  assert client.retry_stats.server_errors == 1
@@ -0,0 +1,119 @@
+from citrination_client.base.json_backend import JsonBackend, get_json_backend, default_json_backend, BACKEND_NAMES
+from citrination_client.base import BaseClient
+from citrination_client.client import CitrinationClient
+import json
+import pytest
+import requests_mock
+
+
+def _installed_backends():
+    backends = []
+    for name in BACKEND_NAMES:
+        try:
+            backends.append(get_json_backend(name))
+        except ImportError:
+            pass
+    return backends
+
+
+@pytest.mark.parametrize("backend", _installed_backends(), ids=lambda b: b.name)
+def test_backend_round_trip(backend):
+    """
+    Tests that every installed backend encodes to bytes which decode to the original
+    """
+    document = {"candidates": [{"formula": u"caf\u00e9", "x": 1.5, "n": 3, "ok": True, "none": None}]}
+    encoded = backend.dumps(document)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded.decode("utf-8")) == document
+    assert backend.loads(encoded) == document
+    assert backend.loads(encoded.decode("utf-8")) == document
+
+
+@pytest.mark.parametrize("backend", _installed_backends(), ids=lambda b: b.name)
+def test_backend_falls_back_to_standard_library(backend):
+    """
+    Tests that objects and documents a fast library rejects are handled as the
+    standard library handles them
+    """
+    huge = 2 ** 70
+    assert backend.loads(backend.dumps({"n": huge})) == {"n": huge}
+    assert backend.loads(backend.dumps({1: "a"})) == {"1": "a"}
+    assert backend.dumps({"s": set([1])}, default=sorted) in (b'{"s": [1]}', b'{"s":[1]}')
+    with pytest.raises(TypeError):
+        backend.dumps({"s": set([1])})
+
+    value = backend.loads(b'{"value": NaN}')["value"]
+    assert value != value
+    with pytest.raises(ValueError):
+        backend.loads(b'{"value": ')
+
+
+def test_fastest_installed_backend():
+    """
+    Tests that asking for any backend gives the first installed library
+    """
+    assert get_json_backend().name == _installed_backends()[0].name
+
+
+def test_default_backend_is_standard_library():
+    """
+    Tests that clients use the standard library unless given a backend, so
+    non-finite floats are sent as the standard library encodes them
+    """
+    assert default_json_backend().name == "json"
+    client = BaseClient("key", "mock://mycitrinationsite")
+    assert client.json_backend.name == "json"
+    with requests_mock.mock() as m:
+        m.post("mock://mycitrinationsite/api/thing", json={"status": "ok"})
+        client._post_json("thing", {"x": float("nan"), "y": float("inf")})
+        assert m.last_request.body == b'{"x": NaN, "y": Infinity}'
+
+
+def test_unknown_backend():
+    """
+    Tests that asking for an unknown library is an error
+    """
+    with pytest.raises(ValueError):
+        get_json_backend("yaml")
+
+
+class RecordingBackend(JsonBackend):
+
+    def __init__(self):
+        self.encoded = []
+        self.decoded = []
+
+    def dumps(self, obj, default=None):
+        self.encoded.append(obj)
+        return super(RecordingBackend, self).dumps(obj, default)
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super(RecordingBackend, self).loads(data)
+
+
+def test_client_uses_its_backend():
+    """
+    Tests that a client encodes and decodes bodies with the backend it was given
+    """
+    backend = RecordingBackend()
+    client = BaseClient("key", "mock://mycitrinationsite", json_backend=backend)
+    with requests_mock.mock() as m:
+        m.post("mock://mycitrinationsite/api/thing", json={"status": "ok"})
+        response = client._post_json("thing", {"name": "thing"})
+        assert m.last_request.body == b'{"name": "thing"}'
+        assert client._get_success_json(response) == {"status": "ok"}
+    assert backend.encoded == [{"name": "thing"}]
+    assert len(backend.decoded) == 1
+
+
+def test_sub_clients_share_backend():
+    """
+    Tests that all of the sub clients of a CitrinationClient use its backend
+    """
+    backend = RecordingBackend()
+    client = CitrinationClient("key", "mycitrinationsite", json_backend=backend)
+    assert client.json_backend is backend
+    assert client.models.json_backend is backend
+    assert client.search.json_backend is backend
+    assert client.data.json_backend is backend
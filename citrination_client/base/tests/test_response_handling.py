@@ -1,10 +1,20 @@
-from citrination_client.base.response_handling import raise_on_response, check_general_success, check_for_rate_limiting, _check_response_for_version_mismatch
+from citrination_client.base.response_handling import raise_on_response, check_general_success, check_for_rate_limiting, _check_response_for_version_mismatch, get_response_json
+from citrination_client.base.retry_policy import RetryPolicy, RetryStats
 from citrination_client.base.errors import *
 from requests.models import Response
 import requests
 import requests_mock
 import json
 
+no_sleep_policy = RetryPolicy(sleep=lambda seconds: None)
+
+def _response(status_code, headers=None):
+    r = Response()
+    r.status_code = status_code
+    if headers:
+        r.headers.update(headers)
+    return r
+
 response_exceptions = [{
         "code": requests.codes.server_error,
         "exception_class": CitrinationServerErrorException
@@ -80,22 +90,23 @@ def test_if_rate_limiting_returns_on_resolve():
     bad_response.status_code = 429
     good_response = Response()
     good_response.status_code = 200
-    response_lambda = (lambda t, a: bad_response if a < 1 else good_response)
+    responses = iter([bad_response, good_response])
+    response_lambda = (lambda: next(responses))
     try:
-        check_for_rate_limiting(bad_response, response_lambda)
+        check_for_rate_limiting(bad_response, response_lambda, retry_policy=no_sleep_policy)
         assert True
     except RateLimitingException:
         assert False
 
-def test_after_three_attempts_rate_limit_errors():
+def test_after_max_attempts_rate_limit_errors():
     """
-    Tests that if three rate limiting error codes are encountered in a row (with backoff), a custom exception will be thrown
+    Tests that if rate limiting error codes are encountered on every attempt (with backoff), a custom exception will be thrown
     """
     bad_response = Response()
     bad_response.status_code = 429
-    response_lambda = (lambda t, a: bad_response)
+    response_lambda = (lambda: bad_response)
     try:
-        check_for_rate_limiting(bad_response, response_lambda)
+        check_for_rate_limiting(bad_response, response_lambda, retry_policy=no_sleep_policy)
         assert False
     except RateLimitingException:
         assert True
@@ -106,6 +117,110 @@ def test_success_does_not_trigger_rate_limiting_retry():
     """
     response = Response()
     response.status_code = 200
-    response_lambda = (lambda t, a: 1/0) # will throw exception
+    response_lambda = (lambda: 1/0) # will throw exception
     checked_resp = check_for_rate_limiting(response, response_lambda)
-    assert response == checked_resp
\ No newline at end of file
+    assert response == checked_resp
+
+
+def test_backoff_is_jittered_and_capped():
+    """
+    Tests that jittered delays fall between zero and the exponential
+    backoff, which never exceeds the maximum delay
+    """
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    for attempt in range(1, 10):
+        ceiling = min(5.0, 2 ** (attempt - 1))
+        for _ in range(20):
+            assert 0 <= policy.backoff(attempt) <= ceiling
+    assert RetryPolicy(jitter=False, max_delay=5.0).backoff(10) == 5.0
+
+def test_retry_after_header_is_respected():
+    """
+    Tests that the Retry-After header sets the delay before a retry, capped
+    at the policy's maximum delay
+    """
+    slept = []
+    policy = RetryPolicy(max_delay=10.0, sleep=slept.append)
+    responses = iter([_response(429, {"Retry-After": "60"}), _response(200)])
+    policy.retry(_response(429, {"Retry-After": "3"}), lambda: next(responses))
+    assert slept == [3.0, 10.0]
+
+def test_server_errors_only_retried_when_idempotent():
+    """
+    Tests that a server error is retried for idempotent requests but
+    returned straight away otherwise
+    """
+    responses = iter([_response(503), _response(200)])
+    assert no_sleep_policy.execute(lambda: next(responses)).status_code == 503
+    responses = iter([_response(503), _response(200)])
+    assert no_sleep_policy.execute(lambda: next(responses), idempotent=True).status_code == 200
+
+def test_connection_errors_retried_when_idempotent():
+    """
+    Tests that connection errors are retried for idempotent requests, and
+    raised once the attempts are exhausted
+    """
+    calls = []
+    def request():
+        calls.append(1)
+        if len(calls) < 3:
+            raise requests.exceptions.ConnectionError()
+        return _response(200)
+    assert no_sleep_policy.execute(request, idempotent=True).status_code == 200
+    assert len(calls) == 3
+
+    del calls[:]
+    try:
+        no_sleep_policy.execute(request)
+        assert False
+    except requests.exceptions.ConnectionError:
+        assert len(calls) == 1
+
+def test_retry_stats_are_recorded():
+    """
+    Tests that the retry counters reflect the attempts that were made
+    """
+    stats = RetryStats()
+    responses = iter([_response(429), _response(502), _response(200)])
+    no_sleep_policy.execute(lambda: next(responses), idempotent=True, stats=stats)
+    assert stats.requests == 3
+    assert stats.retries == 2
+    assert stats.rate_limited == 1
+    assert stats.server_errors == 1
+    assert stats.exhausted == 0
+
+
+def test_after_attempt_decides_each_retry():
+    """
+    Tests the per-attempt decisions shared by the synchronous and
+    asynchronous clients
+    """
+    policy = RetryPolicy(max_attempts=2, jitter=False, base_delay=1.0)
+    stats = RetryStats()
+    assert policy.after_attempt(1, _response(200), stats=stats) is None
+    assert policy.after_attempt(1, _response(503), stats=stats) is None
+    assert policy.after_attempt(1, _response(503), idempotent=True, stats=stats) == 1.0
+    assert policy.after_attempt(2, _response(503), idempotent=True, stats=stats) is None
+    assert policy.after_attempt(1, None, idempotent=True, stats=stats) == 1.0
+    assert policy.after_attempt(1, None, stats=stats) is None
+    try:
+        policy.after_attempt(2, _response(429), stats=stats)
+        assert False
+    except RateLimitingException:
+        pass
+    assert stats.as_dict() == {"requests": 7, "retries": 2, "rate_limited": 1, "server_errors": 2,
+                               "connection_errors": 2, "exhausted": 3}
+
+
+def test_get_response_json():
+    """
+    Tests that response bodies are parsed the same whichever JSON library is used,
+    including values only the standard library accepts
+    """
+    r = _response(200)
+    r._content = b'{"results": {"hits": [], "name": "caf\xc3\xa9"}}'
+    assert get_response_json(r) == {"results": {"hits": [], "name": u"caf\u00e9"}}
+
+    r._content = b'{"value": NaN}'
+    value = get_response_json(r)["value"]
+    assert value != value
@@ -1,6 +1,9 @@
 from citrination_client.models import ModelsClient
 from citrination_client.search import SearchClient
 from citrination_client.data import DataClient
+from citrination_client.base.session import create_session, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from citrination_client.base.retry_policy import RetryPolicy
+from citrination_client.base.json_backend import default_json_backend
 from citrination_client.util.credentials import get_preferred_credentials
 
 """
@@ -21,7 +24,10 @@ class CitrinationClient(object):
     via direct parameterization, environment variables, or a .citrination credentials file. See the tutorial on client Initialization for more information.
     """
 
-    def __init__(self, api_key=None, site=None, suppress_warnings=False):
+    def __init__(self, api_key=None, site=None, suppress_warnings=False, session=None,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 pool_block=False, keep_alive=True, prediction_cache=None, retry_policy=None,
+                 pif_cache=None, json_backend=None):
         """
         Constructor.
 
@@ -33,11 +39,50 @@ class CitrinationClient(object):
         :param suppress_warnings: A flag allowing you to suppress warning
             statements guarding against misuse printed to stdout.
         :type suppress_warnings: bool
+        :param session: An HTTP session shared by all of the sub-clients. If
+            not supplied, one is created from the pool parameters below.
+        :type session: requests.Session
+        :param pool_connections: The number of per-host connection pools to
+            cache in the shared session
+        :type pool_connections: int
+        :param pool_maxsize: The maximum number of connections kept alive per
+            host in the shared session
+        :type pool_maxsize: int
+        :param pool_block: Whether requests should wait for a free pooled
+            connection rather than opening an extra one
+        :type pool_block: bool
+        :param keep_alive: Whether connections should be reused between requests
+        :type keep_alive: bool
+        :param prediction_cache: A cache consulted by the models client before
+            sending candidates for prediction
+        :type prediction_cache: :class:`BasePredictionCache`
+        :param retry_policy: The policy used by every sub-client to retry rate
+            limited and failed requests. If not supplied, requests are retried
+            up to four times with jittered exponential backoff.
+        :type retry_policy: :class:`RetryPolicy`
+        :param pif_cache: A cache of versioned PIFs consulted by the search and
+            data clients before requesting PIFs
+        :type pif_cache: :class:`PifCache`
+        :param json_backend: The backend used by every sub-client to encode
+            request bodies and decode response bodies. If not supplied, the
+            standard library's json module is used.
+        :type json_backend: :class:`JsonBackend`
         """
         api_key, site = get_preferred_credentials(api_key, site)
-        self.models = ModelsClient(api_key, site, suppress_warnings=suppress_warnings)
-        self.search = SearchClient(api_key, site, suppress_warnings=suppress_warnings)
-        self.data = DataClient(api_key, site, suppress_warnings=suppress_warnings)
+        if session is None:
+            session = create_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                     pool_block=pool_block, keep_alive=keep_alive)
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        if json_backend is None:
+            json_backend = default_json_backend()
+        self.models = ModelsClient(api_key, site, suppress_warnings=suppress_warnings, session=session,
+                                   prediction_cache=prediction_cache, retry_policy=retry_policy,
+                                   json_backend=json_backend)
+        self.search = SearchClient(api_key, site, suppress_warnings=suppress_warnings, session=session,
+                                   retry_policy=retry_policy, pif_cache=pif_cache, json_backend=json_backend)
+        self.data = DataClient(api_key, site, suppress_warnings=suppress_warnings, session=session,
+                               retry_policy=retry_policy, pif_cache=pif_cache, json_backend=json_backend)
 
         clients = [self.models, self.search, self.data]
 
@@ -46,6 +91,11 @@ class CitrinationClient(object):
             for method in client_methods:
                 setattr(self, method, _generate_lambda_proxy_method(client, method))
 
+        self.session = session
+        self.retry_policy = retry_policy
+        self.pif_cache = pif_cache
+        self.json_backend = json_backend
+
 
     def __repr__(self):
         return "['models', 'search', 'data']"
\ No newline at end of file
@@ -0,0 +1,4 @@
+import sys
+
+# The asynchronous client uses syntax which older interpreters cannot parse
+collect_ignore = ["aio"] if sys.version_info < (3, 6) else []
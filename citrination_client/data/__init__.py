@@ -1,5 +1,35 @@
-from citrination_client.data.dataset import Dataset
-from citrination_client.data.dataset_file import DatasetFile
-from citrination_client.data.upload_result import UploadResult
-from citrination_client.data.dataset_version import DatasetVersion
-from citrination_client.data.client import DataClient
\ No newline at end of file
+from citrination_client.util.lazy import lazy_attributes
+
+# Submodules are attributes of the package too, imported when first accessed
+_submodules = {
+    "client": "citrination_client.data.client",
+    "dataset": "citrination_client.data.dataset",
+    "dataset_file": "citrination_client.data.dataset_file",
+    "dataset_version": "citrination_client.data.dataset_version",
+    "download_result": "citrination_client.data.download_result",
+    "mirror": "citrination_client.data.mirror",
+    "pif_cache": "citrination_client.data.pif_cache",
+    "pif_fetch_result": "citrination_client.data.pif_fetch_result",
+    "routes": "citrination_client.data.routes",
+    "streaming": "citrination_client.data.streaming",
+    "sync_manifest": "citrination_client.data.sync_manifest",
+    "upload_journal": "citrination_client.data.upload_journal",
+    "upload_result": "citrination_client.data.upload_result"
+}
+
+# Attributes are imported from their modules when first accessed
+lazy_attributes(globals(), {
+    "Dataset": "citrination_client.data.dataset",
+    "DatasetFile": "citrination_client.data.dataset_file",
+    "UploadResult": "citrination_client.data.upload_result",
+    "DownloadResult": "citrination_client.data.download_result",
+    "PifFetchResult": "citrination_client.data.pif_fetch_result",
+    "PifCache": "citrination_client.data.pif_cache",
+    "UploadJournal": "citrination_client.data.upload_journal",
+    "SyncManifest": "citrination_client.data.sync_manifest",
+    "DatasetVersion": "citrination_client.data.dataset_version",
+    "DataClient": "citrination_client.data.client",
+    "DatasetMirror": "citrination_client.data.mirror"
+}, _submodules)
+
+del lazy_attributes
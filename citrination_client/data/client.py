@@ -1,12 +1,33 @@
 from citrination_client.base.base_client import BaseClient
 from citrination_client.base.errors import *
-from citrination_client.data import *
+from citrination_client.data.dataset import Dataset
+from citrination_client.data.dataset_file import DatasetFile
+from citrination_client.data.dataset_version import DatasetVersion
+from citrination_client.data.download_result import DownloadResult
+from citrination_client.data.pif_fetch_result import PifFetchResult
+from citrination_client.data.upload_result import UploadResult
 from citrination_client.data import routes as routes
+from citrination_client.base.retry_policy import RETRYABLE_EXCEPTIONS
+from citrination_client.data.streaming import ChecksumReader, file_md5, DEFAULT_CHUNK_SIZE
+from citrination_client.data.upload_journal import UploadJournal, UPLOADED, REGISTERED
+from citrination_client.data.sync_manifest import SyncManifest
+from citrination_client.util.files import replace_file
+
+from citrination_client.search import PifSearchResult
+from citrination_client.search import routes as search_routes
+from citrination_client.search.client import _pif_uid_query
+from citrination_client.search.query_encoder import encode_query
+from citrination_client.search.result_decoder import decode_search_result
 
 from pypif import pif
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
 import shutil
+import six
+import time
 import requests
 
 class DataClient(BaseClient):
@@ -14,7 +35,8 @@ class DataClient(BaseClient):
     Client encapsulating data management behavior.
     """
 
-    def __init__(self, api_key, host="https://citrination.com", suppress_warnings=False):
+    def __init__(self, api_key, host="https://citrination.com", suppress_warnings=False, session=None,
+                 retry_policy=None, pif_cache=None, json_backend=None):
         """
         Constructor.
 
@@ -25,9 +47,21 @@ class DataClient(BaseClient):
         :param suppress_warnings: Whether or not usage warnings should be
             printed to stdout
         :type suppress_warnings: bool
+        :param session: The HTTP session to make requests with
+        :type session: requests.Session
+        :param retry_policy: The policy used to retry rate limited and failed
+            requests
+        :type retry_policy: :class:`RetryPolicy`
+        :param pif_cache: If supplied, PIFs requested from a specific dataset
+            version are looked up in this cache before being requested
+        :type pif_cache: :class:`PifCache`
+        :param json_backend: The backend used to encode request bodies and
+            decode response bodies
+        :type json_backend: :class:`JsonBackend`
         """
         members = [
             "upload",
+            "upload_sync",
             "list_files",
             "matched_file_count",
             "get_dataset_files",
@@ -36,54 +70,292 @@ class DataClient(BaseClient):
             "create_dataset",
             "create_dataset_version"
         ]
-        super(DataClient, self).__init__(api_key, host, members, suppress_warnings=suppress_warnings)
+        super(DataClient, self).__init__(api_key, host, members, suppress_warnings=suppress_warnings,
+                                         session=session, retry_policy=retry_policy,
+                                         json_backend=json_backend)
+        self.pif_cache = pif_cache
 
-    def upload(self, dataset_id, source_path, dest_path=None):
+    def upload(self, dataset_id, source_path, dest_path=None, max_workers=1, journal=None, verify_checksum=True,
+               chunk_size=DEFAULT_CHUNK_SIZE):
         """
-        Upload a file, specifying source and dest paths a file (acts as the scp command).asdfasdf
+        Upload a file, specifying source and dest paths a file (acts as the scp command).
 
-        :param source_path: The path to the file on the source host asdf
+        When a directory is uploaded, up to ``max_workers`` files are uploaded
+        at once, so that the requests for one file overlap with those of
+        others. The outcome of every file is collected into the result.
+
+        Files are streamed from disk in chunks, and the MD5 digest of what was
+        sent is compared with the checksum returned by storage, so that a
+        corrupted transfer is retried. If a ``journal`` is supplied, the
+        progress of each file is recorded in it, and running the same upload
+        again after an interruption only finishes the files which were not
+        already acknowledged.
+
+        :param source_path: The path to the file on the source host
         :type source_path: str
         :param dest_path: The path to the file where the contents of the upload will be written (on the dest host)
         :type dest_path: str
+        :param max_workers: The maximum number of files uploaded concurrently
+            when uploading a directory
+        :type max_workers: int
+        :param journal: The journal used to resume an interrupted upload, or
+            the path of its file. Entries for this upload are removed from the
+            journal once every file has been uploaded successfully.
+        :type journal: :class:`UploadJournal` or str
+        :param verify_checksum: Whether the checksum returned by storage is
+            verified against the contents sent
+        :type verify_checksum: bool
+        :param chunk_size: The number of bytes read from disk at a time
+        :type chunk_size: int
         :return: The result of the upload process
         :rtype: :class:`UploadResult`
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if isinstance(journal, six.string_types):
+            journal = UploadJournal(journal)
+
         upload_result = UploadResult()
         source_path = str(source_path)
         if not dest_path:
             dest_path = source_path
         else:
             dest_path = str(dest_path)
+        start = time.time()
+        def upload_file(source, dest):
+            return self._upload_file(dataset_id, source, dest, journal, verify_checksum, chunk_size)
+
         if os.path.isdir(source_path):
-            for path, subdirs, files in os.walk(source_path):
-                for name in files:
-                    path_without_root_dir = path.split("/")[-1:] + [name]
-                    current_dest_path = os.path.join(dest_path, *path_without_root_dir)
-                    current_source_path = os.path.join(path, name)
-                    try:
-                        if self.upload(dataset_id, current_source_path, current_dest_path).successful():
-                            upload_result.add_success(current_source_path)
-                        else:
-                            upload_result.add_failure(current_source_path,"Upload failure")
-                    except (CitrinationClientError, ValueError) as e:
-                        upload_result.add_failure(current_source_path, e.message)
-            return upload_result
+            paths = _directory_upload_paths(source_path, dest_path)
+            self._upload_files(paths, upload_file, upload_result, max_workers)
         elif os.path.isfile(source_path):
+            paths = [(source_path, dest_path)]
+            upload_result.add_success(source_path, upload_file(source_path, dest_path))
+        else:
+            raise ValueError("No file at specified path {}".format(source_path))
+        upload_result.set_elapsed(time.time() - start)
+
+        if journal is not None and upload_result.successful():
+            for _, dest in paths:
+                journal.remove(dataset_id, dest)
+            if len(journal) == 0:
+                journal.clear()
+            else:
+                journal.compact()
+        return upload_result
+
+    def upload_sync(self, dataset_id, local_dir, dest_path=None, max_workers=8, manifest=None, journal=None,
+                    verify_checksum=True):
+        """
+        Uploads only the files in a directory which are missing from the
+        latest version of a dataset or differ from the copy on Citrination.
+        Unchanged files are recorded as skipped in the result.
+
+        A file is unchanged if the dataset has a file at its destination path
+        with the same size and MD5 digest. Local digests are kept in a
+        manifest, so that only files which were modified since the last sync
+        are hashed again when the manifest is saved to a file.
+
+        :param dataset_id: The ID of the dataset to upload to
+        :type dataset_id: int
+        :param local_dir: The directory to upload
+        :type local_dir: str
+        :param dest_path: The path of the directory on Citrination, as in
+            :meth:`upload`
+        :type dest_path: str
+        :param max_workers: The maximum number of files compared or uploaded
+            concurrently
+        :type max_workers: int
+        :param manifest: The manifest of local digests, or the path of its file
+        :type manifest: :class:`SyncManifest` or str
+        :param journal: The journal used to resume an interrupted upload, or
+            the path of its file
+        :type journal: :class:`UploadJournal` or str
+        :param verify_checksum: Whether the checksum returned by storage is
+            verified against the contents sent
+        :type verify_checksum: bool
+        :return: The result of the upload process
+        :rtype: :class:`UploadResult`
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        local_dir = str(local_dir)
+        if not os.path.isdir(local_dir):
+            raise ValueError("No directory at specified path {}".format(local_dir))
+        if not isinstance(manifest, SyncManifest):
+            manifest = SyncManifest(manifest)
+        if isinstance(journal, six.string_types):
+            journal = UploadJournal(journal)
+        dest_path = str(dest_path) if dest_path else local_dir
+
+        start = time.time()
+        paths = _directory_upload_paths(local_dir, dest_path)
+        remote_files = dict((f.path.lstrip("/"), f) for f in self._latest_dataset_files(dataset_id))
+
+        def is_unchanged(source, dest):
+            remote_file = remote_files.get(dest.lstrip("/"))
+            if remote_file is None:
+                return False
+            local = manifest.entry(source)
+            size, etag, _ = self._remote_file_info(remote_file)
+            return size == local["size"] and etag == local["md5"]
+
+        if max_workers == 1:
+            unchanged = [is_unchanged(source, dest) for source, dest in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                unchanged = list(executor.map(lambda p: is_unchanged(*p), paths))
+        manifest.save()
+
+        upload_result = UploadResult()
+        for (source, _), skip in zip(paths, unchanged):
+            if skip:
+                upload_result.add_skipped(source, "Unchanged")
+
+        def upload_file(source, dest):
+            return self._upload_file(dataset_id, source, dest, journal, verify_checksum)
+
+        changed = [p for p, skip in zip(paths, unchanged) if not skip]
+        self._upload_files(changed, upload_file, upload_result, max_workers)
+        upload_result.set_elapsed(time.time() - start)
+
+        if journal is not None and upload_result.successful():
+            for _, dest in changed:
+                journal.remove(dataset_id, dest)
+            if len(journal) == 0:
+                journal.clear()
+            else:
+                journal.compact()
+        return upload_result
+
+    def _latest_dataset_files(self, dataset_id):
+        """
+        The files in the latest version of a dataset, or an empty list if the
+        dataset has no files yet.
+        """
+        try:
+            return self.get_dataset_files(dataset_id)
+        except (IndexError, ResourceNotFoundException):
+            return []
+
+    def _remote_file_info(self, dataset_file):
+        """
+        Finds the size and ETag of a file in storage, by requesting only its
+        first byte.
+
+        :return: The size of the file, its ETag, which is the MD5 digest of
+            files uploaded in a single request, and whether storage accepts
+            range requests for it. The size and ETag are None if they could
+            not be determined.
+        :rtype: tuple
+        """
+        def probe():
+            return self.session.get(dataset_file.url, headers={"Range": "bytes=0-0"}, stream=True)
+
+        response = self.retry_policy.execute(probe, idempotent=True, stats=self.retry_stats)
+        try:
+            if response.status_code not in (200, 206):
+                return None, None, False
+            etag = response.headers.get("ETag")
+            if etag is not None:
+                etag = etag.strip('"')
+            return _content_size(response), etag, response.status_code == 206
+        finally:
+            response.close()
+
+    def _upload_files(self, paths, upload_file, upload_result, max_workers):
+        """
+        Uploads many files on a pool of ``max_workers`` threads, recording the
+        outcome of each in ``upload_result`` in the order the paths are given.
+
+        :param paths: Pairs of source and destination path
+        :type paths: list of (str, str)
+        :param upload_file: A callable which uploads a file, given its source
+            and destination path, and returns the number of bytes sent
+        """
+        def upload_one(source, dest):
+            try:
+                return upload_file(source, dest), None
+            except (CitrinationClientError, ValueError, requests.exceptions.RequestException, IOError) as e:
+                return None, str(e)
+
+        if max_workers == 1:
+            outcomes = [upload_one(source, dest) for source, dest in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(lambda p: upload_one(*p), paths))
+
+        for (source, _), (size, error) in zip(paths, outcomes):
+            if error is None:
+                upload_result.add_success(source, size)
+            else:
+                upload_result.add_failure(source, error)
+
+    def _upload_file(self, dataset_id, source_path, dest_path, journal=None, verify_checksum=True,
+                     chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Uploads a single file: requests a presigned URL, PUTs the file to it
+        and registers the uploaded object with Citrination. Stages which the
+        journal records as already complete are skipped.
+
+        :return: The number of bytes sent
+        :rtype: int
+        """
+        entry = journal.get(dataset_id, dest_path, source_path) if journal is not None else None
+        if entry is not None and entry["stage"] == REGISTERED:
+            return 0
+
+        size = 0
+        if entry is None:
             file_data = { "dest_path": str(dest_path), "src_path": str(source_path)}
             j = self._get_success_json(self._post_json(routes.upload_to_dataset(dataset_id), data=file_data))
-            s3url = _get_s3_presigned_url(j)
-            with open(source_path, 'rb') as f:
-                r = requests.put(s3url, data=f, headers=j["required_headers"])
-                if r.status_code == 200:
-                    data = {'s3object': j['url']['path'], 's3bucket': j['bucket']}
-                    self._post_json(routes.update_file(j['file_id']), data=data)
-                    upload_result.add_success(source_path)
-                    return upload_result
-                else:
-                    raise CitrinationClientError("Failure to upload {} to Citrination".format(source_path))
+            size, md5 = self._put_file(_get_s3_presigned_url(j), j["required_headers"], source_path,
+                                       verify_checksum, chunk_size)
+            file_id = j['file_id']
+            data = {'s3object': j['url']['path'], 's3bucket': j['bucket']}
+            if journal is not None:
+                journal.record(dataset_id, dest_path, source_path, UPLOADED, file_id=file_id, data=data, md5=md5)
         else:
-            raise ValueError("No file at specified path {}".format(source_path))
+            file_id = entry["file_id"]
+            data = entry["data"]
+
+        self._post_json(routes.update_file(file_id), data=data)
+        if journal is not None:
+            journal.record(dataset_id, dest_path, source_path, REGISTERED, file_id=file_id)
+        return size
+
+    def _put_file(self, url, headers, source_path, verify_checksum=True, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams a file to a presigned URL. Failed requests are retried
+        according to the retry policy, and the file is sent again if the ETag
+        returned by storage does not match the MD5 digest of what was sent.
+
+        :return: The number of bytes sent and their MD5 digest
+        :rtype: tuple
+        """
+        size = os.path.getsize(source_path)
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            readers = []
+
+            def put():
+                with open(source_path, 'rb') as f:
+                    reader = ChecksumReader(f, size, chunk_size)
+                    readers.append(reader)
+                    # An empty reader would be sent with chunked encoding,
+                    # which presigned URLs do not accept
+                    return self.session.put(url, data=reader if size else b"", headers=headers)
+
+            r = self.retry_policy.execute(put, idempotent=True, stats=self.retry_stats)
+            if r.status_code != 200:
+                raise CitrinationClientError("Failure to upload {} to Citrination".format(source_path))
+
+            md5 = readers[-1].hexdigest()
+            etag = r.headers.get("ETag", "").strip('"')
+            if not verify_checksum or not _etag_is_md5(etag) or etag == md5:
+                return size, md5
+            self.retry_policy.sleep(self.retry_policy.backoff(attempt))
+
+        raise CitrinationClientError("Checksum mismatch uploading {} to Citrination".format(source_path))
 
     def list_files(self, dataset_id, glob=".", is_dir=False):
         """
@@ -98,12 +370,7 @@ class DataClient(BaseClient):
         :return: A list of filepaths in the dataset matching the provided glob.
         :rtype: list of strings
         """
-        data = {
-            "list": {
-                "glob": glob,
-                "isDir": is_dir
-            }
-        }
+        data = _list_files_body(glob, is_dir)
         return self._get_success_json(self._post_json(routes.list_files(dataset_id), data, failure_message="Failed to list files for dataset {}".format(dataset_id)))['files']
 
     def matched_file_count(self, dataset_id, glob=".", is_dir=False):
@@ -138,38 +405,13 @@ class DataClient(BaseClient):
         :return: A list of dataset files whose paths match the provided pattern.
         :rtype: list of :class:`DatasetFile`
         """
-        if version_number is None:
-            latest = True
-        else:
-            latest = False
-
-        data = {
-            "download_request": {
-                "glob": glob,
-                "isDir": is_dir,
-                "latest": latest
-            }
-        }
+        data = _matched_files_body(glob, is_dir, version_number)
 
         failure_message = "Failed to get matched files in dataset {}".format(dataset_id)
 
         versions = self._get_success_json(self._post_json(routes.matched_files(dataset_id), data, failure_message=failure_message))['versions']
 
-        # if you don't provide a version number, only the latest
-        # will be included in the response body
-        if version_number is None:
-            version = versions[0]
-        else:
-            try:
-                version = list(filter(lambda v: v['number'] == version_number, versions))[0]
-            except IndexError:
-                raise ResourceNotFoundException()
-
-        return list(
-            map(
-                lambda f: DatasetFile(path=f['filename'], url=f['url']), version['files']
-                )
-            )
+        return _dataset_files_from_versions(versions, version_number)
 
     def get_dataset_file(self, dataset_id, file_path, version = None):
         """
@@ -186,31 +428,160 @@ class DataClient(BaseClient):
         """
         return self.get_dataset_files(dataset_id, "^{}$".format(file_path), version_number=version)[0]
 
-    def download_files(self, dataset_files, destination='.'):
+    def download_files(self, dataset_files, destination='.', max_workers=1, range_size=None,
+                       chunk_size=DEFAULT_CHUNK_SIZE):
         """
         Downloads file(s) to a local destination.
 
+        Each file is written to a ``.part`` file next to its destination and
+        moved into place once complete. If a download is interrupted, running
+        it again resumes from where it stopped, provided storage accepts range
+        requests and the file has not changed since. Files which are already
+        present with the same size and checksum are skipped.
+
         :param dataset_files:
         :type dataset_files: list of :class: `DatasetFile`
         :param destination: The path to the desired local download destination
         :type destination: str
-        :param chunk: Whether or not to chunk the file. Default True
-        :type chunk: bool
+        :param max_workers: The maximum number of requests in flight at once,
+            shared between whole files and the ranges of split files. This
+            should not exceed the connection pool size of the session.
+        :type max_workers: int
+        :param range_size: If supplied, files larger than this many bytes are
+            split into ranges of this size which are downloaded concurrently
+        :type range_size: int
+        :param chunk_size: The number of bytes written to disk at a time
+        :type chunk_size: int
+        :return: The result of the download process
+        :rtype: :class:`DownloadResult`
         """
         if not isinstance(dataset_files, list):
             dataset_files = [dataset_files]
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if range_size is not None and range_size < 1:
+            raise ValueError("range_size must be at least 1")
+
+        start = time.time()
+        local_paths = [os.path.join(destination, f.path.lstrip('/')) for f in dataset_files]
+        split = range_size if max_workers > 1 else None
+        errors = [None] * len(dataset_files)
+
+        def run(index, step, *args):
+            # A file which has failed a step is not attempted any further
+            if errors[index] is not None:
+                return None
+            try:
+                return step(*args)
+            except (CitrinationClientError, requests.exceptions.RequestException, IOError, OSError) as e:
+                errors[index] = str(e)
+                return None
+
+        # Files and their ranges share one pool, so at most max_workers
+        # requests are in flight however the files are split
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            plans = list(executor.map(
+                lambda i: run(i, self._plan_download, dataset_files[i], local_paths[i], split, chunk_size),
+                range(len(dataset_files))))
+            fetches = [(i, segment_path, byte_range) for i, plan in enumerate(plans) if plan is not None
+                       for segment_path, byte_range in plan[2] or []]
+            list(executor.map(
+                lambda f: run(f[0], self._fetch_range, dataset_files[f[0]].url, local_paths[f[0]], f[1], f[2],
+                              chunk_size),
+                fetches))
+
+        download_result = DownloadResult()
+        for i, local_path in enumerate(local_paths):
+            plan = plans[i]
+            if plan is not None and plan[2] is None:
+                download_result.add_skipped(local_path, "Already downloaded")
+                continue
+            size = run(i, _assemble_download, local_path, plan, chunk_size) if plan is not None else None
+            if errors[i] is not None:
+                download_result.add_failure(local_path, errors[i])
+            else:
+                download_result.add_success(local_path, size)
+        download_result.set_elapsed(time.time() - start)
+        return download_result
+
+    def _plan_download(self, dataset_file, local_path, range_size=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Decides how a single file is downloaded, resuming from its ``.part``
+        file and splitting it into ranges where storage allows.
+
+        :return: The size of the file, the path of its ``.part`` file and the
+            segments to fetch, as pairs of segment path and byte range. The
+            byte range is None to fetch the whole file, and the segments are
+            None if the file is already present.
+        :rtype: tuple
+        """
+        size, etag, accepts_ranges = self._remote_file_info(dataset_file)
+        if size is not None and os.path.isfile(local_path) and os.path.getsize(local_path) == size \
+                and (not _etag_is_md5(etag) or file_md5(local_path, chunk_size) == etag):
+            return size, None, None
+
+        _make_parent_dirs(local_path)
+        part_path = local_path + ".part"
+        if size == 0:
+            open(part_path, "wb").close()
+            return size, part_path, []
+        if size is None or not accepts_ranges:
+            return size, part_path, [(part_path, None)]
+        ranges = _byte_ranges(size, range_size)
+        return size, part_path, list(zip(_prepare_parts(part_path, size, etag, len(ranges)), ranges))
+
+    def _fetch_range(self, url, local_path, segment_path, byte_range, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Downloads a range of bytes of a file, or the whole file if
+        ``byte_range`` is None, into ``segment_path``. A range resumes from
+        the bytes already in its segment, including after the connection
+        drops part way through.
 
-        for f in dataset_files:
-            filename = f.path.lstrip('/')
-            local_path = os.path.join(destination, filename)
-
-            if not os.path.isdir(os.path.dirname(local_path)):
-                os.makedirs(os.path.dirname(local_path))
-
-            r = requests.get(f.url, stream=True)
-
-            with open(local_path, 'wb') as output_file:
-                shutil.copyfileobj(r.raw, output_file)
+        :param byte_range: The first and last byte to download, inclusive
+        :type byte_range: tuple
+        """
+        def remaining():
+            if byte_range is None:
+                return None
+            first, last = byte_range
+            offset = os.path.getsize(segment_path) if os.path.isfile(segment_path) else 0
+            return first + offset, last
+
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            headers = {}
+            offset = 0
+            if byte_range is not None:
+                first, last = remaining()
+                if first > last:
+                    return
+                offset = first - byte_range[0]
+                headers["Range"] = "bytes={}-{}".format(first, last)
+
+            def get():
+                return self.session.get(url, headers=headers, stream=True)
+
+            response = self.retry_policy.execute(get, idempotent=True, stats=self.retry_stats)
+            try:
+                if response.status_code != (200 if byte_range is None else 206):
+                    raise CitrinationClientError("Failure to download {}".format(local_path))
+                with open(segment_path, "ab" if offset else "wb") as f:
+                    for data in response.iter_content(chunk_size):
+                        f.write(data)
+            except RETRYABLE_EXCEPTIONS + (requests.exceptions.ChunkedEncodingError,):
+                if attempt == self.retry_policy.max_attempts:
+                    raise
+                # A whole file starts over, and a range resumes from its segment
+                self.retry_policy.sleep(self.retry_policy.backoff(attempt))
+                continue
+            finally:
+                response.close()
+            if byte_range is None:
+                return
+            first, last = remaining()
+            if first > last:
+                return
+            if attempt < self.retry_policy.max_attempts:
+                self.retry_policy.sleep(self.retry_policy.backoff(attempt))
 
     def get_pif(self, dataset_id, uid, dataset_version = None):
         """
@@ -228,10 +599,93 @@ class DataClient(BaseClient):
         failure_message = "An error occurred retrieving PIF {}".format(uid)
         if dataset_version == None:
             response = self._get(routes.pif_dataset_uid(dataset_id, uid), failure_message=failure_message)
-        else:
-            response = self._get(routes.pif_dataset_version_uid(dataset_id, uid, dataset_version), failure_message=failure_message)
+            return pif.loads(response.content.decode("utf-8"))
+
+        # The latest version of a PIF can change, but a versioned PIF cannot
+        pif_json = self.pif_cache.get(dataset_id, dataset_version, uid) if self.pif_cache is not None else None
+        if pif_json is None:
+            response = self._get(routes.pif_dataset_version_uid(dataset_id, dataset_version, uid), failure_message=failure_message)
+            pif_json = response.content.decode("utf-8")
+            if self.pif_cache is not None:
+                self.pif_cache.set(dataset_id, dataset_version, uid, pif_json)
+
+        return pif.loads(pif_json)
+
+    def get_pifs(self, dataset_id, uids, dataset_version=None, max_workers=8, batch_size=100):
+        """
+        Retrieves many PIFs from a given dataset, concurrently.
+
+        When no version is supplied, the PIFs are first looked up with search
+        queries matching up to ``batch_size`` uids each, and only PIFs which
+        search did not return are requested individually. A PIF which cannot
+        be retrieved is reported in its result rather than stopping the rest.
+
+        :param dataset_id: The id of the dataset to retrieve PIFs from
+        :type dataset_id: int
+        :param uids: The uids of the PIFs to retrieve
+        :type uids: list of str
+        :param dataset_version: The dataset version to look for the PIFs in. If nothing is supplied, the latest dataset version will be searched
+        :type dataset_version: int
+        :param max_workers: The maximum number of requests made concurrently
+        :type max_workers: int
+        :param batch_size: The maximum number of uids looked up per search
+        :type batch_size: int
+        :return: One result per uid, in the order the uids were given
+        :rtype: list of :class:`PifFetchResult`
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        uids = list(uids)
+        unique_uids = list(OrderedDict.fromkeys(uids))
+
+        found = {}
+        if dataset_version is None:
+            batches = [unique_uids[i:i + batch_size] for i in range(0, len(unique_uids), batch_size)]
+            for pifs in self._map(lambda batch: self._search_pifs(dataset_id, batch), batches, max_workers):
+                found.update(pifs)
+
+        def fetch(uid):
+            if uid in found:
+                return PifFetchResult(uid, pif=found[uid])
+            try:
+                return PifFetchResult(uid, pif=self.get_pif(dataset_id, uid, dataset_version))
+            except (CitrinationClientError, ValueError, requests.exceptions.RequestException) as e:
+                return PifFetchResult(uid, error=e)
+
+        results = dict((r.uid, r) for r in self._map(fetch, unique_uids, max_workers))
+        return [results[uid] for uid in uids]
+
+    def _search_pifs(self, dataset_id, uids):
+        """
+        Looks up PIFs in the latest version of a dataset by uid with a single
+        search query.
 
-        return pif.loads(response.content.decode("utf-8"))
+        :return: The PIFs which were found, by uid. Empty if the search failed,
+            so that the PIFs are requested individually instead.
+        :rtype: dict
+        """
+        query = _pif_uid_query(uids, dataset_ids=[dataset_id])
+        try:
+            response = self._post(search_routes.pif_search, encode_query(query, self.json_backend),
+                                  failure_message="Error while searching for PIFs", idempotent=True)
+            result = decode_search_result(self._get_success_json(response)['results'], PifSearchResult)
+        except (CitrinationClientError, ValueError, requests.exceptions.RequestException):
+            return {}
+        requested = set(uids)
+        return dict((hit.system.uid, hit.system) for hit in result.hits or []
+                    if hit.system is not None and hit.system.uid in requested)
+
+    def _map(self, function, items, max_workers):
+        """
+        Applies a function to every item on a pool of ``max_workers`` threads,
+        returning the results in order.
+        """
+        if max_workers == 1 or len(items) <= 1:
+            return [function(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(function, items))
 
     def create_dataset(self, name=None, description=None, public=False):
         """
@@ -246,14 +700,7 @@ class DataClient(BaseClient):
         :return: The newly created dataset.
         :rtype: :class:`Dataset`
         """
-        data = {
-            "public": _convert_bool_to_public_value(public)
-        }
-        if name:
-            data["name"] = name
-        if description:
-            data["description"] = description
-        dataset = {"dataset": data}
+        dataset = _dataset_body(name, description, public)
         failure_message = "Unable to create dataset"
         result = self._get_success_json(self._post_json(routes.create_dataset(), dataset, failure_message=failure_message))
 
@@ -275,16 +722,7 @@ class DataClient(BaseClient):
         :return: The updated dataset.
         :rtype: :class:`Dataset`
         """
-        data = {
-            "public": _convert_bool_to_public_value(public)
-        }
-
-        if name:
-            data["name"] = name
-        if description:
-            data["description"] = description
-
-        dataset = {"dataset": data}
+        dataset = _dataset_body(name, description, public)
         failure_message = "Failed to update dataset {}".format(dataset_id)
         response = self._get_success_json(self._post_json(routes.update_dataset(dataset_id), data=dataset, failure_message=failure_message))
 
@@ -304,6 +742,50 @@ class DataClient(BaseClient):
 
         return DatasetVersion(number=number)
 
+def _list_files_body(glob, is_dir):
+    return {
+        "list": {
+            "glob": glob,
+            "isDir": is_dir
+        }
+    }
+
+def _matched_files_body(glob, is_dir, version_number):
+    return {
+        "download_request": {
+            "glob": glob,
+            "isDir": is_dir,
+            "latest": version_number is None
+        }
+    }
+
+def _dataset_files_from_versions(versions, version_number):
+    # if you don't provide a version number, only the latest
+    # will be included in the response body
+    if version_number is None:
+        version = versions[0]
+    else:
+        try:
+            version = list(filter(lambda v: v['number'] == version_number, versions))[0]
+        except IndexError:
+            raise ResourceNotFoundException()
+
+    return list(
+        map(
+            lambda f: DatasetFile(path=f['filename'], url=f['url']), version['files']
+            )
+        )
+
+def _dataset_body(name, description, public):
+    data = {
+        "public": _convert_bool_to_public_value(public)
+    }
+    if name:
+        data["name"] = name
+    if description:
+        data["description"] = description
+    return {"dataset": data}
+
 def _dataset_from_response_dict(dataset):
     return Dataset(dataset['id'], name=dataset['name'],
         description=dataset['description'], created_at=dataset['created_at'])
@@ -319,6 +801,118 @@ def _convert_bool_to_public_value(val):
     if val == '0' or val == '1':
         return val
 
+def _directory_upload_paths(source_path, dest_path):
+    """
+    The source and destination path of every file under a directory. Each
+    file is placed under ``dest_path`` in a folder named after the directory
+    which contains it.
+    """
+    paths = []
+    for path, subdirs, files in os.walk(source_path):
+        for name in files:
+            path_without_root_dir = path.split("/")[-1:] + [name]
+            paths.append((os.path.join(path, name), os.path.join(dest_path, *path_without_root_dir)))
+    return paths
+
+def _content_size(response):
+    """
+    The full size of a file from the response to a request for part of it.
+    """
+    content_range = response.headers.get("Content-Range")
+    if content_range is not None and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total != "*" else None
+    content_length = response.headers.get("Content-Length")
+    if response.status_code == 200 and content_length is not None:
+        return int(content_length)
+    return None
+
+def _etag_is_md5(etag):
+    # Multipart and encrypted objects have ETags which are not digests
+    return bool(etag) and "-" not in etag
+
+def _byte_ranges(size, range_size=None):
+    """
+    Splits a file into inclusive ranges of at most ``range_size`` bytes.
+    """
+    if range_size is None:
+        range_size = size
+    return [(first, min(first + range_size, size) - 1) for first in range(0, size, range_size)]
+
+def _part_state_path(part_path):
+    return part_path + ".json"
+
+def _prepare_parts(part_path, size, etag, segment_count):
+    """
+    Keeps the partial downloads of a file if they were made from the same
+    version of it in the same number of segments, and deletes them
+    otherwise. A file without an ETag cannot be identified, so its partial
+    downloads are never kept.
+
+    :return: The path each segment is downloaded to
+    :rtype: list of str
+    """
+    state_path = _part_state_path(part_path)
+    state = {"size": size, "etag": etag, "segments": segment_count}
+    previous = None
+    if os.path.isfile(state_path):
+        try:
+            with open(state_path) as f:
+                previous = json.load(f)
+        except ValueError:
+            pass
+
+    if etag is None or previous != state:
+        stale_segments = previous.get("segments", 1) if isinstance(previous, dict) else 1
+        for path in [part_path] + _segment_paths(part_path, stale_segments):
+            if os.path.isfile(path):
+                os.remove(path)
+        with open(state_path, "w") as f:
+            json.dump(state, f)
+    if segment_count == 1:
+        return [part_path]
+    return _segment_paths(part_path, segment_count)
+
+def _segment_paths(part_path, segment_count):
+    if segment_count == 1:
+        return []
+    return ["{}.{}".format(part_path, i) for i in range(segment_count)]
+
+def _assemble_download(local_path, plan, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Joins the fetched segments of a file planned by
+    :meth:`DataClient._plan_download` and moves it into place.
+
+    :return: The size of the downloaded file
+    :rtype: int
+    """
+    size, part_path, segments = plan
+    if len(segments) > 1:
+        with open(part_path, "wb") as output_file:
+            for segment_path, _ in segments:
+                with open(segment_path, "rb") as segment:
+                    shutil.copyfileobj(segment, output_file, chunk_size)
+        for segment_path, _ in segments:
+            os.remove(segment_path)
+
+    downloaded = os.path.getsize(part_path)
+    if size is not None and downloaded != size:
+        raise CitrinationClientError("Incomplete download of {}".format(local_path))
+    replace_file(part_path, local_path)
+    if os.path.isfile(_part_state_path(part_path)):
+        os.remove(_part_state_path(part_path))
+    return downloaded
+
+def _make_parent_dirs(path):
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except OSError:
+            # Another download created it first
+            if not os.path.isdir(directory):
+                raise
+
 def _get_s3_presigned_url(response_dict):
     """
     Helper method to create an S3 presigned url from the response dictionary.
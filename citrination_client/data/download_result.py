@@ -0,0 +1,90 @@
+from citrination_client.data.upload_result import UploadResult
+
+
+class DownloadResult(UploadResult):
+    """
+    The result of an attempted download. Keeps track of the files which
+    were downloaded, skipped because an identical copy was already present,
+    or failed, along with the throughput of the download.
+    """
+
+    @property
+    def elapsed(self):
+        """
+        The number of seconds the download took, or None if it is unknown.
+        """
+        return self._elapsed
+
+    @property
+    def total_bytes(self):
+        """
+        The total size of the files which were downloaded successfully.
+        """
+        return super(DownloadResult, self).total_bytes
+
+    @property
+    def files_per_second(self):
+        """
+        The number of files downloaded successfully per second, or None if
+        the duration of the download is unknown.
+        """
+        return super(DownloadResult, self).files_per_second
+
+    @property
+    def megabytes_per_second(self):
+        """
+        The number of megabytes (10^6 bytes) downloaded successfully per
+        second, or None if the duration of the download is unknown.
+        """
+        return super(DownloadResult, self).megabytes_per_second
+
+    def successful(self):
+        """
+        Indicates whether or not the entire download was successful.
+
+        :return: Whether or not the download was successful
+        :rtype: bool
+        """
+        return super(DownloadResult, self).successful()
+
+    def add_failure(self, filepath, reason):
+        """
+        Registers a file as a failure to download.
+
+        :param filepath: The local path the file was to be downloaded to.
+        :type filepath: str
+        :param reason: The reason the file failed to download
+        :type reason: str
+        """
+        super(DownloadResult, self).add_failure(filepath, reason)
+
+    def add_success(self, filepath, size=None):
+        """
+        Registers a file as successfully downloaded.
+
+        :param filepath: The local path of the downloaded file.
+        :type filepath: str
+        :param size: The size of the file, in bytes
+        :type size: int
+        """
+        super(DownloadResult, self).add_success(filepath, size)
+
+    def add_skipped(self, filepath, reason):
+        """
+        Registers a file which did not need to be downloaded.
+
+        :param filepath: The local path of the skipped file.
+        :type filepath: str
+        :param reason: The reason the file was skipped
+        :type reason: str
+        """
+        super(DownloadResult, self).add_skipped(filepath, reason)
+
+    def set_elapsed(self, seconds):
+        """
+        Records how long the download took.
+
+        :param seconds: The duration of the download, in seconds
+        :type seconds: float
+        """
+        super(DownloadResult, self).set_elapsed(seconds)
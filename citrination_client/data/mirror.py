@@ -0,0 +1,263 @@
+from citrination_client.data.dataset_file import DatasetFile
+from citrination_client.data.download_result import DownloadResult
+from citrination_client.data.streaming import file_md5
+from citrination_client.util.files import replace_file
+
+from six.moves.urllib.parse import urlparse, parse_qs
+import calendar
+import json
+import os
+import re
+import shutil
+import time
+
+DEFAULT_URL_TTL = 3600
+EXPIRY_MARGIN = 60
+REFRESH_BATCH_SIZE = 100
+
+
+class DatasetMirror(object):
+    """
+    A local copy of one version of a dataset.
+
+    The list of files in the version and their download URLs are cached on
+    disk, and URLs are only requested again for files whose links have
+    expired. Synced files are kept in a content-addressed store shared by
+    every mirror under the same root, so a file is downloaded once no matter
+    how many versions contain it, and reading a synced version again needs
+    no network access.
+    """
+
+    def __init__(self, data_client, dataset_id, version_number, root, clock=time.time):
+        """
+        Constructor.
+
+        :param data_client: The client used to list and download files
+        :type data_client: :class:`DataClient`
+        :param dataset_id: The ID of the dataset
+        :type dataset_id: int
+        :param version_number: The version of the dataset to mirror
+        :type version_number: int
+        :param root: The directory the mirror is stored in
+        :type root: str
+        :param clock: Returns the current time in seconds since the epoch,
+            which is compared against the expiry of download URLs
+        :type clock: function
+        """
+        if version_number is None:
+            raise ValueError("A mirror requires a version number, as the latest version changes")
+        self._client = data_client
+        self._dataset_id = dataset_id
+        self._version_number = version_number
+        self._root = str(root)
+        self._clock = clock
+        self._version_dir = os.path.join(self._root, "datasets", str(dataset_id), str(version_number))
+        self._manifest_path = os.path.join(self._version_dir, "manifest.json")
+        self._entries = None
+
+    @property
+    def dataset_id(self):
+        return self._dataset_id
+
+    @property
+    def version_number(self):
+        return self._version_number
+
+    @property
+    def root(self):
+        return self._root
+
+    def paths(self):
+        """
+        The paths of the files in the dataset version.
+
+        :return: The paths, sorted
+        :rtype: list of str
+        """
+        return sorted(self._manifest())
+
+    def dataset_files(self, paths=None):
+        """
+        Retrieves the files in the dataset version with unexpired download
+        URLs, requesting new URLs only for the files whose links expired.
+
+        :param paths: If supplied, only the files at these paths are returned
+        :type paths: list of str
+        :return: The dataset files
+        :rtype: list of :class:`DatasetFile`
+        """
+        entries = self._manifest()
+        paths = sorted(entries) if paths is None else [self._check_path(p) for p in paths]
+        self._refresh_urls(paths)
+        return [DatasetFile(path, entries[path]["url"]) for path in paths]
+
+    def sync(self, paths=None, max_workers=8, range_size=None):
+        """
+        Downloads the files in the dataset version which are not in the store.
+
+        :param paths: If supplied, only the files at these paths are synced
+        :type paths: list of str
+        :param max_workers: The maximum number of files downloaded concurrently
+        :type max_workers: int
+        :param range_size: If supplied, files larger than this many bytes are
+            split into ranges which are downloaded concurrently
+        :type range_size: int
+        :return: The result of the download, in which files that were already
+            in the store are skipped
+        :rtype: :class:`DownloadResult`
+        """
+        entries = self._manifest()
+        paths = sorted(entries) if paths is None else [self._check_path(p) for p in paths]
+        missing = [p for p in paths if self._stored_path(p) is None]
+
+        start = time.time()
+        sync_result = DownloadResult()
+        for path in paths:
+            if path not in missing:
+                sync_result.add_skipped(self._stored_path(path), "Already in store")
+        if not missing:
+            sync_result.set_elapsed(time.time() - start)
+            return sync_result
+
+        staging_dir = os.path.join(self._version_dir, "staging")
+        staging_paths = dict((p, os.path.join(staging_dir, p.lstrip("/"))) for p in missing)
+        download_result = self._client.download_files(self.dataset_files(missing), staging_dir,
+                                                      max_workers=max_workers, range_size=range_size)
+        failures = dict((f["path"], f["reason"]) for f in download_result.failures)
+        for path in missing:
+            staging_path = staging_paths[path]
+            if staging_path in failures:
+                sync_result.add_failure(path, failures[staging_path])
+            else:
+                size = os.path.getsize(staging_path)
+                sync_result.add_success(self._store(path, staging_path), size)
+        self._save()
+        sync_result.set_elapsed(time.time() - start)
+        return sync_result
+
+    def local_path(self, path):
+        """
+        The location of a file in the store, syncing it first if needed.
+
+        :param path: The path of the file in the dataset
+        :type path: str
+        :return: The local path of the file's contents
+        :rtype: str
+        """
+        self._check_path(path)
+        if self._stored_path(path) is None:
+            sync_result = self.sync([path], max_workers=1)
+            if not sync_result.successful():
+                raise IOError(sync_result.failures[0]["reason"])
+        return self._stored_path(path)
+
+    def open(self, path):
+        """
+        Opens a file of the dataset version for reading in binary mode,
+        syncing it first if needed.
+
+        :param path: The path of the file in the dataset
+        :type path: str
+        :return: The open file
+        """
+        return open(self.local_path(path), "rb")
+
+    def _manifest(self):
+        if self._entries is None:
+            if os.path.isfile(self._manifest_path):
+                with open(self._manifest_path) as f:
+                    self._entries = json.load(f)
+            else:
+                self._entries = {}
+                self._update_urls(self._list_files())
+                self._save()
+        return self._entries
+
+    def _check_path(self, path):
+        if path not in self._manifest():
+            raise ValueError("No file at path {} in version {} of dataset {}".format(
+                path, self._version_number, self._dataset_id))
+        return path
+
+    def _list_files(self, glob="."):
+        return self._client.get_dataset_files(self._dataset_id, glob, version_number=self._version_number)
+
+    def _refresh_urls(self, paths):
+        """
+        Requests new URLs for the files among ``paths`` whose URLs have
+        expired, listing only those files.
+        """
+        deadline = self._clock() + EXPIRY_MARGIN
+        expired = [p for p in paths if self._entries[p]["expires"] <= deadline]
+        if not expired:
+            return
+        if len(expired) == len(self._entries):
+            self._update_urls(self._list_files())
+        else:
+            for i in range(0, len(expired), REFRESH_BATCH_SIZE):
+                batch = expired[i:i + REFRESH_BATCH_SIZE]
+                glob = "^({})$".format("|".join(re.escape(p) for p in batch))
+                self._update_urls(self._list_files(glob))
+        self._save()
+
+    def _update_urls(self, dataset_files):
+        fetched_at = self._clock()
+        for dataset_file in dataset_files:
+            entry = self._entries.setdefault(dataset_file.path, {"md5": None})
+            entry["url"] = dataset_file.url
+            entry["expires"] = _url_expiry(dataset_file.url, fetched_at)
+
+    def _object_path(self, md5):
+        return os.path.join(self._root, "objects", md5[:2], md5)
+
+    def _stored_path(self, path):
+        md5 = self._entries[path]["md5"]
+        if md5 is None or not os.path.isfile(self._object_path(md5)):
+            return None
+        return self._object_path(md5)
+
+    def _store(self, path, staging_path):
+        """
+        Moves a downloaded file into the store under its MD5 digest.
+
+        :return: The path of the stored file
+        :rtype: str
+        """
+        md5 = file_md5(staging_path)
+        object_path = self._object_path(md5)
+        if os.path.isfile(object_path):
+            os.remove(staging_path)
+        else:
+            object_dir = os.path.dirname(object_path)
+            if not os.path.isdir(object_dir):
+                os.makedirs(object_dir)
+            shutil.move(staging_path, object_path)
+        self._entries[path]["md5"] = md5
+        return object_path
+
+    def _save(self):
+        if not os.path.isdir(self._version_dir):
+            os.makedirs(self._version_dir)
+        tmp_path = self._manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._entries, f)
+        replace_file(tmp_path, self._manifest_path)
+
+
+def _url_expiry(url, fetched_at, default_ttl=DEFAULT_URL_TTL):
+    """
+    The time at which a presigned URL expires, in seconds since the epoch.
+    Both signature version 4 (``X-Amz-Date`` and ``X-Amz-Expires``) and
+    version 2 (``Expires``) URLs are understood. Other URLs are assumed to
+    last ``default_ttl`` seconds from when they were fetched.
+    """
+    query = parse_qs(urlparse(url).query)
+    try:
+        if "X-Amz-Date" in query and "X-Amz-Expires" in query:
+            signed_at = calendar.timegm(time.strptime(query["X-Amz-Date"][0], "%Y%m%dT%H%M%SZ"))
+            return signed_at + int(query["X-Amz-Expires"][0])
+        if "Expires" in query:
+            return int(query["Expires"][0])
+    except ValueError:
+        pass
+    return fetched_at + default_ttl
@@ -0,0 +1,167 @@
+import sqlite3
+import threading
+import zlib
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def pif_cache_key(dataset_id, dataset_version, uid):
+    """
+    Builds the cache key for a PIF in a version of a dataset.
+
+    :param dataset_id: The ID of the dataset containing the PIF
+    :param dataset_version: The version of the dataset
+    :param uid: The uid of the PIF
+    :type uid: str
+    :return: The cache key
+    :rtype: tuple
+    """
+    return (str(dataset_id), str(dataset_version), str(uid))
+
+
+class PifCache(object):
+    """
+    A cache of PIFs stored in a sqlite database, keyed by dataset, dataset
+    version and uid. A PIF in a given version of a dataset never changes, so
+    cached PIFs are never stale.
+
+    PIFs are stored as compressed JSON and returned as JSON text, leaving it
+    to the caller to parse them only when they are used. When the compressed
+    PIFs take up more than the maximum size, the least recently used PIFs are
+    evicted.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Constructor.
+
+        :param path: The path of the sqlite database file
+        :type path: str
+        :param max_bytes: The maximum total size of the compressed PIFs
+        :type max_bytes: int
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pifs ("
+                "dataset_id TEXT NOT NULL, dataset_version TEXT NOT NULL, uid TEXT NOT NULL, "
+                "data BLOB NOT NULL, size INTEGER NOT NULL, last_used INTEGER NOT NULL, "
+                "PRIMARY KEY (dataset_id, dataset_version, uid))")
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS pifs_last_used ON pifs (last_used)")
+        self._clock, self._total_bytes = self._connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0), COALESCE(SUM(size), 0) FROM pifs").fetchone()
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @property
+    def total_bytes(self):
+        """
+        The total size of the compressed PIFs in the cache.
+        """
+        return self._total_bytes
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM pifs").fetchone()[0]
+
+    def get(self, dataset_id, dataset_version, uid):
+        """
+        Looks up a PIF.
+
+        :return: The JSON of the PIF, or None if it is not cached
+        :rtype: str
+        """
+        return self.get_many([pif_cache_key(dataset_id, dataset_version, uid)])[0]
+
+    def set(self, dataset_id, dataset_version, uid, pif_json):
+        """
+        Stores a PIF.
+
+        :param pif_json: The JSON of the PIF
+        :type pif_json: str
+        """
+        self.set_many([(pif_cache_key(dataset_id, dataset_version, uid), pif_json)])
+
+    def get_many(self, keys):
+        """
+        Looks up several PIFs.
+
+        :param keys: Keys built with :func:`pif_cache_key`
+        :type keys: list of tuple
+        :return: The JSON of each PIF, or None if it is not cached
+        :rtype: list of str
+        """
+        results = []
+        with self._lock, self._connection:
+            for key in keys:
+                row = self._connection.execute(
+                    "SELECT data FROM pifs WHERE dataset_id = ? AND dataset_version = ? AND uid = ?",
+                    key).fetchone()
+                if row is None:
+                    results.append(None)
+                    continue
+                self._clock += 1
+                self._connection.execute(
+                    "UPDATE pifs SET last_used = ? WHERE dataset_id = ? AND dataset_version = ? AND uid = ?",
+                    (self._clock,) + tuple(key))
+                results.append(zlib.decompress(bytes(row[0])).decode("utf-8"))
+        return results
+
+    def set_many(self, items):
+        """
+        Stores several PIFs, evicting the least recently used PIFs if the
+        cache grows past its maximum size.
+
+        :param items: Pairs of key and PIF JSON
+        :type items: list of (tuple, str)
+        """
+        with self._lock, self._connection:
+            for key, pif_json in items:
+                data = zlib.compress(pif_json.encode("utf-8"))
+                row = self._connection.execute(
+                    "SELECT size FROM pifs WHERE dataset_id = ? AND dataset_version = ? AND uid = ?",
+                    key).fetchone()
+                if row is not None:
+                    self._total_bytes -= row[0]
+                self._clock += 1
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO pifs (dataset_id, dataset_version, uid, data, size, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", tuple(key) + (sqlite3.Binary(data), len(data), self._clock))
+                self._total_bytes += len(data)
+            if self._total_bytes > self._max_bytes:
+                self._evict(self._total_bytes - self._max_bytes)
+
+    def _evict(self, excess):
+        evicted = []
+        freed = 0
+        for row in self._connection.execute(
+                "SELECT dataset_id, dataset_version, uid, size FROM pifs ORDER BY last_used"):
+            evicted.append(row[:3])
+            freed += row[3]
+            if freed >= excess:
+                break
+        self._connection.executemany(
+            "DELETE FROM pifs WHERE dataset_id = ? AND dataset_version = ? AND uid = ?", evicted)
+        self._total_bytes -= freed
+
+    def clear(self):
+        """
+        Removes every cached PIF.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM pifs")
+            self._total_bytes = 0
+
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+        with self._lock:
+            self._connection.close()
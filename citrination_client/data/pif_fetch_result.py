@@ -0,0 +1,41 @@
+class PifFetchResult(object):
+    """
+    The outcome of retrieving one PIF as part of a bulk request: either the
+    PIF, or the error which prevented it from being retrieved.
+    """
+
+    def __init__(self, uid, pif=None, error=None):
+        """
+        Constructor.
+
+        :param uid: The uid of the requested PIF
+        :type uid: str
+        :param pif: The retrieved PIF
+        :type pif: :class:`Pif`
+        :param error: The error raised retrieving the PIF
+        :type error: Exception
+        """
+        self._uid = uid
+        self._pif = pif
+        self._error = error
+
+    @property
+    def uid(self):
+        return self._uid
+
+    @property
+    def pif(self):
+        return self._pif
+
+    @property
+    def error(self):
+        return self._error
+
+    def successful(self):
+        """
+        Indicates whether or not the PIF was retrieved.
+
+        :return: Whether or not the PIF was retrieved
+        :rtype: bool
+        """
+        return self._error is None
@@ -0,0 +1,83 @@
+import hashlib
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class ChecksumReader(object):
+    """
+    Wraps a file so that it is read in chunks of a fixed size, computing the
+    MD5 digest of its contents as they are read. Passing a reader as the body
+    of a request streams the file without loading it into memory.
+    """
+
+    def __init__(self, f, size, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+        """
+        Constructor.
+
+        :param f: The file to read, opened in binary mode
+        :param size: The size of the file, in bytes
+        :type size: int
+        :param chunk_size: The number of bytes read at a time when iterating
+        :type chunk_size: int
+        :param progress: If supplied, called with the number of bytes read
+            after each read
+        :type progress: function
+        """
+        self._file = f
+        self._size = size
+        self._chunk_size = chunk_size
+        self._progress = progress
+        self._md5 = hashlib.md5()
+        self._bytes_read = 0
+
+    @property
+    def bytes_read(self):
+        return self._bytes_read
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            data = self._file.read()
+        else:
+            data = self._file.read(size)
+        if data:
+            self._md5.update(data)
+            self._bytes_read += len(data)
+            if self._progress is not None:
+                self._progress(len(data))
+        return data
+
+    def __iter__(self):
+        while True:
+            data = self.read(self._chunk_size)
+            if not data:
+                break
+            yield data
+
+    def __len__(self):
+        return self._size
+
+    def hexdigest(self):
+        """
+        :return: The MD5 digest of everything read so far, as hex
+        :rtype: str
+        """
+        return self._md5.hexdigest()
+
+
+def file_md5(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Computes the MD5 digest of a file, reading it in chunks.
+
+    :param path: The path of the file
+    :type path: str
+    :return: The digest, as hex
+    :rtype: str
+    """
+    md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            md5.update(data)
+    return md5.hexdigest()
@@ -0,0 +1,71 @@
+from citrination_client.data.streaming import file_md5
+from citrination_client.util.files import replace_file
+
+import json
+import os
+import threading
+
+
+class SyncManifest(object):
+    """
+    The sizes and MD5 digests of local files. Digests are only recomputed
+    for files whose size or modification time has changed since they were
+    last hashed, and the manifest can be saved to a file so that this holds
+    across runs.
+    """
+
+    def __init__(self, path=None):
+        """
+        Constructor.
+
+        :param path: The path of the file the manifest is loaded from and
+            saved to. If None, the manifest is kept in memory only.
+        :type path: str
+        """
+        self._path = str(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._entries = {}
+        if self._path is not None and os.path.isfile(self._path):
+            with open(self._path) as f:
+                self._entries = json.load(f)
+
+    @property
+    def path(self):
+        return self._path
+
+    def __len__(self):
+        return len(self._entries)
+
+    def entry(self, source_path):
+        """
+        Retrieves the size and digest of a file, hashing it if it has changed
+        since it was last seen.
+
+        :param source_path: The path of the file
+        :type source_path: str
+        :return: A dictionary with the "size" and "md5" of the file
+        :rtype: dict
+        """
+        key = os.path.abspath(source_path)
+        stat = os.stat(source_path)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+            return entry
+
+        entry = {"size": stat.st_size, "mtime": stat.st_mtime, "md5": file_md5(source_path)}
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def save(self):
+        """
+        Writes the manifest to its file. Does nothing for an in-memory manifest.
+        """
+        if self._path is None:
+            return
+        with self._lock:
+            tmp_path = self._path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._entries, f)
+            replace_file(tmp_path, self._path)
@@ -0,0 +1,223 @@
+from citrination_client.data import DataClient, DatasetFile, DownloadResult
+from citrination_client.base import RetryPolicy
+import hashlib
+import os
+import re
+import requests
+import requests_mock
+import threading
+import time
+
+site = "mock://citrination"
+no_sleep_policy = RetryPolicy(sleep=lambda seconds: None)
+storage = "mock://s3.amazonaws.com/bucket/"
+
+
+def _mock_storage(m, files, truncate=False):
+    """
+    Registers fake storage which serves ``files``, a dictionary from path to
+    contents, honouring Range headers. If ``truncate`` is set, every body
+    longer than a byte is cut off half way.
+    """
+    def get(request, context):
+        contents = files[request.path[len("/bucket/"):]]
+        context.headers["ETag"] = '"{}"'.format(hashlib.md5(contents).hexdigest())
+        match = re.match(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if match is None:
+            body = contents
+        else:
+            first, last = int(match.group(1)), int(match.group(2))
+            body = contents[first:last + 1]
+            context.status_code = 206
+            context.headers["Content-Range"] = "bytes {}-{}/{}".format(first, last, len(contents))
+        if truncate and len(body) > 1:
+            body = body[:len(body) // 2]
+        return body
+    m.get(requests_mock.ANY, content=get)
+
+
+def _dataset_files(files):
+    return [DatasetFile(path, storage + path) for path in sorted(files)]
+
+
+def _ranges_requested(m, path):
+    return [r.headers.get("Range") for r in m.request_history if r.path == "/bucket/" + path]
+
+
+def test_parallel_download(tmpdir):
+    """
+    Tests that every file is downloaded to its path under the destination
+    and that the result reports sizes and throughput
+    """
+    files = dict(("pifs/{}.json".format(i), b"x" * (i + 1)) for i in range(10))
+    client = DataClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_storage(m, files)
+        result = client.download_files(_dataset_files(files), str(tmpdir), max_workers=4)
+
+    assert isinstance(result, DownloadResult)
+    assert result.successful()
+    assert len(result.successes) == 10
+    assert result.total_bytes == sum(range(1, 11))
+    assert result.megabytes_per_second > 0
+    for path, contents in files.items():
+        assert tmpdir.join(path).read_binary() == contents
+    assert not [p for p in tmpdir.join("pifs").listdir() if ".part" in p.basename]
+
+
+def test_large_files_are_split_into_ranges(tmpdir):
+    """
+    Tests that a file larger than the range size is downloaded in ranges
+    and reassembled
+    """
+    files = {"big.bin": os.urandom(10)}
+    client = DataClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_storage(m, files)
+        result = client.download_files(_dataset_files(files), str(tmpdir), max_workers=3, range_size=4)
+        ranges = _ranges_requested(m, "big.bin")
+
+    assert result.successful()
+    assert tmpdir.join("big.bin").read_binary() == files["big.bin"]
+    assert sorted(ranges[1:]) == ["bytes=0-3", "bytes=4-7", "bytes=8-9"]
+
+
+def test_files_and_ranges_share_the_worker_limit(tmpdir):
+    """
+    Tests that no more than max_workers requests are in flight at once when
+    several files are each split into ranges
+    """
+    files = dict(("big{}.bin".format(i), os.urandom(12)) for i in range(4))
+    client = DataClient("key", site)
+    lock = threading.Lock()
+    in_flight = [0, 0]
+    session_get = client.session.get
+
+    def get(*args, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        try:
+            time.sleep(0.01)
+            return session_get(*args, **kwargs)
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    client.session.get = get
+    with requests_mock.mock() as m:
+        _mock_storage(m, files)
+        result = client.download_files(_dataset_files(files), str(tmpdir), max_workers=3, range_size=4)
+
+    assert result.successful()
+    assert in_flight[1] == 3
+    for path, contents in files.items():
+        assert tmpdir.join(path).read_binary() == contents
+
+
+def test_interrupted_download_resumes_from_part_file(tmpdir):
+    """
+    Tests that a download which was cut short is resumed from the bytes
+    already in its .part file the next time it is run
+    """
+    files = {"data.csv": b"0123456789" * 10}
+    with requests_mock.mock() as m:
+        _mock_storage(m, files, truncate=True)
+        no_retries = DataClient("key", site, retry_policy=RetryPolicy(max_attempts=1))
+        first = no_retries.download_files(_dataset_files(files), str(tmpdir))
+
+    assert not first.successful()
+    assert tmpdir.join("data.csv.part").size() == 50
+
+    with requests_mock.mock() as m:
+        _mock_storage(m, files)
+        second = DataClient("key", site).download_files(_dataset_files(files), str(tmpdir))
+        ranges = _ranges_requested(m, "data.csv")
+
+    assert second.successful()
+    assert ranges == ["bytes=0-0", "bytes=50-99"]
+    assert tmpdir.join("data.csv").read_binary() == files["data.csv"]
+    assert not tmpdir.join("data.csv.part").exists()
+    assert not tmpdir.join("data.csv.part.json").exists()
+
+
+def test_dropped_connections_are_resumed(tmpdir):
+    """
+    Tests that a range which is cut short is requested again from where it
+    stopped within the same download
+    """
+    files = {"data.csv": b"0123456789" * 4}
+    client = DataClient("key", site, retry_policy=no_sleep_policy)
+    with requests_mock.mock() as m:
+        _mock_storage(m, files, truncate=True)
+        result = client.download_files(_dataset_files(files), str(tmpdir))
+        ranges = _ranges_requested(m, "data.csv")
+
+    assert not result.successful()
+    assert ranges == ["bytes=0-0", "bytes=0-39", "bytes=20-39", "bytes=30-39", "bytes=35-39"]
+    assert tmpdir.join("data.csv.part").size() == 37
+
+
+def test_dropped_whole_file_downloads_are_retried(tmpdir):
+    """
+    Tests that a file which storage will not split into ranges is downloaded
+    again from the start when the connection drops part way through
+    """
+    contents = b"0123456789" * 4
+    client = DataClient("key", site, retry_policy=no_sleep_policy)
+    session_get = client.session.get
+    dropped = []
+
+    def get(url, headers=None, **kwargs):
+        response = session_get(url, headers=headers, **kwargs)
+        if "Range" not in headers and not dropped:
+            dropped.append(url)
+            def iter_content(chunk_size):
+                yield contents[:15]
+                raise requests.exceptions.ChunkedEncodingError()
+            response.iter_content = iter_content
+        return response
+
+    client.session.get = get
+    with requests_mock.mock() as m:
+        m.get(requests_mock.ANY, content=contents)
+        result = client.download_files(_dataset_files({"data.csv": contents}), str(tmpdir))
+        requests_made = len(m.request_history)
+
+    assert dropped
+    assert result.successful()
+    assert requests_made == 3
+    assert tmpdir.join("data.csv").read_binary() == contents
+
+
+def test_identical_files_are_skipped(tmpdir):
+    """
+    Tests that a file already present with the same size and checksum is
+    not downloaded again, while a file with different contents is
+    """
+    files = {"same.txt": b"same", "changed.txt": b"new!"}
+    tmpdir.join("same.txt").write_binary(b"same")
+    tmpdir.join("changed.txt").write_binary(b"old!")
+    client = DataClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_storage(m, files)
+        result = client.download_files(_dataset_files(files), str(tmpdir), max_workers=2)
+
+    assert [os.path.basename(s["path"]) for s in result.skipped] == ["same.txt"]
+    assert [os.path.basename(s["path"]) for s in result.successes] == ["changed.txt"]
+    assert tmpdir.join("changed.txt").read_binary() == b"new!"
+
+
+def test_failed_downloads_are_reported(tmpdir):
+    """
+    Tests that an error response is recorded as a failure instead of being
+    written to disk
+    """
+    client = DataClient("key", site)
+    with requests_mock.mock() as m:
+        m.get(requests_mock.ANY, status_code=403, text="<Error>AccessDenied</Error>")
+        result = client.download_files(DatasetFile("denied.txt", storage + "denied.txt"), str(tmpdir))
+
+    assert not result.successful()
+    assert "Failure to download" in result.failures[0]["reason"]
+    assert not tmpdir.join("denied.txt").exists()
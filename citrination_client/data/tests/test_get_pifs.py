@@ -0,0 +1,89 @@
+from citrination_client.data import DataClient, PifFetchResult
+from citrination_client.base.errors import CitrinationClientError
+from pypif import pif
+from pypif.obj import System
+import json
+import re
+import requests_mock
+
+site = "mock://citrination"
+search_url = site + "/api/search/pif_search"
+
+
+def _system(uid):
+    return System(uid=uid, names=["system " + uid])
+
+
+def _searched_uids(request):
+    filters = json.loads(request.body)["query"]["system"]["uid"]
+    return [f["equal"] for f in filters]
+
+
+def _mock_pifs(m, indexed, stored):
+    """
+    Registers a fake search which finds the uids in ``indexed`` and fake
+    PIF endpoints for the uids in ``stored``, for both the latest and a
+    specific version. Any other uid is not found.
+    """
+    def search(request, context):
+        hits = [{"id": uid + "/1", "system": json.dumps(_system(uid), cls=pif.PifEncoder)}
+                for uid in _searched_uids(request) if uid in indexed]
+        return {"results": {"took": 1, "totalNumHits": len(hits), "hits": hits}}
+    def get(request, context):
+        uid = request.path.rsplit("/", 1)[1]
+        if uid not in stored:
+            context.status_code = 404
+            return ""
+        return pif.dumps(_system(uid))
+    m.post(search_url, json=search)
+    m.get(re.compile(re.escape(site + "/api/datasets/1/")), text=get)
+
+
+def test_get_pifs_searches_before_fetching(tmpdir):
+    """
+    Tests that PIFs are looked up with batched searches, that PIFs missing
+    from search are fetched individually, and that results are returned in
+    input order with errors for PIFs which could not be retrieved
+    """
+    client = DataClient("key", site)
+    uids = ["a", "b", "c", "d", "e", "a"]
+    with requests_mock.mock() as m:
+        _mock_pifs(m, indexed=["a", "b", "c", "d"], stored=["e"])
+        results = client.get_pifs(1, uids + ["missing"], max_workers=3, batch_size=2)
+        searches = [_searched_uids(r) for r in m.request_history if r.method == "POST"]
+        gets = sorted(r.path.rsplit("/", 1)[1] for r in m.request_history if r.method == "GET")
+
+    assert all(isinstance(r, PifFetchResult) for r in results)
+    assert [r.uid for r in results] == uids + ["missing"]
+    assert [r.pif.uid for r in results[:-1]] == uids
+    assert not results[-1].successful()
+    assert isinstance(results[-1].error, CitrinationClientError)
+    assert sorted(searches) == [["a", "b"], ["c", "d"], ["e", "missing"]]
+    assert gets == ["e", "missing"]
+
+
+def test_get_pifs_for_a_version_fetches_each_pif(tmpdir):
+    """
+    Tests that PIFs of a specific version are fetched individually, since
+    search only covers the latest version
+    """
+    client = DataClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_pifs(m, indexed=[], stored=["a", "b"])
+        results = client.get_pifs(1, ["b", "a"], dataset_version=2)
+        paths = sorted(r.path for r in m.request_history)
+
+    assert [r.pif.uid for r in results] == ["b", "a"]
+    assert paths == ["/api/datasets/1/version/2/pif/a", "/api/datasets/1/version/2/pif/b"]
+
+
+def test_get_pif_for_a_version_requests_the_versioned_route():
+    """
+    Tests that a versioned PIF is requested with the version before the uid
+    """
+    client = DataClient("key", site)
+    with requests_mock.mock() as m:
+        m.get(site + "/api/datasets/1/version/2/pif/abc", text=pif.dumps(_system("abc")))
+        system = client.get_pif(1, "abc", dataset_version=2)
+
+    assert system.uid == "abc"
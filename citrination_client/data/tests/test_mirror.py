@@ -0,0 +1,107 @@
+from citrination_client.data import DataClient, DatasetMirror
+from citrination_client.data.mirror import _url_expiry
+import calendar
+import json
+import re
+import requests_mock
+
+site = "mock://citrination"
+files_url = site + "/api/datasets/1/download_files"
+signed_at = calendar.timegm((2018, 5, 1, 12, 0, 0))
+
+
+def _presigned_url(path, expires_in):
+    return "mock://s3.amazonaws.com/bucket/{}?X-Amz-Date=20180501T120000Z&X-Amz-Expires={}&X-Amz-Signature=abc".format(
+        path, expires_in)
+
+
+def _mock_version(m, files, expires_in=None):
+    """
+    Registers a fake listing of version 2 of dataset 1 which returns the
+    files in ``files``, a dictionary from path to contents, matching the
+    requested glob, and fake storage serving their contents. URLs expire
+    after the number of seconds given for their path in ``expires_in``, or
+    an hour.
+    """
+    expires_in = expires_in or {}
+    def listing(request, context):
+        glob = json.loads(request.body)["download_request"]["glob"]
+        matched = [p for p in sorted(files) if re.search(glob, p)]
+        return {"versions": [{"number": 2, "files": [
+            {"filename": p, "url": _presigned_url(p, expires_in.get(p, 3600))} for p in matched
+        ]}]}
+    m.post(files_url, json=listing)
+    for path, contents in files.items():
+        m.get(re.compile(re.escape("mock://s3.amazonaws.com/bucket/" + path) + r"\?"), content=contents)
+
+
+def _requested_globs(m):
+    return [json.loads(r.body)["download_request"]["glob"] for r in m.request_history if r.url == files_url]
+
+
+def test_url_expiry():
+    """
+    Tests that the expiry of presigned URLs is read from their query string
+    """
+    assert _url_expiry(_presigned_url("a.json", 600), 0) == signed_at + 600
+    assert _url_expiry("https://bucket.s3.amazonaws.com/a.json?Expires=1525176000&Signature=abc", 0) == 1525176000
+    assert _url_expiry("https://example.com/a.json", 100) == 3700
+
+
+def test_synced_version_is_read_without_network(tmpdir):
+    """
+    Tests that a synced version can be read by a new mirror without any
+    requests being made
+    """
+    files = {"a.json": b"{}", "b/c.csv": b"1,2,3"}
+    client = DataClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_version(m, files)
+        result = DatasetMirror(client, 1, 2, str(tmpdir), clock=lambda: signed_at).sync(max_workers=2)
+
+    assert result.successful()
+    assert len(result.successes) == 2
+
+    with requests_mock.mock() as m:
+        mirror = DatasetMirror(client, 1, 2, str(tmpdir), clock=lambda: signed_at)
+        second = mirror.sync()
+        with mirror.open("b/c.csv") as f:
+            contents = f.read()
+        assert m.request_history == []
+
+    assert len(second.skipped) == 2
+    assert mirror.paths() == ["a.json", "b/c.csv"]
+    assert contents == b"1,2,3"
+
+
+def test_only_expired_urls_are_refreshed(tmpdir):
+    """
+    Tests that URLs are requested again only for files whose URLs expired
+    """
+    files = {"short.json": b"1", "long.json": b"2", "x+y.json": b"3"}
+    client = DataClient("key", site)
+    now = [signed_at]
+    with requests_mock.mock() as m:
+        _mock_version(m, files, expires_in={"short.json": 600, "x+y.json": 600})
+        mirror = DatasetMirror(client, 1, 2, str(tmpdir), clock=lambda: now[0])
+        mirror.dataset_files()
+        now[0] = signed_at + 1200
+        dataset_files = mirror.dataset_files()
+
+    assert _requested_globs(m) == [".", r"^(short\.json|x\+y\.json)$"]
+    assert [f.path for f in dataset_files] == ["long.json", "short.json", "x+y.json"]
+
+
+def test_identical_files_are_stored_once(tmpdir):
+    """
+    Tests that files with the same contents share one copy in the store
+    """
+    files = {"a.json": b"same", "b.json": b"same"}
+    client = DataClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_version(m, files)
+        mirror = DatasetMirror(client, 1, 2, str(tmpdir), clock=lambda: signed_at)
+        mirror.sync()
+
+    assert mirror.local_path("a.json") == mirror.local_path("b.json")
+    assert len(tmpdir.join("objects").listdir()) == 1
@@ -0,0 +1,62 @@
+from citrination_client.data import DataClient, PifCache
+from pypif import pif
+from pypif.obj import System
+import requests_mock
+
+site = "mock://citrination"
+
+
+def test_pifs_are_kept_between_instances(tmpdir):
+    """
+    Tests that cached PIFs are returned as the JSON they were stored as,
+    including by a new cache opened on the same file
+    """
+    path = str(tmpdir.join("pifs.sqlite"))
+    cache = PifCache(path)
+    cache.set(1, 2, "abc", '{"uid": "abc"}')
+    assert cache.get(1, 2, "abc") == '{"uid": "abc"}'
+    assert cache.get(1, 3, "abc") is None
+    cache.close()
+
+    reopened = PifCache(path)
+    assert reopened.get("1", "2", "abc") == '{"uid": "abc"}'
+    assert reopened.total_bytes > 0
+
+
+def test_least_recently_used_pifs_are_evicted(tmpdir):
+    """
+    Tests that the least recently used PIFs are evicted once the compressed
+    PIFs exceed the maximum size
+    """
+    entry_size = PifCache(str(tmpdir.join("probe.sqlite")))
+    entry_size.set(1, 1, "probe", '{"uid": "0"}')
+    cache = PifCache(str(tmpdir.join("pifs.sqlite")), max_bytes=entry_size.total_bytes * 2)
+
+    cache.set(1, 1, "a", '{"uid": "0"}')
+    cache.set(1, 1, "b", '{"uid": "1"}')
+    cache.get(1, 1, "a")
+    cache.set(1, 1, "c", '{"uid": "2"}')
+
+    assert len(cache) == 2
+    assert cache.get(1, 1, "b") is None
+    assert cache.get(1, 1, "a") is not None
+    assert cache.total_bytes <= cache.max_bytes
+
+
+def test_get_pif_uses_cache_for_versioned_pifs(tmpdir):
+    """
+    Tests that a versioned PIF is only requested once, while the latest
+    version of a PIF is always requested
+    """
+    client = DataClient("key", site, pif_cache=PifCache(str(tmpdir.join("pifs.sqlite"))))
+    with requests_mock.mock() as m:
+        m.get(site + "/api/datasets/1/version/2/pif/abc", text=pif.dumps(System(uid="abc")))
+        m.get(site + "/api/datasets/1/pif/abc", text=pif.dumps(System(uid="abc")))
+        first = client.get_pif(1, "abc", 2)
+        second = client.get_pif(1, "abc", 2)
+        client.get_pif(1, "abc")
+        client.get_pif(1, "abc")
+        paths = [r.path for r in m.request_history]
+
+    assert first.uid == second.uid == "abc"
+    assert paths == ["/api/datasets/1/version/2/pif/abc", "/api/datasets/1/pif/abc", "/api/datasets/1/pif/abc"]
@@ -0,0 +1,188 @@
+from citrination_client.data import DataClient, UploadJournal, SyncManifest
+from citrination_client.base import RetryPolicy
+import hashlib
+import json
+import os
+import requests_mock
+
+site = "mock://citrination"
+no_sleep_policy = RetryPolicy(sleep=lambda seconds: None)
+presign_url = site + "/api/data_sets/1/upload"
+s3_url = "mock://s3.amazonaws.com/bucket"
+
+
+def _mock_upload(m, fail_paths=(), corrupt_first=()):
+    """
+    Registers fake presign, S3 and update file endpoints. The S3 PUT fails
+    for any file whose destination path ends with one of ``fail_paths``, and
+    returns a wrong ETag the first time a path ending with one of
+    ``corrupt_first`` is sent.
+    """
+    corrupted = set()
+    def presign(request, context):
+        dest_path = json.loads(request.body)["dest_path"]
+        return {
+            "url": {"scheme": "mock", "host": "s3.amazonaws.com", "path": "/bucket/" + dest_path, "query": "sig=1"},
+            "required_headers": {},
+            "bucket": "bucket",
+            "file_id": 7
+        }
+    def put(request, context):
+        if any(request.path.endswith(p) for p in fail_paths):
+            context.status_code = 500
+            return ""
+        body = request.body if isinstance(request.body, bytes) else b"".join(request.body)
+        etag = hashlib.md5(body).hexdigest()
+        if any(request.path.endswith(p) for p in corrupt_first) and request.path not in corrupted:
+            corrupted.add(request.path)
+            etag = hashlib.md5(b"corrupted").hexdigest()
+        context.headers["ETag"] = '"{}"'.format(etag)
+        return ""
+    m.post(presign_url, json=presign)
+    m.put(requests_mock.ANY, text=put)
+    m.post(site + "/api/data_sets/update_file/7", json={})
+
+
+def _make_files(tmpdir, count):
+    directory = tmpdir.mkdir("pifs")
+    for i in range(count):
+        directory.join("{}.json".format(i)).write("x" * (i + 1))
+    return str(directory)
+
+
+def test_parallel_directory_upload(tmpdir):
+    """
+    Tests that every file in a directory is uploaded and that the result
+    reports sizes and throughput
+    """
+    client = DataClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_upload(m)
+        result = client.upload(1, _make_files(tmpdir, 25), "dest", max_workers=4)
+        puts = [r for r in m.request_history if r.method == "PUT"]
+
+    assert result.successful()
+    assert len(result.successes) == 25
+    assert len(puts) == 25
+    assert result.total_bytes == sum(range(1, 26))
+    assert result.files_per_second > 0
+    assert result.megabytes_per_second > 0
+    assert sorted(os.path.basename(r.path) for r in puts) == sorted("{}.json".format(i) for i in range(25))
+
+
+def test_failed_files_are_reported(tmpdir):
+    """
+    Tests that a file which fails to upload is recorded as a failure without
+    stopping the other uploads
+    """
+    client = DataClient("key", site, retry_policy=no_sleep_policy)
+    with requests_mock.mock() as m:
+        _mock_upload(m, fail_paths=("3.json",))
+        result = client.upload(1, _make_files(tmpdir, 5), "dest", max_workers=2)
+
+    assert not result.successful()
+    assert len(result.successes) == 4
+    assert [os.path.basename(f["path"]) for f in result.failures] == ["3.json"]
+    assert "Failure to upload" in result.failures[0]["reason"]
+
+
+def test_checksum_mismatch_is_resent(tmpdir):
+    """
+    Tests that a file is sent again when the ETag returned by storage does
+    not match the digest of its contents
+    """
+    client = DataClient("key", site, retry_policy=no_sleep_policy)
+    with requests_mock.mock() as m:
+        _mock_upload(m, corrupt_first=("2.json",))
+        result = client.upload(1, _make_files(tmpdir, 3), "dest")
+        puts = [r for r in m.request_history if r.method == "PUT"]
+
+    assert result.successful()
+    assert len(puts) == 4
+
+
+def test_interrupted_upload_resumes_from_journal(tmpdir):
+    """
+    Tests that rerunning an upload with a journal skips the files which were
+    already uploaded, finishes registering files which were sent but not
+    registered, and removes the journal once the upload succeeds
+    """
+    source = _make_files(tmpdir, 4)
+    journal_path = str(tmpdir.join("upload.journal"))
+    client = DataClient("key", site, retry_policy=no_sleep_policy)
+
+    with requests_mock.mock() as m:
+        _mock_upload(m)
+        m.post(site + "/api/data_sets/update_file/7", [{"json": {}}, {"json": {}}, {"status_code": 400}])
+        first = client.upload(1, source, "dest", journal=journal_path)
+
+    assert len(first.failures) == 2
+    journal = UploadJournal(journal_path)
+    assert len(journal) == 4
+
+    with requests_mock.mock() as m:
+        _mock_upload(m)
+        second = client.upload(1, source, "dest", journal=journal_path)
+        methods = [r.method for r in m.request_history]
+
+    assert second.successful()
+    assert methods.count("PUT") == 0
+    assert methods.count("POST") == 2
+    assert not os.path.exists(journal_path)
+
+
+def _mock_remote_files(m, files):
+    """
+    Registers a fake listing of the latest dataset version containing
+    ``files``, a dictionary from path to contents, and answers ranged GETs
+    for each file with its size and MD5 ETag.
+    """
+    listing = []
+    for path, contents in files.items():
+        url = "mock://s3.amazonaws.com/stored/" + path
+        listing.append({"filename": path, "url": url})
+        m.get(url, status_code=206, content=contents[:1], headers={
+            "ETag": '"{}"'.format(hashlib.md5(contents).hexdigest()),
+            "Content-Range": "bytes 0-0/{}".format(len(contents))
+        })
+    m.post(site + "/api/datasets/1/download_files", json={"versions": [{"number": 1, "files": listing}]})
+
+
+def test_upload_sync_uploads_only_changed_files(tmpdir):
+    """
+    Tests that a sync uploads files which are missing or differ from the
+    copies in the dataset and skips the rest
+    """
+    source = _make_files(tmpdir, 4)
+    manifest_path = str(tmpdir.join("sync.manifest"))
+    remote = {
+        "dest/pifs/0.json": b"x",
+        "dest/pifs/1.json": b"xx",
+        "dest/pifs/2.json": b"yyy",
+    }
+    client = DataClient("key", site, retry_policy=no_sleep_policy)
+    with requests_mock.mock() as m:
+        _mock_remote_files(m, remote)
+        _mock_upload(m)
+        result = client.upload_sync(1, source, "dest", max_workers=3, manifest=manifest_path)
+        puts = [r for r in m.request_history if r.method == "PUT"]
+
+    assert result.successful()
+    assert sorted(os.path.basename(s["path"]) for s in result.skipped) == ["0.json", "1.json"]
+    assert sorted(os.path.basename(r.path) for r in puts) == ["2.json", "3.json"]
+    assert len(SyncManifest(manifest_path)) == 3
+
+
+def test_upload_sync_of_new_dataset_uploads_everything(tmpdir):
+    """
+    Tests that every file is uploaded when the dataset has no files yet
+    """
+    client = DataClient("key", site, retry_policy=no_sleep_policy)
+    with requests_mock.mock() as m:
+        m.post(site + "/api/datasets/1/download_files", json={"versions": []})
+        _mock_upload(m)
+        result = client.upload_sync(1, _make_files(tmpdir, 3), "dest")
+
+    assert result.successful()
+    assert len(result.successes) == 3
+    assert result.skipped == []
@@ -42,4 +42,30 @@ def test_cant_write_lists():
         ur.failures = "asdf"
         assert False
     except AttributeError:
-        assert True
\ No newline at end of file
+        assert True
+
+def test_throughput():
+    """
+    Tests that throughput is computed from the sizes of the successful
+    uploads and the elapsed time
+    """
+    ur = UploadResult()
+    assert ur.files_per_second is None
+    ur.add_success("a.json", 3000000)
+    ur.add_success("b.json", 1000000)
+    ur.add_failure("c.json", "bad file")
+    ur.set_elapsed(2.0)
+    assert ur.total_bytes == 4000000
+    assert ur.files_per_second == 1.0
+    assert ur.megabytes_per_second == 2.0
+
+
+def test_skipped():
+    """
+    Tests that skipped files are recorded without affecting success
+    """
+    ur = UploadResult()
+    ur.add_skipped("a.json", "Unchanged")
+    assert ur.successful()
+    assert ur.successes == []
+    assert ur.skipped == [{"path": "a.json", "reason": "Unchanged"}]
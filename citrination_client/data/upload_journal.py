@@ -0,0 +1,140 @@
+from citrination_client.util.files import replace_file
+
+import json
+import os
+import threading
+
+UPLOADED = "uploaded"
+REGISTERED = "registered"
+
+
+class UploadJournal(object):
+    """
+    A local record of the progress of an upload, so that an interrupted
+    upload can be resumed without re-sending the files which were already
+    acknowledged.
+
+    Each file moves through two stages: ``uploaded`` once storage has
+    acknowledged its contents, and ``registered`` once Citrination has been
+    told about the uploaded object. Progress is appended to the journal file
+    as it happens, so it survives the process being killed.
+    """
+
+    def __init__(self, path):
+        """
+        Constructor.
+
+        :param path: The path of the journal file. It is created if it does
+            not exist.
+        :type path: str
+        """
+        self._path = str(path)
+        self._lock = threading.Lock()
+        self._entries = {}
+        if os.path.isfile(self._path):
+            self._load()
+
+    @property
+    def path(self):
+        return self._path
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, dataset_id, dest_path, source_path):
+        """
+        Retrieves the progress of a file, if the file has not changed since
+        it was recorded.
+
+        :param dataset_id: The ID of the dataset the file is uploaded to
+        :param dest_path: The path of the file in the dataset
+        :type dest_path: str
+        :param source_path: The local path of the file
+        :type source_path: str
+        :return: The recorded progress, or None if there is none or the file
+            has since changed
+        :rtype: dict
+        """
+        with self._lock:
+            entry = self._entries.get(_key(dataset_id, dest_path))
+        if entry is None or entry.get("fingerprint") != _fingerprint(source_path):
+            return None
+        return entry
+
+    def record(self, dataset_id, dest_path, source_path, stage, **details):
+        """
+        Records that a file has reached a stage of its upload.
+
+        :param dataset_id: The ID of the dataset the file is uploaded to
+        :param dest_path: The path of the file in the dataset
+        :type dest_path: str
+        :param source_path: The local path of the file
+        :type source_path: str
+        :param stage: Either ``uploaded`` or ``registered``
+        :type stage: str
+        :param details: Anything needed to finish the upload from this stage
+        """
+        entry = dict(details)
+        entry["stage"] = stage
+        entry["fingerprint"] = _fingerprint(source_path)
+        key = _key(dataset_id, dest_path)
+        with self._lock:
+            self._entries[key] = entry
+            self._append({"key": key, "entry": entry})
+
+    def remove(self, dataset_id, dest_path):
+        """
+        Forgets the progress of a file.
+        """
+        key = _key(dataset_id, dest_path)
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._append({"key": key, "entry": None})
+
+    def clear(self):
+        """
+        Forgets every file and deletes the journal file.
+        """
+        with self._lock:
+            self._entries.clear()
+            if os.path.isfile(self._path):
+                os.remove(self._path)
+
+    def compact(self):
+        """
+        Rewrites the journal file with only the current progress of each file.
+        """
+        with self._lock:
+            tmp_path = self._path + ".tmp"
+            with open(tmp_path, "w") as f:
+                for key, entry in self._entries.items():
+                    f.write(json.dumps({"key": key, "entry": entry}) + "\n")
+            replace_file(tmp_path, self._path)
+
+    def _append(self, record):
+        with open(self._path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _load(self):
+        with open(self._path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A line cut short when the process was interrupted
+                    continue
+                if record["entry"] is None:
+                    self._entries.pop(record["key"], None)
+                else:
+                    self._entries[record["key"]] = record["entry"]
+
+
+def _key(dataset_id, dest_path):
+    return "{}:{}".format(dataset_id, dest_path)
+
+
+def _fingerprint(source_path):
+    stat = os.stat(source_path)
+    return [os.path.abspath(source_path), stat.st_size, stat.st_mtime]
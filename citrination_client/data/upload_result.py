@@ -11,6 +11,8 @@ class UploadResult(object):
         """
         self._failures = []
         self._successes = []
+        self._skipped = []
+        self._elapsed = None
 
     @property
     def failures(self):
@@ -20,6 +22,44 @@ class UploadResult(object):
     def successes(self):
         return self._successes
 
+    @property
+    def skipped(self):
+        return self._skipped
+
+    @property
+    def elapsed(self):
+        """
+        The number of seconds the upload took, or None if it is unknown.
+        """
+        return self._elapsed
+
+    @property
+    def total_bytes(self):
+        """
+        The total size of the files which were uploaded successfully.
+        """
+        return sum(s.get("size") or 0 for s in self._successes)
+
+    @property
+    def files_per_second(self):
+        """
+        The number of files uploaded successfully per second, or None if the
+        duration of the upload is unknown.
+        """
+        if not self._elapsed:
+            return None
+        return len(self._successes) / self._elapsed
+
+    @property
+    def megabytes_per_second(self):
+        """
+        The number of megabytes (10^6 bytes) uploaded successfully per
+        second, or None if the duration of the upload is unknown.
+        """
+        if not self._elapsed:
+            return None
+        return self.total_bytes / 1e6 / self._elapsed
+
     def successful(self):
         """
         Indicates whether or not the entire upload was successful.
@@ -43,13 +83,40 @@ class UploadResult(object):
                 "reason": reason
             })
 
-    def add_success(self, filepath):
+    def add_success(self, filepath, size=None):
         """
         Registers a file as successfully uploaded.
 
         :param filepath: The path to the successfully uploaded file.
         :type filepath: str
+        :param size: The size of the file, in bytes
+        :type size: int
+        """
+        success = {"path": filepath}
+        if size is not None:
+            success["size"] = size
+        self._successes.append(success)
+
+    def add_skipped(self, filepath, reason):
+        """
+        Registers a file which did not need to be uploaded.
+
+        :param filepath: The path to the skipped file.
+        :type filepath: str
+        :param reason: The reason the file was skipped
+        :type reason: str
         """
-        self._successes.append({
-                "path": filepath
-            })
\ No newline at end of file
+        self._skipped.append({
+                "path": filepath,
+                "reason": reason
+            })
+
+    def set_elapsed(self, seconds):
+        """
+        Records how long the upload took.
+
+        :param seconds: The duration of the upload, in seconds
+        :type seconds: float
+        """
+        self._elapsed = seconds
+
@@ -1,10 +1,78 @@
-from citrination_client.models.event import Event
-from citrination_client.models.service_status import ServiceStatus
-from citrination_client.models.predicted_value import PredictedValue
-from citrination_client.models.prediction_result import PredictionResult
-from citrination_client.models.projection import Projection
-from citrination_client.models.tsne import Tsne
-from citrination_client.models.data_view_status import DataViewStatus
-from citrination_client.models.columns import *
-from citrination_client.models.client import ModelsClient
-from citrination_client.models.design import *
+from citrination_client.util.lazy import lazy_attributes
+
+# Submodules are attributes of the package too, imported when first accessed
+_submodules = {
+    "alloy_composition": "citrination_client.models.columns.alloy_composition",
+    "base": "citrination_client.models.design.constraints.base",
+    "categorical": "citrination_client.models.design.constraints.categorical",
+    "client": "citrination_client.models.client",
+    "columns": "citrination_client.models.columns",
+    "constraints": "citrination_client.models.design.constraints",
+    "data_view": "citrination_client.models.data_view",
+    "data_view_status": "citrination_client.models.data_view_status",
+    "descriptor_converter": "citrination_client.models.columns.descriptor_converter",
+    "design": "citrination_client.models.design",
+    "design_results": "citrination_client.models.design.design_results",
+    "design_run": "citrination_client.models.design.design_run",
+    "elemental_composition": "citrination_client.models.design.constraints.elemental_composition",
+    "elemental_inclusion": "citrination_client.models.design.constraints.elemental_inclusion",
+    "event": "citrination_client.models.event",
+    "inorganic_chemical_formula": "citrination_client.models.columns.inorganic_chemical_formula",
+    "monitor": "citrination_client.models.design.monitor",
+    "organic_chemical_formula": "citrination_client.models.columns.organic_chemical_formula",
+    "predicted_value": "citrination_client.models.predicted_value",
+    "prediction_cache": "citrination_client.models.prediction_cache",
+    "prediction_result": "citrination_client.models.prediction_result",
+    "prediction_table": "citrination_client.models.prediction_table",
+    "process_status": "citrination_client.models.design.process_status",
+    "projection": "citrination_client.models.projection",
+    "real": "citrination_client.models.columns.real",
+    "real_range": "citrination_client.models.design.constraints.real_range",
+    "real_value": "citrination_client.models.design.constraints.real_value",
+    "routes": "citrination_client.models.routes",
+    "service_status": "citrination_client.models.service_status",
+    "target": "citrination_client.models.design.target",
+    "tsne": "citrination_client.models.tsne",
+    "vector": "citrination_client.models.columns.vector"
+}
+
+# Attributes are imported from their modules when first accessed
+lazy_attributes(globals(), {
+    "Event": "citrination_client.models.event",
+    "ServiceStatus": "citrination_client.models.service_status",
+    "PredictedValue": "citrination_client.models.predicted_value",
+    "PredictionResult": "citrination_client.models.prediction_result",
+    "PredictionTable": "citrination_client.models.prediction_table",
+    "PredictionColumn": "citrination_client.models.prediction_table",
+    "PredictionRow": "citrination_client.models.prediction_table",
+    "BasePredictionCache": "citrination_client.models.prediction_cache",
+    "PredictionCache": "citrination_client.models.prediction_cache",
+    "SqlitePredictionCache": "citrination_client.models.prediction_cache",
+    "Projection": "citrination_client.models.projection",
+    "Tsne": "citrination_client.models.tsne",
+    "DataViewStatus": "citrination_client.models.data_view_status",
+    "ModelsClient": "citrination_client.models.client",
+    "BaseColumn": "citrination_client.models.columns",
+    "CategoricalColumn": "citrination_client.models.columns",
+    "RealColumn": "citrination_client.models.columns",
+    "VectorColumn": "citrination_client.models.columns",
+    "OrganicChemicalFormulaColumn": "citrination_client.models.columns",
+    "InorganicChemicalFormulaColumn": "citrination_client.models.columns",
+    "AlloyCompositionColumn": "citrination_client.models.columns",
+    "DescriptorConverter": "citrination_client.models.columns",
+    "DesignRun": "citrination_client.models.design",
+    "ProcessStatus": "citrination_client.models.design",
+    "DesignResults": "citrination_client.models.design",
+    "Target": "citrination_client.models.design",
+    "DesignRunMonitor": "citrination_client.models.design",
+    "MonitoredDesignRun": "citrination_client.models.design",
+    "PollPolicy": "citrination_client.models.design",
+    "BaseConstraint": "citrination_client.models.design",
+    "RealValueConstraint": "citrination_client.models.design",
+    "RealRangeConstraint": "citrination_client.models.design",
+    "CategoricalConstraint": "citrination_client.models.design",
+    "ElementalInclusionConstraint": "citrination_client.models.design",
+    "ElementalCompositionConstraint": "citrination_client.models.design"
+}, _submodules)
+
+del lazy_attributes
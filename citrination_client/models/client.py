@@ -1,25 +1,65 @@
 from citrination_client.base.base_client import BaseClient
-from citrination_client.models import *
-from citrination_client.models.design import *
+from citrination_client.models.data_view_status import DataViewStatus
+from citrination_client.models.design import DesignResults, DesignRun, DesignRunMonitor, ProcessStatus
+from citrination_client.models.predicted_value import PredictedValue
+from citrination_client.models.prediction_result import PredictionResult
+from citrination_client.models.prediction_table import PredictionTable
+from citrination_client.models.projection import Projection
+from citrination_client.models.service_status import ServiceStatus
+from citrination_client.models.tsne import Tsne
 from citrination_client.models import routes as routes
 from citrination_client.base.errors import CitrinationClientError
 from citrination_client.data import Dataset
 from citrination_client.models.data_view import DataView
 from citrination_client.models.columns.column_factory import ColumnFactory
+from citrination_client.models.prediction_cache import prediction_cache_key
 
-import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PREDICT_CHUNK_SIZE = 1000
 
 class ModelsClient(BaseClient):
     """
     A client that encapsulates interactions with models on Citrination.
     """
 
-    def __init__(self, api_key, webserver_host="https://citrination.com", suppress_warnings=False):
+    def __init__(self, api_key, webserver_host="https://citrination.com", suppress_warnings=False, session=None,
+                 prediction_cache=None, retry_policy=None, json_backend=None):
+        """
+        Constructor.
+
+        :param api_key: A users API key, as a string
+        :type api_key: str
+        :param webserver_host: The base URL of the citrination site, e.g. https://citrination.com
+        :type webserver_host: str
+        :param suppress_warnings: Whether or not usage warnings should be
+            printed to stdout
+        :type suppress_warnings: bool
+        :param session: The HTTP session to make requests with
+        :type session: requests.Session
+        :param prediction_cache: If supplied, predictions are looked up in
+            this cache and only candidates missing from it are sent to
+            Citrination
+        :type prediction_cache: :class:`BasePredictionCache`
+        :param retry_policy: The policy used to retry rate limited and failed
+            requests
+        :type retry_policy: :class:`RetryPolicy`
+        :param json_backend: The backend used to encode request bodies and
+            decode response bodies
+        :type json_backend: :class:`JsonBackend`
+        """
         members = [
             "tsne",
-            "predict"
+            "predict",
+            "predict_batch",
+            "predict_table",
+            "invalidate_prediction_cache"
         ]
-        super(ModelsClient, self).__init__(api_key, webserver_host, members, suppress_warnings=suppress_warnings)
+        super(ModelsClient, self).__init__(api_key, webserver_host, members, suppress_warnings=suppress_warnings,
+                                          session=session, retry_policy=retry_policy,
+                                          json_backend=json_backend)
+        self.prediction_cache = prediction_cache
 
     def tsne(self, data_view_id):
         """
@@ -30,20 +70,7 @@ class ModelsClient(BaseClient):
         :return: The TSNE analysis
         :rtype: :class:`Tsne`
         """
-        analysis = self._data_analysis(data_view_id)
-        projections = analysis['projections']
-        tsne = Tsne()
-        for k, v in projections.items():
-            projection = Projection(
-                xs=v['x'],
-                ys=v['y'],
-                responses=v['label'],
-                tags=v['inputs'],
-                uids=v['uid']
-            )
-            tsne.add_projection(k, projection)
-
-        return tsne
+        return _tsne_from_analysis(self._data_analysis(data_view_id))
 
     def predict(self, data_view_id, candidates, method="scalar", use_prior=True):
         """
@@ -61,17 +88,177 @@ class ModelsClient(BaseClient):
         :return: The results of the prediction
         :rtype: list of :class:`PredictionResult`
         """
-        body = self._get_predict_body(candidates, method, use_prior)
-        failure_message = "Error while making prediction for data view {}".format(data_view_id)
-        response_dict = self._get_success_json(
-            self._post_json(routes.data_view_predict(data_view_id), data=body, failure_message=failure_message))
-        candidate_dicts = response_dict["candidates"]
+        candidate_dicts = self._predict_with_cache(
+            data_view_id, candidates, method, use_prior,
+            lambda misses: self._predict_candidates(data_view_id, misses, method, use_prior))
+        return list(
+            map(
+                lambda c: _get_prediction_result_from_candidate(c), candidate_dicts
+            )
+        )
+
+    def predict_batch(self, data_view_id, candidates, method="scalar", use_prior=True,
+                      chunk_size=DEFAULT_PREDICT_CHUNK_SIZE, max_workers=4, max_attempts=3):
+        """
+        Predict endpoint for large sets of candidates. The candidates are split
+        into chunks which are sent concurrently, and a chunk which fails with a
+        transient error is retried on its own.
+
+        :param data_view_id: The ID of the data view to use for prediction
+        :type data_view_id: str
+        :param candidates: A list of candidates to make predictions on
+        :type candidates: list of dicts
+        :param method: Method for propagating predictions through model
+            graphs
+        :type method: str ("scalar" or "from_distribution")
+        :param use_prior:  Whether to apply prior values implied by the property descriptors
+        :type use_prior: bool
+        :param chunk_size: The maximum number of candidates sent per request
+        :type chunk_size: int
+        :param max_workers: The maximum number of requests in flight at once
+        :type max_workers: int
+        :param max_attempts: The number of times a chunk is sent before its
+            error is raised, in place of the retry policy's ``max_attempts``
+        :type max_attempts: int
+        :return: The results of the prediction, in the same order as the
+            candidates
+        :rtype: list of :class:`PredictionResult`
+        """
+        candidate_dicts = self._predict_with_cache(
+            data_view_id, candidates, method, use_prior,
+            lambda misses: self._predict_candidates_in_chunks(
+                data_view_id, misses, method, use_prior, chunk_size, max_workers, max_attempts))
         return list(
             map(
                 lambda c: _get_prediction_result_from_candidate(c), candidate_dicts
             )
         )
 
+    def predict_table(self, data_view_id, candidates, method="scalar", use_prior=True,
+                      chunk_size=DEFAULT_PREDICT_CHUNK_SIZE, max_workers=4, max_attempts=3):
+        """
+        Predict endpoint which returns the predictions for every candidate as
+        a single table of per-output arrays, rather than one object per
+        predicted value. Candidates are sent in chunks as with
+        :meth:`predict_batch`.
+
+        :param data_view_id: The ID of the data view to use for prediction
+        :type data_view_id: str
+        :param candidates: A list of candidates to make predictions on
+        :type candidates: list of dicts
+        :param method: Method for propagating predictions through model
+            graphs
+        :type method: str ("scalar" or "from_distribution")
+        :param use_prior:  Whether to apply prior values implied by the property descriptors
+        :type use_prior: bool
+        :param chunk_size: The maximum number of candidates sent per request
+        :type chunk_size: int
+        :param max_workers: The maximum number of requests in flight at once
+        :type max_workers: int
+        :param max_attempts: The number of times a chunk is sent before its
+            error is raised, in place of the retry policy's ``max_attempts``
+        :type max_attempts: int
+        :return: The results of the prediction, in the same order as the
+            candidates
+        :rtype: :class:`PredictionTable`
+        """
+        candidate_dicts = self._predict_with_cache(
+            data_view_id, candidates, method, use_prior,
+            lambda misses: self._predict_candidates_in_chunks(
+                data_view_id, misses, method, use_prior, chunk_size, max_workers, max_attempts))
+        return PredictionTable.from_candidates(candidate_dicts)
+
+    def invalidate_prediction_cache(self, data_view_id=None):
+        """
+        Removes cached predictions, for instance after a data view has been
+        retrained. Does nothing if the client has no prediction cache.
+
+        :param data_view_id: The ID of the data view whose predictions should
+            be removed. If None, every cached prediction is removed.
+        :type data_view_id: str
+        """
+        if self.prediction_cache is None:
+            return
+        if data_view_id is None:
+            self.prediction_cache.clear()
+        else:
+            self.prediction_cache.invalidate(data_view_id)
+
+    def _predict_with_cache(self, data_view_id, candidates, method, use_prior, predict_misses):
+        """
+        Looks candidates up in the prediction cache, predicts the distinct
+        candidates which are missing with ``predict_misses`` and merges the
+        results back in candidate order.
+
+        :param predict_misses: A callable which takes a list of candidates and
+            returns their predicted candidate dictionaries, in order
+        :return: The predicted candidate dictionaries
+        :rtype: list of dicts
+        """
+        if not isinstance(candidates, list):
+            candidates = [candidates]
+
+        if self.prediction_cache is None:
+            return predict_misses(candidates)
+
+        # Validates the method before anything is looked up
+        self._get_predict_body([], method, use_prior)
+
+        keys = [prediction_cache_key(data_view_id, method, use_prior, c) for c in candidates]
+        predictions = self.prediction_cache.get_many(keys)
+
+        miss_indices = OrderedDict()
+        for i, prediction in enumerate(predictions):
+            if prediction is None:
+                miss_indices.setdefault(keys[i], []).append(i)
+
+        if miss_indices:
+            misses = [candidates[indices[0]] for indices in miss_indices.values()]
+            predicted = _check_prediction_count(data_view_id, misses, predict_misses(misses))
+            self.prediction_cache.set_many(list(zip(miss_indices.keys(), predicted)))
+            for indices, prediction in zip(miss_indices.values(), predicted):
+                for i in indices:
+                    predictions[i] = prediction
+
+        return predictions
+
+    def _predict_candidates(self, data_view_id, candidates, method="scalar", use_prior=True, retry_policy=None):
+        """
+        Makes a single prediction request.
+
+        :param retry_policy: The policy to retry the request with, in place
+            of the client's
+        :return: The predicted candidate dictionaries returned by Citrination
+        :rtype: list of dicts
+        """
+        body = self._get_predict_body(candidates, method, use_prior)
+        failure_message = "Error while making prediction for data view {}".format(data_view_id)
+        response_dict = self._get_success_json(
+            self._post_json(routes.data_view_predict(data_view_id), data=body, failure_message=failure_message,
+                            idempotent=True, retry_policy=retry_policy))
+        return response_dict["candidates"]
+
+    def _predict_candidates_in_chunks(self, data_view_id, candidates, method, use_prior,
+                                      chunk_size, max_workers, max_attempts):
+        """
+        Splits candidates into chunks, makes a prediction request per chunk on
+        a thread pool and reassembles the predicted candidates in order.
+
+        :return: The predicted candidate dictionaries returned by Citrination
+        :rtype: list of dicts
+        """
+        chunks = _predict_chunks(candidates, method, use_prior, chunk_size, max_workers, max_attempts)
+        retry_policy = self.retry_policy.with_max_attempts(max_attempts)
+
+        def predict_chunk(chunk):
+            candidate_dicts = self._predict_candidates(data_view_id, chunk, method, use_prior, retry_policy)
+            return _check_prediction_count(data_view_id, chunk, candidate_dicts)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = list(executor.map(predict_chunk, chunks))
+
+        return [c for chunk_result in chunk_results for c in chunk_result]
+
     def _data_analysis(self, data_view_id):
         """
         Data analysis endpoint.
@@ -84,20 +271,7 @@ class ModelsClient(BaseClient):
         return self._get_success_json(self._get(routes.data_analysis(data_view_id), failure_message=failure_message))
 
     def _get_predict_body(self, candidates, method="scalar", use_prior=True):
-        if not (method == "scalar" or method == "from_distribution"):
-            raise ValueError("{} method not supported".format(method))
-
-        # If a single candidate is passed, wrap in a list for the user
-        if not isinstance(candidates, list):
-            candidates = [candidates]
-
-        return {
-            "predictionRequest": {
-                "predictionSource": method,
-                "usePrior":         use_prior,
-                "candidates":       candidates
-            }
-        }
+        return _get_predict_body(candidates, method, use_prior)
 
     def submit_design_run(self, data_view_id, num_candidates, effort, target=None, constraints=[], sampler="Default"):
         """
@@ -120,26 +294,11 @@ class ModelsClient(BaseClient):
         :return: A :class:`DesignRun` instance containing the UID of the
             new run
         """
-
-        if effort > 30:
-            raise CitrinationClientError("Parameter effort must be less than 30 to trigger a design run")
-
-        if target is not None:
-            target = target.to_dict()
-
-        constraint_dicts = [c.to_dict() for c in constraints]
-
-        body = {
-            "num_candidates": num_candidates,
-            "target":         target,
-            "effort":         effort,
-            "constraints":    constraint_dicts,
-            "sampler":        sampler
-        }
+        body = _design_run_body(num_candidates, effort, target, constraints, sampler)
 
         url = routes.submit_data_view_design(data_view_id)
 
-        response = self._post_json(url, body).json()
+        response = self._get_success_json(self._post_json(url, body))
 
         return DesignRun(response["data"]["design_run"]["uid"])
 
@@ -157,16 +316,9 @@ class ModelsClient(BaseClient):
 
         url = routes.get_data_view_design_status(data_view_id, run_uuid)
 
-        response = self._get(url).json()
+        response = self._get_success_json(self._get(url))
 
-        status = response["data"]
-
-        return ProcessStatus(
-            result=status.get("result"),
-            progress=status.get("progress"),
-            status=status.get("status"),
-            messages=status.get("messages")
-        )
+        return _process_status_from_response(response)
 
     def get_design_run_results(self, data_view_id, run_uuid):
         """
@@ -182,14 +334,35 @@ class ModelsClient(BaseClient):
 
         url = routes.get_data_view_design_results(data_view_id, run_uuid)
 
-        response = self._get(url).json()
+        response = self._get_success_json(self._get(url))
 
-        result = response["data"]
+        return _design_results_from_response(response)
 
-        return DesignResults(
-            best_materials=result.get("best_material_results"),
-            next_experiments=result.get("next_experiment_results")
-        )
+    def wait_for_design_run(self, data_view_id, run_uuid, timeout=None, poll_policy=None):
+        """
+        Waits for a design run to finish and retrieves its results. The run
+        is checked more often as it nears completion, according to the
+        progress it reports.
+
+        :param data_view_id: The ID number of the data view to which the
+            run belongs, as a string
+        :type data_view_id: str
+        :param run_uuid: The UUID of the design run to wait for
+        :type run_uuid: str
+        :param timeout: The number of seconds to wait before giving up, or
+            None to wait until the run is done
+        :type timeout: float
+        :param poll_policy: The policy deciding how often the run is checked
+        :type poll_policy: :class:`PollPolicy`
+        :return: A :class:`DesignResults` object
+        :raises DesignRunTimeoutException: If the run does not finish in time
+        """
+        monitor = DesignRunMonitor(self, poll_policy=poll_policy)
+        run = monitor.add(data_view_id, run_uuid)
+        monitor.wait(timeout)
+        if run.error is not None:
+            raise run.error
+        return run.results
 
     def get_data_view(self, data_view_id):
         """
@@ -206,29 +379,9 @@ class ModelsClient(BaseClient):
 
         url = routes.get_data_view(data_view_id)
 
-        response = self._get(url).json()
-
-        result = response["data"]["data_view"]
+        response = self._get_success_json(self._get(url))
 
-        datasets_list = []
-        for dataset in result["datasets"]:
-            datasets_list.append(Dataset(
-                name=dataset["name"],
-                id=dataset["id"],
-                description=dataset["description"]
-            ))
-
-        columns_list = []
-        for column in result["columns"]:
-            columns_list.append(ColumnFactory.from_dict(column))
-
-        return DataView(
-            view_id=data_view_id,
-            name=result["name"],
-            description=result["description"],
-            datasets=datasets_list,
-            columns=columns_list,
-        )
+        return _data_view_from_response(data_view_id, response)
 
     def kill_design_run(self, data_view_id, run_uuid):
         """
@@ -244,7 +397,7 @@ class ModelsClient(BaseClient):
 
         url = routes.kill_data_view_design_run(data_view_id, run_uuid)
 
-        response = self._delete(url).json()
+        response = self._get_success_json(self._delete(url))
         return response["data"]["uid"]
 
     def get_data_view_service_status(self, data_view_id):
@@ -264,16 +417,135 @@ class ModelsClient(BaseClient):
 
         url = routes.get_data_view_status(data_view_id)
 
-        response = self._get(url).json()
+        response = self._get_success_json(self._get(url))
 
-        result = response["data"]["status"]
+        return _data_view_status_from_response(response)
 
-        return DataViewStatus(
-            predict = ServiceStatus.from_response_dict(result["predict"]),
-            experimental_design = ServiceStatus.from_response_dict(result["experimental_design"]),
-            data_reports = ServiceStatus.from_response_dict(result["data_reports"]),
-            model_reports = ServiceStatus.from_response_dict(result["model_reports"])
+def _get_predict_body(candidates, method="scalar", use_prior=True):
+    if not (method == "scalar" or method == "from_distribution"):
+        raise ValueError("{} method not supported".format(method))
+
+    # If a single candidate is passed, wrap in a list for the user
+    if not isinstance(candidates, list):
+        candidates = [candidates]
+
+    return {
+        "predictionRequest": {
+            "predictionSource": method,
+            "usePrior":         use_prior,
+            "candidates":       candidates
+        }
+    }
+
+def _predict_chunks(candidates, method, use_prior, chunk_size, max_workers, max_attempts):
+    """
+    Validates the arguments of a chunked prediction and splits the
+    candidates into chunks of at most ``chunk_size``.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1")
+
+    # Validates the method before anything is sent
+    _get_predict_body([], method, use_prior)
+
+    if not isinstance(candidates, list):
+        candidates = [candidates]
+
+    return [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+
+def _check_prediction_count(data_view_id, chunk, candidate_dicts):
+    if len(candidate_dicts) != len(chunk):
+        raise CitrinationClientError(
+            "Expected {} predictions from data view {} but received {}".format(
+                len(chunk), data_view_id, len(candidate_dicts)))
+    return candidate_dicts
+
+def _tsne_from_analysis(analysis):
+    projections = analysis['projections']
+    tsne = Tsne()
+    for k, v in projections.items():
+        projection = Projection(
+            xs=v['x'],
+            ys=v['y'],
+            responses=v['label'],
+            tags=v['inputs'],
+            uids=v['uid']
         )
+        tsne.add_projection(k, projection)
+
+    return tsne
+
+def _design_run_body(num_candidates, effort, target, constraints, sampler):
+    if effort > 30:
+        raise CitrinationClientError("Parameter effort must be less than 30 to trigger a design run")
+
+    if target is not None:
+        target = target.to_dict()
+
+    constraint_dicts = [c.to_dict() for c in constraints]
+
+    return {
+        "num_candidates": num_candidates,
+        "target":         target,
+        "effort":         effort,
+        "constraints":    constraint_dicts,
+        "sampler":        sampler
+    }
+
+def _process_status_from_response(response):
+    status = response["data"]
+
+    return ProcessStatus(
+        result=status.get("result"),
+        progress=status.get("progress"),
+        status=status.get("status"),
+        messages=status.get("messages")
+    )
+
+def _design_results_from_response(response):
+    result = response["data"]
+
+    return DesignResults(
+        best_materials=result.get("best_material_results"),
+        next_experiments=result.get("next_experiment_results")
+    )
+
+def _data_view_from_response(data_view_id, response):
+    result = response["data"]["data_view"]
+
+    datasets_list = []
+    for dataset in result["datasets"]:
+        datasets_list.append(Dataset(
+            name=dataset["name"],
+            id=dataset["id"],
+            description=dataset["description"]
+        ))
+
+    columns_list = []
+    for column in result["columns"]:
+        columns_list.append(ColumnFactory.from_dict(column))
+
+    return DataView(
+        view_id=data_view_id,
+        name=result["name"],
+        description=result["description"],
+        datasets=datasets_list,
+        columns=columns_list,
+    )
+
+def _data_view_status_from_response(response):
+    result = response["data"]["status"]
+
+    return DataViewStatus(
+        predict = ServiceStatus.from_response_dict(result["predict"]),
+        experimental_design = ServiceStatus.from_response_dict(result["experimental_design"]),
+        data_reports = ServiceStatus.from_response_dict(result["data_reports"]),
+        model_reports = ServiceStatus.from_response_dict(result["model_reports"])
+    )
 
 def _get_prediction_result_from_candidate(candidate_dict):
     result = PredictionResult()
@@ -2,4 +2,5 @@ from citrination_client.models.design.design_run import DesignRun
 from citrination_client.models.design.process_status import ProcessStatus
 from citrination_client.models.design.design_results import DesignResults
 from citrination_client.models.design.target import Target
+from citrination_client.models.design.monitor import DesignRunMonitor, MonitoredDesignRun, PollPolicy
 from citrination_client.models.design.constraints import *
\ No newline at end of file
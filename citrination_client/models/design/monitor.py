@@ -0,0 +1,235 @@
+from citrination_client.base.errors import CitrinationClientError, DesignRunTimeoutException
+from citrination_client.models.design.design_run import DesignRun
+
+import requests
+import time
+
+
+class PollPolicy(object):
+    """
+    Decides how long to wait between checks on a design run. Once a run has
+    reported progress, the wait is a fraction of the estimated time left, so
+    a long run is checked rarely and a nearly finished run often. Until then,
+    the wait grows geometrically.
+    """
+
+    def __init__(self, min_interval=2.0, max_interval=60.0, growth=1.5, eta_fraction=0.25,
+                 sleep=time.sleep, clock=time.time):
+        """
+        Constructor.
+
+        :param min_interval: The shortest wait between checks, in seconds
+        :type min_interval: float
+        :param max_interval: The longest wait between checks, in seconds
+        :type max_interval: float
+        :param growth: The factor the wait grows by while a run reports no
+            progress
+        :type growth: float
+        :param eta_fraction: The fraction of the estimated time left to wait
+            once a run is making progress
+        :type eta_fraction: float
+        :param sleep: The function used to wait, given a number of seconds
+        :type sleep: function
+        :param clock: Returns the current time in seconds
+        :type clock: function
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Intervals must be positive, with max_interval at least min_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.growth = growth
+        self.eta_fraction = eta_fraction
+        self.sleep = sleep
+        self.clock = clock
+
+    def next_interval(self, previous_interval, history):
+        """
+        The number of seconds to wait before checking a run again.
+
+        :param previous_interval: The previous wait, or None before the
+            first check
+        :type previous_interval: float
+        :param history: The (time, progress) of each check so far, with
+            progress as a percentage
+        :type history: list of tuple
+        :return: The wait, in seconds
+        :rtype: float
+        """
+        eta = _estimated_time_left(history)
+        if eta is not None:
+            interval = eta * self.eta_fraction
+        elif previous_interval is None:
+            interval = self.min_interval
+        else:
+            interval = previous_interval * self.growth
+        return min(self.max_interval, max(self.min_interval, interval))
+
+
+class MonitoredDesignRun(object):
+    """
+    A design run followed by a :class:`DesignRunMonitor`.
+    """
+
+    def __init__(self, data_view_id, uuid):
+        self._data_view_id = data_view_id
+        self._uuid = uuid
+        self.status = None
+        self.results = None
+        self.error = None
+        self.history = []
+        self.interval = None
+        self.next_check = 0.0
+
+    @property
+    def data_view_id(self):
+        return self._data_view_id
+
+    @property
+    def uuid(self):
+        return self._uuid
+
+    def done(self):
+        """
+        Indicates whether the run has finished, failed or timed out.
+
+        :rtype: bool
+        """
+        return self.results is not None or self.error is not None
+
+    def successful(self):
+        """
+        Indicates whether the run finished and its results were retrieved.
+
+        :rtype: bool
+        """
+        return self.results is not None
+
+
+class DesignRunMonitor(object):
+    """
+    Follows many design runs at once, checking each according to its own
+    progress while spacing every request, across all of the runs, to stay
+    within a shared request rate. The results of each run are retrieved as
+    soon as it finishes.
+    """
+
+    def __init__(self, models_client, poll_policy=None, max_requests_per_second=2.0):
+        """
+        Constructor.
+
+        :param models_client: The client used to check on the runs
+        :type models_client: :class:`ModelsClient`
+        :param poll_policy: The policy deciding how often each run is checked
+        :type poll_policy: :class:`PollPolicy`
+        :param max_requests_per_second: The most requests made per second
+            across all of the runs
+        :type max_requests_per_second: float
+        """
+        if max_requests_per_second <= 0:
+            raise ValueError("max_requests_per_second must be positive")
+        self._client = models_client
+        self._policy = poll_policy or PollPolicy()
+        self._request_spacing = 1.0 / max_requests_per_second
+        self._next_request = None
+        self._runs = []
+
+    @property
+    def runs(self):
+        """
+        The monitored runs, in the order they were added.
+
+        :rtype: list of :class:`MonitoredDesignRun`
+        """
+        return list(self._runs)
+
+    def add(self, data_view_id, run):
+        """
+        Starts following a design run.
+
+        :param data_view_id: The ID number of the data view to which the
+            run belongs, as a string
+        :type data_view_id: str
+        :param run: The run, or its UUID
+        :type run: :class:`DesignRun` or str
+        :return: The monitored run
+        :rtype: :class:`MonitoredDesignRun`
+        """
+        uuid = run.uuid if isinstance(run, DesignRun) else run
+        monitored = MonitoredDesignRun(data_view_id, uuid)
+        self._runs.append(monitored)
+        return monitored
+
+    def wait(self, timeout=None):
+        """
+        Checks on the runs until every run is done or the deadline passes.
+        Runs still in progress at the deadline are given a
+        :class:`DesignRunTimeoutException` as their error.
+
+        :param timeout: The number of seconds to wait, or None to wait
+            until every run is done
+        :type timeout: float
+        :return: The monitored runs, in the order they were added
+        :rtype: list of :class:`MonitoredDesignRun`
+        """
+        clock = self._policy.clock
+        deadline = None if timeout is None else clock() + timeout
+        while True:
+            pending = [run for run in self._runs if not run.done()]
+            if not pending:
+                break
+            run = min(pending, key=lambda r: r.next_check)
+            start = max(run.next_check, self._next_request or 0.0)
+            if deadline is not None and start > deadline:
+                for timed_out in pending:
+                    timed_out.error = DesignRunTimeoutException(
+                        "Design run {} did not finish within {} seconds".format(timed_out.uuid, timeout))
+                break
+            self._sleep_until(start)
+            self._check(run)
+        return self.runs
+
+    def _check(self, run):
+        try:
+            run.status = self._request(self._client.get_design_run_status, run)
+            if run.status.finished():
+                run.results = self._request(self._client.get_design_run_results, run)
+                return
+            if run.status.killed():
+                run.error = CitrinationClientError("Design run {} was killed".format(run.uuid))
+                return
+            if not run.status.in_progress():
+                run.error = CitrinationClientError(
+                    "Design run {} ended with status {}".format(run.uuid, run.status.status))
+                return
+        except (CitrinationClientError, ValueError, requests.exceptions.RequestException) as e:
+            run.error = e
+            return
+        now = self._policy.clock()
+        if run.status.progress is not None:
+            run.history.append((now, run.status.progress))
+        run.interval = self._policy.next_interval(run.interval, run.history)
+        run.next_check = now + run.interval
+
+    def _request(self, method, run):
+        self._sleep_until(self._next_request or 0.0)
+        self._next_request = self._policy.clock() + self._request_spacing
+        return method(run.data_view_id, run.uuid)
+
+    def _sleep_until(self, moment):
+        delay = moment - self._policy.clock()
+        if delay > 0:
+            self._policy.sleep(delay)
+
+
+def _estimated_time_left(history):
+    """
+    Estimates the seconds until a run finishes from the progress it has made
+    between its first and latest checks, or None if it has made none.
+    """
+    if len(history) < 2:
+        return None
+    (first_time, first_progress), (last_time, last_progress) = history[0], history[-1]
+    if last_progress <= first_progress or last_time <= first_time:
+        return None
+    rate = (last_progress - first_progress) / float(last_time - first_time)
+    return max(0.0, 100 - last_progress) / rate
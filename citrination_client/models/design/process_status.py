@@ -1,3 +1,7 @@
+# Statuses of processes which have not yet ended
+IN_PROGRESS_STATUSES = ("Accepted", "In Progress", "Running")
+
+
 class ProcessStatus(object):
     """
     The status of an in progress process executing on Citrination.
@@ -89,4 +93,13 @@ class ProcessStatus(object):
         return self.status == "Killed"
 
     def accepted(self):
-        return self.status == "Accepted"
\ No newline at end of file
+        return self.status == "Accepted"
+
+    def in_progress(self):
+        """
+        Indicates whether the process is still queued or running, rather than
+        having finished, been killed or failed.
+
+        :rtype: bool
+        """
+        return self.status in IN_PROGRESS_STATUSES
@@ -0,0 +1,138 @@
+from citrination_client.models import ModelsClient, DesignRun, DesignRunMonitor, PollPolicy
+from citrination_client.base.errors import DesignRunTimeoutException
+import pytest
+import requests_mock
+
+site = "mock://citrination"
+
+
+class FakeClock(object):
+    """
+    A clock which only moves when slept on.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _policy(clock, **kwargs):
+    return PollPolicy(min_interval=1.0, max_interval=30.0, sleep=clock.sleep, clock=clock.time, **kwargs)
+
+
+def _mock_run(m, clock, data_view_id, uuid, duration, status="Finished", request_times=None):
+    """
+    Registers fake status and results endpoints for a run which progresses
+    steadily and reaches ``status`` after ``duration`` seconds.
+    """
+    start = clock.time()
+    def get_status(request, context):
+        if request_times is not None:
+            request_times.append(clock.time())
+        elapsed = clock.time() - start
+        if elapsed >= duration:
+            return {"data": {"status": status, "progress": 100}}
+        return {"data": {"status": "Accepted", "progress": int(100 * elapsed / duration)}}
+    def get_results(request, context):
+        if request_times is not None:
+            request_times.append(clock.time())
+        return {"data": {"best_material_results": [{"uid": uuid}], "next_experiment_results": []}}
+    base = site + "/api/data_views/{}/experimental_design/{}".format(data_view_id, uuid)
+    m.get(base + "/status", json=get_status)
+    m.get(base + "/results", json=get_results)
+
+
+def test_poll_interval_follows_progress():
+    """
+    Tests that the wait grows while a run makes no progress and is a
+    fraction of the estimated time left once it does
+    """
+    policy = PollPolicy(min_interval=1.0, max_interval=60.0, growth=2.0, eta_fraction=0.5)
+    assert policy.next_interval(None, []) == 1.0
+    assert policy.next_interval(4.0, [(0, 0), (10, 0)]) == 8.0
+    assert policy.next_interval(4.0, [(0, 0), (10, 50)]) == 5.0
+    assert policy.next_interval(4.0, [(0, 0), (10, 99)]) == 1.0
+    assert policy.next_interval(50.0, [(0, 0)]) == 60.0
+
+
+def test_wait_for_design_run_returns_results():
+    """
+    Tests that waiting for a run checks it more often as it nears completion
+    and returns its results once it finishes
+    """
+    clock = FakeClock()
+    client = ModelsClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_run(m, clock, "42", "run-1", duration=100)
+        results = client.wait_for_design_run("42", "run-1", poll_policy=_policy(clock))
+        status_checks = len([r for r in m.request_history if r.path.endswith("/status")])
+
+    assert results.best_materials == [{"uid": "run-1"}]
+    assert 100 <= clock.time() - 1000.0 <= 110
+    assert status_checks < 20
+    assert clock.sleeps[-1] < max(clock.sleeps)
+
+
+def test_wait_for_design_run_deadline():
+    """
+    Tests that waiting gives up once the deadline has passed
+    """
+    clock = FakeClock()
+    client = ModelsClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_run(m, clock, "42", "run-1", duration=1000)
+        with pytest.raises(DesignRunTimeoutException):
+            client.wait_for_design_run("42", DesignRun("run-1"), timeout=60, poll_policy=_policy(clock))
+
+    assert clock.time() - 1000.0 <= 60
+
+
+def test_failed_run_stops_the_monitor():
+    """
+    Tests that a run which ends with any status other than finished is
+    reported as an error instead of being checked until the deadline
+    """
+    clock = FakeClock()
+    client = ModelsClient("key", site)
+    monitor = DesignRunMonitor(client, poll_policy=_policy(clock))
+    with requests_mock.mock() as m:
+        _mock_run(m, clock, "42", "run-1", duration=10, status="Failed")
+        run = monitor.add("42", "run-1")
+        monitor.wait(timeout=600)
+        status_checks = len(m.request_history)
+
+    assert not run.successful()
+    assert "Failed" in str(run.error)
+    assert run.status.status == "Failed"
+    assert status_checks < 10
+    assert clock.time() - 1000.0 < 20
+
+
+def test_monitor_shares_request_budget():
+    """
+    Tests that many runs are followed at once without exceeding the shared
+    request rate, and that killed runs are reported as errors
+    """
+    clock = FakeClock()
+    client = ModelsClient("key", site)
+    request_times = []
+    monitor = DesignRunMonitor(client, poll_policy=_policy(clock), max_requests_per_second=2.0)
+    with requests_mock.mock() as m:
+        for i in range(10):
+            _mock_run(m, clock, "42", "run-{}".format(i), duration=20 + i * 5,
+                      status="Killed" if i == 3 else "Finished", request_times=request_times)
+            monitor.add("42", "run-{}".format(i))
+        runs = monitor.wait()
+
+    assert [r.uuid for r in runs] == ["run-{}".format(i) for i in range(10)]
+    assert [r.successful() for r in runs] == [i != 3 for i in range(10)]
+    assert "killed" in str(runs[3].error)
+    gaps = [b - a for a, b in zip(request_times, request_times[1:])]
+    assert min(gaps) >= 0.5 - 1e-9
@@ -1,8 +1,14 @@
-class PredictedValue(object):
+from citrination_client.util.slots import Slotted
+
+
+class PredictedValue(Slotted):
     """
-    The value/loss output from a prediction.
+    The value/loss output from a prediction. Predictions can hold millions of
+    values, so the fields are stored in slots.
     """
 
+    __slots__ = ("_key", "_value", "_loss")
+
     def __init__(self, key, value, loss=None):
         """
         Constructor.
@@ -52,4 +58,4 @@ class PredictedValue(object):
 
     @loss.deleter
     def loss(self):
-        self._loss = None
\ No newline at end of file
+        self._loss = None
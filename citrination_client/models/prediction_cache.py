@@ -0,0 +1,218 @@
+from collections import OrderedDict
+
+import copy
+import json
+import sqlite3
+import threading
+
+DEFAULT_MAX_SIZE = 100000
+
+
+def prediction_cache_key(data_view_id, method, use_prior, candidate):
+    """
+    Builds the cache key for a single candidate's prediction. Candidates are
+    canonicalized so that dictionaries with the same contents share a key
+    regardless of their key order.
+
+    :param data_view_id: The ID of the data view making the prediction
+    :param method: The prediction method
+    :type method: str
+    :param use_prior: Whether prior values are applied
+    :type use_prior: bool
+    :param candidate: The candidate being predicted
+    :type candidate: dict
+    :return: The cache key
+    :rtype: tuple
+    """
+    return (str(data_view_id), method, bool(use_prior),
+            json.dumps(candidate, sort_keys=True, separators=(",", ":")))
+
+
+class BasePredictionCache(object):
+    """
+    The interface of the caches which a :class:`ModelsClient` looks
+    predictions up in. Each call returns its own copies of the cached
+    predictions, so changing a prediction never changes the cache.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        Constructor.
+
+        :param max_size: The maximum number of predictions to keep
+        :type max_size: int
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    def get_many(self, keys):
+        """
+        Looks up the predictions for several keys.
+
+        :param keys: Keys built with :func:`prediction_cache_key`
+        :type keys: list of tuple
+        :return: The cached prediction for each key, or None if it is missing
+        :rtype: list of dicts
+        """
+        raise NotImplementedError()
+
+    def set_many(self, items):
+        """
+        Stores several predictions, evicting the least recently used
+        predictions if the cache grows past its maximum size.
+
+        :param items: Pairs of key and predicted candidate dictionary
+        :type items: list of (tuple, dict)
+        """
+        raise NotImplementedError()
+
+    def invalidate(self, data_view_id):
+        """
+        Removes every cached prediction for a data view, for instance after
+        its models have been retrained.
+
+        :param data_view_id: The ID of the data view
+        """
+        raise NotImplementedError()
+
+    def clear(self):
+        """
+        Removes every cached prediction.
+        """
+        raise NotImplementedError()
+
+
+class PredictionCache(BasePredictionCache):
+    """
+    An in-memory cache of predicted candidates, keyed by data view, prediction
+    method, prior usage and candidate. When the cache is full, the least
+    recently used prediction is evicted.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        Constructor.
+
+        :param max_size: The maximum number of predictions to keep
+        :type max_size: int
+        """
+        super(PredictionCache, self).__init__(max_size)
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_many(self, keys):
+        results = []
+        with self._lock:
+            for key in keys:
+                prediction = self._entries.pop(key, None)
+                if prediction is not None:
+                    self._entries[key] = prediction
+                results.append(copy.deepcopy(prediction))
+        return results
+
+    def set_many(self, items):
+        with self._lock:
+            for key, prediction in items:
+                self._entries.pop(key, None)
+                self._entries[key] = copy.deepcopy(prediction)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, data_view_id):
+        data_view_id = str(data_view_id)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == data_view_id]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SqlitePredictionCache(BasePredictionCache):
+    """
+    A prediction cache stored in a sqlite database, so that predictions are
+    kept between processes. When the cache is full, the least recently used
+    prediction is evicted.
+    """
+
+    def __init__(self, path, max_size=DEFAULT_MAX_SIZE):
+        """
+        Constructor.
+
+        :param path: The path of the sqlite database file
+        :type path: str
+        :param max_size: The maximum number of predictions to keep
+        :type max_size: int
+        """
+        super(SqlitePredictionCache, self).__init__(max_size)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS predictions ("
+                "key TEXT PRIMARY KEY, data_view_id TEXT NOT NULL, "
+                "prediction TEXT NOT NULL, last_used INTEGER NOT NULL)")
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS predictions_data_view_id ON predictions (data_view_id)")
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS predictions_last_used ON predictions (last_used)")
+        self._clock = self._connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0) FROM predictions").fetchone()[0]
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+
+    def get_many(self, keys):
+        results = []
+        with self._lock, self._connection:
+            for key in keys:
+                db_key = json.dumps(key)
+                row = self._connection.execute(
+                    "SELECT prediction FROM predictions WHERE key = ?", (db_key,)).fetchone()
+                if row is None:
+                    results.append(None)
+                    continue
+                self._clock += 1
+                self._connection.execute(
+                    "UPDATE predictions SET last_used = ? WHERE key = ?", (self._clock, db_key))
+                results.append(json.loads(row[0]))
+        return results
+
+    def set_many(self, items):
+        with self._lock, self._connection:
+            for key, prediction in items:
+                self._clock += 1
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO predictions (key, data_view_id, prediction, last_used) "
+                    "VALUES (?, ?, ?, ?)", (json.dumps(key), key[0], json.dumps(prediction), self._clock))
+            overflow = self._connection.execute(
+                "SELECT COUNT(*) FROM predictions").fetchone()[0] - self._max_size
+            if overflow > 0:
+                self._connection.execute(
+                    "DELETE FROM predictions WHERE key IN "
+                    "(SELECT key FROM predictions ORDER BY last_used LIMIT ?)", (overflow,))
+
+    def invalidate(self, data_view_id):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM predictions WHERE data_view_id = ?", (str(data_view_id),))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM predictions")
+
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+        with self._lock:
+            self._connection.close()
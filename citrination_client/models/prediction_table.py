@@ -0,0 +1,176 @@
+from citrination_client.models.predicted_value import PredictedValue
+from citrination_client.util.arrays import to_typed_array, float_array, object_array, is_integer, is_real
+
+from collections import OrderedDict
+
+
+class PredictionColumn(object):
+    """
+    The predicted values and losses for a single output across every
+    candidate in a :class:`PredictionTable`.
+    """
+
+    def __init__(self, key, values, losses):
+        """
+        Constructor.
+
+        :param key: The descriptor key for the predictions
+        :type key: str
+        :param values: The predicted values, one per candidate
+        :param losses: The losses for the predictions, one per candidate
+        """
+        self._key = key
+        self._values = values
+        self._losses = losses
+
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def values(self):
+        return self._values
+
+    @property
+    def losses(self):
+        return self._losses
+
+    def __len__(self):
+        return len(self._values)
+
+
+class PredictionRow(object):
+    """
+    A view of the predictions for a single candidate in a
+    :class:`PredictionTable`, with the same accessors as
+    :class:`PredictionResult`.
+    """
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def get_value(self, key):
+        """
+        Retrieves a predicted value.
+
+        :param key: A descriptor key for a predicted value.
+        :type key: str
+        :return: The value predicted for the descriptor key. None if there is
+            no prediction for that key.
+        :rtype: :class:`PredictedValue`
+        """
+        try:
+            column = self._table[key]
+        except KeyError:
+            return None
+        value = _to_python(column.values[self._index])
+        if value is None:
+            return None
+        return PredictedValue(key, value, _to_python(column.losses[self._index]))
+
+    def _has_value(self, key):
+        return _to_python(self._table[key].values[self._index]) is not None
+
+    def all_keys(self):
+        """
+        Retrieves a list of all the values which were predicted.
+
+        :return: A list of keys for which predictions have been made and can
+            be retrieved using `get_value`
+        :rtype: list of str
+        """
+        return [key for key in self._table.all_keys() if self._has_value(key)]
+
+
+class PredictionTable(object):
+    """
+    The results of a prediction for many candidates, stored as one contiguous
+    array of values and one of losses per predicted output. Columns are NumPy
+    arrays when NumPy is installed.
+
+    Index the table with a descriptor key to get a :class:`PredictionColumn`,
+    or with a candidate index to get a :class:`PredictionRow`.
+    """
+
+    def __init__(self, columns=None, num_candidates=0):
+        """
+        Constructor.
+
+        :param columns: The columns of the table
+        :type columns: list of :class:`PredictionColumn`
+        :param num_candidates: The number of candidates in the table
+        :type num_candidates: int
+        """
+        self._columns = OrderedDict((c.key, c) for c in (columns or []))
+        self._num_candidates = num_candidates
+
+    @classmethod
+    def from_candidates(cls, candidate_dicts):
+        """
+        Builds a table from the predicted candidate dictionaries returned by
+        Citrination, each of which maps a descriptor key to a value and loss.
+
+        :param candidate_dicts: The predicted candidates
+        :type candidate_dicts: list of dicts
+        :return: The table of predictions
+        :rtype: :class:`PredictionTable`
+        """
+        values = OrderedDict()
+        losses = OrderedDict()
+        for i, candidate in enumerate(candidate_dicts):
+            for k, v in candidate.items():
+                if k not in values:
+                    values[k] = [None] * i
+                    losses[k] = [None] * i
+                values[k].append(v[0])
+                losses[k].append(v[1])
+            for k in values:
+                if len(values[k]) == i:
+                    values[k].append(None)
+                    losses[k].append(None)
+
+        columns = [PredictionColumn(k, to_typed_array(values[k]), _loss_array(losses[k])) for k in values]
+        return cls(columns, len(candidate_dicts))
+
+    def __len__(self):
+        return self._num_candidates
+
+    def __getitem__(self, key):
+        if is_integer(key):
+            if key < 0:
+                key += self._num_candidates
+            if key < 0 or key >= self._num_candidates:
+                raise IndexError("Candidate index out of range")
+            return PredictionRow(self, key)
+        return self._columns[key]
+
+    def __iter__(self):
+        for i in range(self._num_candidates):
+            yield PredictionRow(self, i)
+
+    def all_keys(self):
+        """
+        Retrieves a list of all the outputs which were predicted.
+
+        :rtype: list of str
+        """
+        return list(self._columns.keys())
+
+
+def _loss_array(losses):
+    if all(l is None or is_real(l) for l in losses):
+        return float_array(losses)
+    return object_array(losses)
+
+
+def _to_python(value):
+    """
+    Unwraps NumPy scalars, and converts the NaN used to fill missing
+    predictions back to None.
+    """
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
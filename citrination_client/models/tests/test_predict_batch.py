@@ -0,0 +1,95 @@
+from citrination_client.models import ModelsClient, PredictionResult
+from citrination_client.base import RetryPolicy
+from citrination_client.base.errors import CitrinationServerErrorException
+import requests_mock
+import json
+import pytest
+
+site = "mock://citrination"
+predict_url = site + "/api/data_views/42/predict"
+no_request_retries = RetryPolicy(max_attempts=1, sleep=lambda seconds: None)
+
+
+def _mock_predict(m, fail_first_for=()):
+    """
+    Registers a fake prediction endpoint which predicts double the "x" value
+    of each candidate. The first request containing any candidate whose "x"
+    is in ``fail_first_for`` fails with a server error.
+    """
+    failed = set()
+    def callback(request, context):
+        candidates = json.loads(request.body)["predictionRequest"]["candidates"]
+        xs = [c["x"] for c in candidates]
+        to_fail = [x for x in xs if x in fail_first_for and x not in failed]
+        if to_fail:
+            failed.update(to_fail)
+            context.status_code = 500
+            return {}
+        return {"candidates": [{"y": [x * 2.0, 0.1]} for x in xs]}
+    m.post(predict_url, json=callback)
+
+
+def test_predict_batch_preserves_order():
+    client = ModelsClient("key", site)
+    candidates = [{"x": i} for i in range(53)]
+    with requests_mock.mock() as m:
+        _mock_predict(m)
+        results = client.predict_batch(42, candidates, chunk_size=7, max_workers=4)
+        assert m.call_count == 8
+
+    assert len(results) == 53
+    assert all(isinstance(r, PredictionResult) for r in results)
+    assert [r.get_value("y").value for r in results] == [i * 2.0 for i in range(53)]
+
+
+def test_predict_batch_retries_only_failed_chunk():
+    client = ModelsClient("key", site, retry_policy=no_request_retries)
+    candidates = [{"x": i} for i in range(30)]
+    with requests_mock.mock() as m:
+        _mock_predict(m, fail_first_for=(12,))
+        results = client.predict_batch(42, candidates, chunk_size=10, max_workers=2)
+        assert m.call_count == 4
+        sent = [[c["x"] for c in json.loads(r.body)["predictionRequest"]["candidates"]] for r in m.request_history]
+        assert sorted(sent).count(list(range(10, 20))) == 2
+
+    assert [r.get_value("y").value for r in results] == [i * 2.0 for i in range(30)]
+
+
+def test_predict_batch_raises_after_max_attempts():
+    client = ModelsClient("key", site, retry_policy=no_request_retries)
+    with requests_mock.mock() as m:
+        m.post(predict_url, status_code=500)
+        with pytest.raises(CitrinationServerErrorException):
+            client.predict_batch(42, [{"x": 1}], max_attempts=2)
+        assert m.call_count == 2
+
+
+def test_predict_batch_retries_chunks_only_through_the_retry_policy():
+    client = ModelsClient("key", site, retry_policy=RetryPolicy(max_attempts=4, sleep=lambda seconds: None))
+    with requests_mock.mock() as m:
+        m.post(predict_url, status_code=500)
+        with pytest.raises(CitrinationServerErrorException):
+            client.predict_batch(42, [{"x": 1}], max_attempts=3)
+        assert m.call_count == 3
+
+    assert client.retry_stats.requests == 3
+    assert client.retry_stats.retries == 2
+    assert client.retry_stats.exhausted == 1
+    assert client.retry_policy.max_attempts == 4
+
+
+def test_predict_batch_validates_method():
+    client = ModelsClient("key", site)
+    with pytest.raises(ValueError):
+        client.predict_batch(42, [{"x": 1}], method="magic")
+
+
+def test_predict_table():
+    client = ModelsClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_predict(m)
+        table = client.predict_table(42, [{"x": i} for i in range(25)], chunk_size=10)
+
+    assert len(table) == 25
+    assert list(table["y"].values) == [i * 2.0 for i in range(25)]
+    assert table[3].get_value("y").loss == 0.1
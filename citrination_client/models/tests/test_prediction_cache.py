@@ -0,0 +1,105 @@
+from citrination_client.models import ModelsClient, BasePredictionCache, PredictionCache, SqlitePredictionCache
+from citrination_client.models.prediction_cache import prediction_cache_key
+from citrination_client.base.errors import CitrinationClientError
+import pytest
+import requests_mock
+import json
+import os
+
+site = "mock://citrination"
+predict_url = site + "/api/data_views/42/predict"
+
+
+def _mock_predict(m):
+    def callback(request, context):
+        candidates = json.loads(request.body)["predictionRequest"]["candidates"]
+        return {"candidates": [{"y": [c["x"] * 2.0, 0.1]} for c in candidates]}
+    m.post(predict_url, json=callback)
+
+
+def _sent_candidates(m):
+    return [json.loads(r.body)["predictionRequest"]["candidates"] for r in m.request_history]
+
+
+def test_key_is_canonical():
+    assert prediction_cache_key(42, "scalar", True, {"a": 1, "b": 2}) == \
+        prediction_cache_key("42", "scalar", True, {"b": 2, "a": 1})
+    assert prediction_cache_key(42, "scalar", True, {"a": 1}) != \
+        prediction_cache_key(42, "scalar", False, {"a": 1})
+
+
+def test_lru_eviction():
+    cache = PredictionCache(max_size=2)
+    cache.set_many([("a", {"v": 1}), ("b", {"v": 2})])
+    cache.get_many(["a"])
+    cache.set_many([("c", {"v": 3})])
+    assert cache.get_many(["a", "b", "c"]) == [{"v": 1}, None, {"v": 3}]
+
+
+def test_callers_get_their_own_copies(tmpdir):
+    for cache in [PredictionCache(), SqlitePredictionCache(os.path.join(str(tmpdir), "predictions.db"))]:
+        assert isinstance(cache, BasePredictionCache)
+        prediction = {"y": [1.0, 0.1]}
+        cache.set_many([("a", prediction)])
+        prediction["y"][0] = 2.0
+        first, = cache.get_many(["a"])
+        first["y"][0] = 3.0
+        assert cache.get_many(["a"]) == [{"y": [1.0, 0.1]}]
+
+
+def test_only_misses_are_sent():
+    client = ModelsClient("key", site, prediction_cache=PredictionCache())
+    with requests_mock.mock() as m:
+        _mock_predict(m)
+        client.predict(42, [{"x": 1}, {"x": 2}])
+        results = client.predict(42, [{"x": 2}, {"x": 3}, {"x": 3}, {"x": 1}])
+        assert _sent_candidates(m) == [[{"x": 1}, {"x": 2}], [{"x": 3}]]
+
+    assert [r.get_value("y").value for r in results] == [4.0, 6.0, 6.0, 2.0]
+
+
+def test_short_reply_is_not_cached():
+    client = ModelsClient("key", site, prediction_cache=PredictionCache())
+    with requests_mock.mock() as m:
+        m.post(predict_url, json={"candidates": [{"y": [2.0, 0.1]}]})
+        with pytest.raises(CitrinationClientError):
+            client.predict(42, [{"x": 1}, {"x": 2}])
+
+    assert len(client.prediction_cache) == 0
+
+
+def test_fully_cached_batch_makes_no_requests():
+    client = ModelsClient("key", site, prediction_cache=PredictionCache())
+    candidates = [{"x": i} for i in range(10)]
+    with requests_mock.mock() as m:
+        _mock_predict(m)
+        client.predict_batch(42, candidates, chunk_size=3)
+        calls = m.call_count
+        table = client.predict_table(42, candidates)
+        assert m.call_count == calls
+
+    assert list(table["y"].values) == [i * 2.0 for i in range(10)]
+
+
+def test_invalidation():
+    client = ModelsClient("key", site, prediction_cache=PredictionCache())
+    with requests_mock.mock() as m:
+        _mock_predict(m)
+        client.predict(42, [{"x": 1}])
+        client.invalidate_prediction_cache(42)
+        client.predict(42, [{"x": 1}])
+        assert m.call_count == 2
+
+
+def test_sqlite_cache_persists(tmpdir):
+    path = os.path.join(str(tmpdir), "predictions.db")
+    cache = SqlitePredictionCache(path, max_size=2)
+    cache.set_many([(prediction_cache_key(42, "scalar", True, {"x": i}), {"y": [i, 0.1]}) for i in range(3)])
+    assert len(cache) == 2
+    cache.close()
+
+    cache = SqlitePredictionCache(path, max_size=2)
+    keys = [prediction_cache_key(42, "scalar", True, {"x": i}) for i in range(3)]
+    assert cache.get_many(keys) == [None, {"y": [1, 0.1]}, {"y": [2, 0.1]}]
+    cache.invalidate(42)
+    assert len(cache) == 0
@@ -0,0 +1,62 @@
+from citrination_client.models import PredictionTable, PredictedValue
+from citrination_client.util import arrays
+import math
+import pytest
+
+candidates = [
+    {"Band gap": [1.5, 0.2], "Color": ["Gray", None]},
+    {"Band gap": [2.5, 0.3], "Color": ["Red", None]},
+    {"Band gap": [3, 0.1]},
+]
+
+
+def test_column_access():
+    table = PredictionTable.from_candidates(candidates)
+    assert len(table) == 3
+    assert table.all_keys() == ["Band gap", "Color"]
+    assert table["Band gap"].values.dtype.kind == "f"
+    assert list(table["Band gap"].values) == [1.5, 2.5, 3.0]
+    assert list(table["Band gap"].losses) == [0.2, 0.3, 0.1]
+    assert list(table["Color"].values) == ["Gray", "Red", None]
+    assert all(math.isnan(l) for l in table["Color"].losses)
+
+
+def test_row_view_matches_prediction_result():
+    table = PredictionTable.from_candidates(candidates)
+    value = table[1].get_value("Band gap")
+    assert isinstance(value, PredictedValue)
+    assert value.key == "Band gap"
+    assert value.value == 2.5
+    assert value.loss == 0.3
+    assert type(value.value) is float
+    assert table[0].get_value("Color").loss is None
+    assert table[2].get_value("Color") is None
+    assert table[-1].get_value("Band gap").value == 3.0
+    assert table[0].get_value("Not predicted") is None
+    assert [r.get_value("Band gap").value for r in table] == [1.5, 2.5, 3.0]
+
+
+def test_row_keys_are_those_predicted_for_the_row():
+    table = PredictionTable.from_candidates([
+        {"Band gap": [1.5, 0.2]},
+        {"Color": ["Red", None], "Density": [2, 0.5]},
+    ])
+    assert table.all_keys() == ["Band gap", "Color", "Density"]
+    assert table[0].all_keys() == ["Band gap"]
+    assert table[1].all_keys() == ["Color", "Density"]
+    for row in table:
+        assert all(row.get_value(key) is not None for key in row.all_keys())
+
+
+def test_row_out_of_range():
+    table = PredictionTable.from_candidates(candidates)
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_columns_without_numpy(monkeypatch):
+    monkeypatch.setattr(arrays, "numpy", None)
+    table = PredictionTable.from_candidates(candidates)
+    assert table["Band gap"].values.typecode == "d"
+    assert table["Color"].values == ["Gray", "Red", None]
+    assert table[0].get_value("Band gap").value == 1.5
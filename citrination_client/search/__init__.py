@@ -1,43 +1,67 @@
-from citrination_client.search.core.query.boolean_filter import BooleanFilter
-from citrination_client.search.core.query.data_query import DataQuery
-from citrination_client.search.core.query.data_scope import DataScope
-from citrination_client.search.core.query.filter import Filter
-from citrination_client.search.core.query.multi_query import MultiQuery
-from citrination_client.search.dataset.query.dataset_query import DatasetQuery
-from citrination_client.search.dataset.query.dataset_returning_query import DatasetReturningQuery
-from citrination_client.search.dataset.result.dataset_multi_search_result import DatasetMultiSearchResult
-from citrination_client.search.dataset.result.dataset_multi_search_result_element import DatasetMultiSearchResultElement
-from citrination_client.search.dataset.result.dataset_search_hit import DatasetSearchHit
-from citrination_client.search.dataset.result.dataset_search_result import DatasetSearchResult
-from citrination_client.search.file.query.file_query import FileQuery
-from citrination_client.search.file.query.file_returning_query import FileReturningQuery
-from citrination_client.search.file.result.file_multi_search_result import FileMultiSearchResult
-from citrination_client.search.file.result.file_multi_search_result_element import FileMultiSearchResultElement
-from citrination_client.search.file.result.file_search_hit import FileSearchHit
-from citrination_client.search.file.result.file_search_result import FileSearchResult
-from citrination_client.search.pif.query.chemical.chemical_field_query import ChemicalFieldQuery
-from citrination_client.search.pif.query.chemical.chemical_filter import ChemicalFilter
-from citrination_client.search.pif.query.chemical.composition_query import CompositionQuery
-from citrination_client.search.pif.query.core.base_field_query import BaseFieldQuery
-from citrination_client.search.pif.query.core.base_object_query import BaseObjectQuery
-from citrination_client.search.pif.query.core.classification_query import ClassificationQuery
-from citrination_client.search.pif.query.core.display_item_query import DisplayItemQuery
-from citrination_client.search.pif.query.core.field_query import FieldQuery
-from citrination_client.search.pif.query.core.file_reference_query import FileReferenceQuery
-from citrination_client.search.pif.query.core.id_query import IdQuery
-from citrination_client.search.pif.query.core.name_query import NameQuery
-from citrination_client.search.pif.query.core.pages_query import PagesQuery
-from citrination_client.search.pif.query.core.process_step_query import ProcessStepQuery
-from citrination_client.search.pif.query.core.property_query import PropertyQuery
-from citrination_client.search.pif.query.core.quantity_query import QuantityQuery
-from citrination_client.search.pif.query.core.reference_query import ReferenceQuery
-from citrination_client.search.pif.query.core.source_query import SourceQuery
-from citrination_client.search.pif.query.core.value_query import ValueQuery
-from citrination_client.search.pif.query.extraction_sort import ExtractionSort
-from citrination_client.search.pif.query.pif_system_query import PifSystemQuery
-from citrination_client.search.pif.query.pif_system_returning_query import PifSystemReturningQuery
-from citrination_client.search.pif.result.pif_multi_search_result import PifMultiSearchResult
-from citrination_client.search.pif.result.pif_multi_search_result_element import PifMultiSearchResultElement
-from citrination_client.search.pif.result.pif_search_hit import PifSearchHit
-from citrination_client.search.pif.result.pif_search_result import PifSearchResult
-from citrination_client.search.client import SearchClient
\ No newline at end of file
+from citrination_client.util.lazy import lazy_attributes
+
+# Submodules are attributes of the package too, imported when first accessed
+_submodules = {
+    "client": "citrination_client.search.client",
+    "compiled_query": "citrination_client.search.compiled_query",
+    "core": "citrination_client.search.core",
+    "dataset": "citrination_client.search.dataset",
+    "file": "citrination_client.search.file",
+    "multi_search_scheduler": "citrination_client.search.multi_search_scheduler",
+    "pif": "citrination_client.search.pif",
+    "query_encoder": "citrination_client.search.query_encoder",
+    "query_serializer": "citrination_client.search.query_serializer",
+    "result_decoder": "citrination_client.search.result_decoder",
+    "routes": "citrination_client.search.routes"
+}
+
+# Attributes are imported from their modules when first accessed
+lazy_attributes(globals(), {
+    "BooleanFilter": "citrination_client.search.core.query.boolean_filter",
+    "DataQuery": "citrination_client.search.core.query.data_query",
+    "DataScope": "citrination_client.search.core.query.data_scope",
+    "Filter": "citrination_client.search.core.query.filter",
+    "MultiQuery": "citrination_client.search.core.query.multi_query",
+    "DatasetQuery": "citrination_client.search.dataset.query.dataset_query",
+    "DatasetReturningQuery": "citrination_client.search.dataset.query.dataset_returning_query",
+    "DatasetMultiSearchResult": "citrination_client.search.dataset.result.dataset_multi_search_result",
+    "DatasetMultiSearchResultElement": "citrination_client.search.dataset.result.dataset_multi_search_result_element",
+    "DatasetSearchHit": "citrination_client.search.dataset.result.dataset_search_hit",
+    "DatasetSearchResult": "citrination_client.search.dataset.result.dataset_search_result",
+    "FileQuery": "citrination_client.search.file.query.file_query",
+    "FileReturningQuery": "citrination_client.search.file.query.file_returning_query",
+    "FileMultiSearchResult": "citrination_client.search.file.result.file_multi_search_result",
+    "FileMultiSearchResultElement": "citrination_client.search.file.result.file_multi_search_result_element",
+    "FileSearchHit": "citrination_client.search.file.result.file_search_hit",
+    "FileSearchResult": "citrination_client.search.file.result.file_search_result",
+    "ChemicalFieldQuery": "citrination_client.search.pif.query.chemical.chemical_field_query",
+    "ChemicalFilter": "citrination_client.search.pif.query.chemical.chemical_filter",
+    "CompositionQuery": "citrination_client.search.pif.query.chemical.composition_query",
+    "BaseFieldQuery": "citrination_client.search.pif.query.core.base_field_query",
+    "BaseObjectQuery": "citrination_client.search.pif.query.core.base_object_query",
+    "ClassificationQuery": "citrination_client.search.pif.query.core.classification_query",
+    "DisplayItemQuery": "citrination_client.search.pif.query.core.display_item_query",
+    "FieldQuery": "citrination_client.search.pif.query.core.field_query",
+    "FileReferenceQuery": "citrination_client.search.pif.query.core.file_reference_query",
+    "IdQuery": "citrination_client.search.pif.query.core.id_query",
+    "NameQuery": "citrination_client.search.pif.query.core.name_query",
+    "PagesQuery": "citrination_client.search.pif.query.core.pages_query",
+    "ProcessStepQuery": "citrination_client.search.pif.query.core.process_step_query",
+    "PropertyQuery": "citrination_client.search.pif.query.core.property_query",
+    "QuantityQuery": "citrination_client.search.pif.query.core.quantity_query",
+    "ReferenceQuery": "citrination_client.search.pif.query.core.reference_query",
+    "SourceQuery": "citrination_client.search.pif.query.core.source_query",
+    "ValueQuery": "citrination_client.search.pif.query.core.value_query",
+    "ExtractionSort": "citrination_client.search.pif.query.extraction_sort",
+    "PifSystemQuery": "citrination_client.search.pif.query.pif_system_query",
+    "PifSystemReturningQuery": "citrination_client.search.pif.query.pif_system_returning_query",
+    "ExtractedColumns": "citrination_client.search.pif.result.extracted_columns",
+    "PifMultiSearchResult": "citrination_client.search.pif.result.pif_multi_search_result",
+    "PifMultiSearchResultElement": "citrination_client.search.pif.result.pif_multi_search_result_element",
+    "PifSearchHit": "citrination_client.search.pif.result.pif_search_hit",
+    "PifSearchResult": "citrination_client.search.pif.result.pif_search_result",
+    "PifMultiSearchScheduler": "citrination_client.search.multi_search_scheduler",
+    "SearchClient": "citrination_client.search.client"
+}, _submodules)
+
+del lazy_attributes
@@ -1,15 +1,33 @@
-from citrination_client.search.query_encoder import QueryEncoder
-from citrination_client.search import *
+from citrination_client.search.query_encoder import encode_query
+from citrination_client.search.result_decoder import decode_search_result, decode_pif_multi_search_result
+from citrination_client.search.compiled_query import CompiledQuery
+from citrination_client.search.multi_search_scheduler import PifMultiSearchScheduler, DEFAULT_BATCH_SIZE
+from citrination_client.search.core.query.data_query import DataQuery
+from citrination_client.search.core.query.filter import Filter
+from citrination_client.search.dataset.query.dataset_query import DatasetQuery
+from citrination_client.search.dataset.result.dataset_search_result import DatasetSearchResult
+from citrination_client.search.pif.query.chemical.chemical_field_query import ChemicalFieldQuery
+from citrination_client.search.pif.query.chemical.chemical_filter import ChemicalFilter
+from citrination_client.search.pif.query.core.field_query import FieldQuery
+from citrination_client.search.pif.query.core.property_query import PropertyQuery
+from citrination_client.search.pif.query.core.reference_query import ReferenceQuery
+from citrination_client.search.pif.query.pif_system_query import PifSystemQuery
+from citrination_client.search.pif.query.pif_system_returning_query import PifSystemReturningQuery
+from citrination_client.search.pif.result.extracted_columns import ExtractedColumns
+from citrination_client.search.pif.result.pif_search_result import PifSearchResult
 from citrination_client.search import routes as routes
+from citrination_client.data import routes as data_routes
 from citrination_client.util import config as client_config
 from citrination_client.base.base_client import BaseClient
 from citrination_client.base.errors import RequestTimeoutException
 from citrination_client.base.errors import CitrinationClientError
+from citrination_client.data.pif_cache import pif_cache_key
 
-from pypif.util.case import to_camel_case
-from pypif.util.case import keys_to_snake_case
 
-from copy import deepcopy
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from six import string_types
 import json
 import requests
 
@@ -18,13 +36,44 @@ MAX_QUERY_DEPTH = 50000
 
 
 class SearchClient(BaseClient):
-    def __init__(self, api_key, webserver_host="https://citrination.com", suppress_warnings=False):
+    def __init__(self, api_key, webserver_host="https://citrination.com", suppress_warnings=False, session=None,
+                 retry_policy=None, pif_cache=None, json_backend=None):
+        """
+        Constructor.
+
+        :param api_key: A users API key, as a string
+        :type api_key: str
+        :param webserver_host: The base URL of the citrination site, e.g. https://citrination.com
+        :type webserver_host: str
+        :param suppress_warnings: Whether or not usage warnings should be
+            printed to stdout
+        :type suppress_warnings: bool
+        :param session: The HTTP session to make requests with
+        :type session: requests.Session
+        :param retry_policy: The policy used to retry rate limited and failed
+            requests
+        :type retry_policy: :class:`RetryPolicy`
+        :param pif_cache: If supplied, PIF search results are requested
+            without their systems, which are taken from this cache and only
+            requested for the hits missing from it
+        :type pif_cache: :class:`PifCache`
+        :param json_backend: The backend used to encode request bodies and
+            decode response bodies
+        :type json_backend: :class:`JsonBackend`
+        """
         members = [
             "pif_search",
+            "iter_pif_search",
+            "pif_search_columns",
             "pif_multi_search",
-            "dataset_search"
+            "pif_multi_search_batched",
+            "dataset_search",
+            "iter_dataset_search"
         ]
-        super(SearchClient, self).__init__(api_key, webserver_host, members, suppress_warnings=suppress_warnings)
+        super(SearchClient, self).__init__(api_key, webserver_host, members, suppress_warnings=suppress_warnings,
+                                           session=session, retry_policy=retry_policy,
+                                           json_backend=json_backend)
+        self.pif_cache = pif_cache
 
     def _handle_response(self, response, failure_message=DEFAULT_FAILURE_MESSAGE):
         if response.status_code == 204:
@@ -39,26 +88,21 @@ class SearchClient(BaseClient):
         :param returning_query: The PIF system or Dataset query to execute.
         :type returning_query: :class:`PifSystemReturningQuery` or :class: `DatasetReturningQuery`
         """
+        _validate_search_query(returning_query)
 
-        start_index = returning_query.from_index or 0
-        size = returning_query.size or 0
-
-        if start_index < 0:
-            raise CitrinationClientError(
-                "start_index cannot be negative. Please enter a value greater than or equal to zero")
-        if size < 0:
-            raise CitrinationClientError("Size cannot be negative. Please enter a value greater than or equal to zero")
-        if start_index + size > MAX_QUERY_DEPTH:
-            raise CitrinationClientError(
-                "Citrination does not support pagination past the {0}th result. Please reduce either the from_index and/or size such that their sum is below {0}".format(
-                    MAX_QUERY_DEPTH))
-
-    def pif_search(self, pif_system_returning_query):
+    def pif_search(self, pif_system_returning_query, parallelism=1, include_system=True):
         """
         Run a PIF query against Citrination.
 
         :param pif_system_returning_query: The PIF system query to execute.
         :type pif_system_returning_query: :class:`PifSystemReturningQuery`
+        :param parallelism: The number of result pages to fetch concurrently
+            once the total number of hits is known
+        :type parallelism: int
+        :param include_system: Whether the matched PIF systems should be
+            returned. Pass False to skip the system payloads entirely when
+            only extracted values are needed.
+        :type include_system: bool
         :return: :class:`PifSearchResult` object with the results of the query.
         :rtype: :class:`PifSearchResult`
         """
@@ -66,15 +110,43 @@ class SearchClient(BaseClient):
         self._validate_search_query(pif_system_returning_query)
         return self._execute_search_query(
             pif_system_returning_query,
-            PifSearchResult
+            PifSearchResult,
+            parallelism=parallelism,
+            return_system=_return_system_override(include_system)
         )
 
-    def dataset_search(self, dataset_returning_query):
+    def pif_search_columns(self, pif_system_returning_query, include_paths=False, parallelism=1):
+        """
+        Run a PIF query against Citrination and collect the extracted values
+        of every hit into one typed column per extracted key. PIF systems are
+        not requested, and hits are discarded as each page is consumed.
+
+        :param pif_system_returning_query: The PIF system query to execute.
+        :type pif_system_returning_query: :class:`PifSystemReturningQuery`
+        :param include_paths: Whether to also collect the extracted paths.
+            The query should set ``return_extracted_path`` for paths to be
+            returned by Citrination.
+        :type include_paths: bool
+        :param parallelism: The number of result pages to fetch concurrently
+            once the total number of hits is known
+        :type parallelism: int
+        :return: The extracted values, by column
+        :rtype: :class:`ExtractedColumns`
+        """
+        columns = ExtractedColumns(include_paths=include_paths)
+        columns.add_hits(self.iter_pif_search(
+            pif_system_returning_query, parallelism=parallelism, include_system=False))
+        return columns
+
+    def dataset_search(self, dataset_returning_query, parallelism=1):
         """
         Run a dataset query against Citrination.
 
         :param dataset_returning_query: :class:`DatasetReturningQuery` to execute.
         :type dataset_returning_query: :class:`DatasetReturningQuery`
+        :param parallelism: The number of result pages to fetch concurrently
+            once the total number of hits is known
+        :type parallelism: int
         :return: Dataset search result object with the results of the query.
         :rtype: :class:`DatasetSearchResult`
         """
@@ -82,60 +154,244 @@ class SearchClient(BaseClient):
         self._validate_search_query(dataset_returning_query)
         return self._execute_search_query(
             dataset_returning_query,
-            DatasetSearchResult
+            DatasetSearchResult,
+            parallelism=parallelism
         )
 
-    def _execute_search_query(self, returning_query, result_class):
+    def iter_pif_search(self, pif_system_returning_query, parallelism=1, include_system=True):
+        """
+        Run a PIF query against Citrination, yielding hits page by page as
+        they arrive rather than collecting them into a single result.
+
+        :param pif_system_returning_query: The PIF system query to execute.
+        :type pif_system_returning_query: :class:`PifSystemReturningQuery`
+        :param parallelism: The number of result pages to fetch concurrently
+            once the total number of hits is known
+        :type parallelism: int
+        :param include_system: Whether the matched PIF systems should be
+            returned. Pass False to skip the system payloads entirely when
+            only extracted values are needed.
+        :type include_system: bool
+        :return: A generator of the hits matching the query.
+        :rtype: generator of :class:`PifSearchHit`
+        """
+
+        self._validate_search_query(pif_system_returning_query)
+        return self._iter_search_hits(
+            pif_system_returning_query,
+            PifSearchResult,
+            parallelism=parallelism,
+            return_system=_return_system_override(include_system)
+        )
+
+    def iter_dataset_search(self, dataset_returning_query, parallelism=1):
+        """
+        Run a dataset query against Citrination, yielding hits page by page
+        as they arrive rather than collecting them into a single result.
+
+        :param dataset_returning_query: :class:`DatasetReturningQuery` to execute.
+        :type dataset_returning_query: :class:`DatasetReturningQuery`
+        :param parallelism: The number of result pages to fetch concurrently
+            once the total number of hits is known
+        :type parallelism: int
+        :return: A generator of the hits matching the query.
+        :rtype: generator of :class:`DatasetSearchHit`
+        """
+
+        self._validate_search_query(dataset_returning_query)
+        return self._iter_search_hits(
+            dataset_returning_query,
+            DatasetSearchResult,
+            parallelism=parallelism
+        )
+
+    def _execute_search_query(self, returning_query, result_class, parallelism=1, return_system=None):
         """
         Run a PIF query against Citrination.
 
         :param returning_query: :class:`BaseReturningQuery` to execute.
         :param result_class: The class of the result to return.
+        :param parallelism: The number of pages to request concurrently.
+        :param return_system: If not None, overrides the return_system flag
+            of the query.
         :return: ``result_class`` object with the results of the query.
         """
-        if returning_query.from_index:
-            from_index = returning_query.from_index
-        else:
-            from_index = 0
+        time = 0.0;
+        hits = [];
+        for partial_results in self._iter_search_pages(returning_query, result_class, parallelism, return_system):
+            total = partial_results.total_num_hits
+            time += partial_results.took or 0.0
+            if partial_results.hits is not None:
+                hits.extend(partial_results.hits)
 
-        if returning_query.size != None:
-            size = min(returning_query.size, client_config.max_query_size)
-        else:
-            size = client_config.max_query_size
+        return result_class(hits=hits, total_num_hits=total, took=time)
+
+    def _iter_search_hits(self, returning_query, result_class, parallelism=1, return_system=None):
+        for partial_results in self._iter_search_pages(returning_query, result_class, parallelism, return_system):
+            for hit in partial_results.hits or []:
+                yield hit
+
+    def _iter_search_pages(self, returning_query, result_class, parallelism=1, return_system=None):
+        """
+        Generator over the pages of results for a query, in order.
+
+        :param returning_query: :class:`BaseReturningQuery` to execute.
+        :param result_class: The class of each page of results.
+        :param parallelism: The number of pages to request concurrently.
+        :param return_system: If not None, overrides the return_system flag
+            of the query.
+        :return: A generator of ``result_class`` objects, one per page.
+        """
+        if parallelism < 1:
+            raise CitrinationClientError("parallelism must be at least 1")
 
-        if (size == client_config.max_query_size and
-                    size != returning_query.size):
+        from_index, size = _search_bounds(returning_query)
+
+        if size != returning_query.size:
             self._warn("Query size greater than max system size - only {} results will be returned".format(size))
 
-        time = 0.0;
-        hits = [];
+        # With a PIF cache, systems are requested separately for the hits
+        # which are not already cached
+        attach_systems = self.pif_cache is not None and result_class is PifSearchResult and \
+            return_system is not False and returning_query.return_system is not False
+        if attach_systems:
+            return_system = False
+
+        compiled_query = CompiledQuery(returning_query, return_system=return_system,
+                                       json_backend=self.json_backend)
+
+        if parallelism > 1:
+            for partial_results in self._iter_parallel_search_pages(
+                    compiled_query, result_class, from_index, size, parallelism, attach_systems):
+                yield partial_results
+            return
+
+        num_hits = 0
         while True:
-            sub_query = deepcopy(returning_query)
-            sub_query.from_index = from_index + len(hits)
-            partial_results = self._search_internal(sub_query, result_class)
+            page_from_index = from_index + num_hits
+            partial_results = self._search_compiled(
+                compiled_query, result_class, page_from_index, compiled_query.size, attach_systems)
             total = partial_results.total_num_hits
-            time += partial_results.took
             if partial_results.hits is not None:
-                hits.extend(partial_results.hits)
-            if len(hits) >= size or len(hits) >= total or sub_query.from_index >= total:
+                num_hits += len(partial_results.hits)
+            yield partial_results
+            if num_hits >= size or num_hits >= total or page_from_index >= total:
                 break
 
-        return result_class(hits=hits, total_num_hits=total, took=time)
+    def _iter_parallel_search_pages(self, compiled_query, result_class, from_index, size, parallelism,
+                                    attach_systems=False):
+        """
+        Fetches the first page of results to learn the total number of hits
+        and the page size, then requests the remaining pages concurrently.
+        Pages are yielded in order, and no more than ``parallelism`` pages are
+        requested ahead of the consumer.
+
+        :param compiled_query: :class:`CompiledQuery` to execute.
+        :param result_class: The class of each page of results.
+        :param from_index: The index of the first hit to return.
+        :param size: The maximum number of hits to return.
+        :param parallelism: The maximum number of pages in flight at once.
+        :param attach_systems: Whether PIF systems are attached to the hits
+            from the PIF cache.
+        :return: A generator of ``result_class`` objects, one per page.
+        """
+        first_results = self._search_compiled(
+            compiled_query, result_class, from_index, compiled_query.size, attach_systems)
+        yield first_results
+
+        total = first_results.total_num_hits
+        page_size = len(first_results.hits or [])
+        end_index = min(from_index + size, total)
+        if page_size == 0 or from_index + page_size >= end_index:
+            return
+
+        def fetch_page(page_from_index):
+            page_size_requested = min(page_size, end_index - page_from_index)
+            return self._search_compiled(
+                compiled_query, result_class, page_from_index, page_size_requested, attach_systems)
+
+        page_indices = iter(range(from_index + page_size, end_index, page_size))
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            pending = deque(executor.submit(fetch_page, i) for i in islice(page_indices, parallelism))
+            try:
+                while pending:
+                    partial_results = pending.popleft().result()
+                    for i in islice(page_indices, 1):
+                        pending.append(executor.submit(fetch_page, i))
+                    yield partial_results
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def _search_internal(self, returning_query, result_class):
-        if result_class == PifSearchResult:
-            route = routes.pif_search
-            failure_message = "Error while making PIF search request"
+        return self._post_search(encode_query(returning_query, self.json_backend), result_class)
+
+    def _search_compiled(self, compiled_query, result_class, from_index, size, attach_systems=False):
+        results = self._post_search(compiled_query.serialize(from_index, size), result_class)
+        if attach_systems:
+            self._attach_cached_systems(results.hits or [])
+        return results
 
-        elif result_class == DatasetSearchResult:
-            route = routes.dataset_search
-            failure_message = "Error while making dataset search request"
+    def _attach_cached_systems(self, hits):
+        """
+        Sets the system of each hit from the PIF cache, requesting the systems
+        which are not cached and adding them to it.
+
+        :param hits: Hits of a search made without returning systems
+        :type hits: list of :class:`PifSearchHit`
+        """
+        keys = [_hit_cache_key(hit.id, hit.dataset, hit.dataset_version) for hit in hits]
+        known_keys = list(OrderedDict.fromkeys(k for k in keys if k is not None))
+        systems = dict(zip(known_keys, self.pif_cache.get_many(known_keys)))
+
+        missing = [k for k in known_keys if systems[k] is None]
+        if missing:
+            fetched = self._fetch_pif_jsons(missing)
+            self.pif_cache.set_many(list(fetched.items()))
+            systems.update(fetched)
+
+        for hit, key in zip(hits, keys):
+            if key is not None:
+                hit.system = systems[key]
+
+    def _fetch_pif_jsons(self, keys):
+        """
+        Requests the JSON of several PIFs, with a single search matching their
+        uids and individual requests for any the search did not return.
+
+        :param keys: Keys built with :func:`pif_cache_key`
+        :type keys: list of tuple
+        :return: The JSON of each PIF, by key
+        :rtype: dict
+        """
+        query = _pif_uid_query([k[2] for k in keys], dataset_ids=[k[0] for k in keys])
+        response_json = self._get_success_json(self._post(
+            routes.pif_search, data=encode_query(query, self.json_backend),
+            failure_message=DEFAULT_FAILURE_MESSAGE, idempotent=True))
+
+        wanted = set(keys)
+        pif_jsons = {}
+        for hit in response_json['results'].get('hits') or []:
+            key = _hit_cache_key(hit.get('id'), hit.get('dataset'), hit.get('datasetVersion'))
+            system = hit.get('system')
+            if key in wanted and system is not None:
+                pif_jsons[key] = system if isinstance(system, string_types) else \
+                    self.json_backend.dumps(system).decode("utf-8")
+
+        for key in keys:
+            if key not in pif_jsons:
+                response = self._get(data_routes.pif_dataset_version_uid(*key),
+                                     failure_message="An error occurred retrieving PIF {}".format(key[2]))
+                pif_jsons[key] = response.content.decode("utf-8")
+        return pif_jsons
+
+    def _post_search(self, data, result_class):
+        route, failure_message = _search_route(result_class)
 
         response_json = self._get_success_json(self._post(
-            route, data=json.dumps(returning_query, cls=QueryEncoder),
-            failure_message=failure_message))
+            route, data=data, failure_message=failure_message, idempotent=True))
 
-        return result_class(**keys_to_snake_case(response_json['results']))
+        return decode_search_result(response_json['results'], result_class)
 
     def pif_multi_search(self, multi_query):
         """
@@ -146,10 +402,29 @@ class SearchClient(BaseClient):
         """
         failure_message = "Error while making PIF multi search request"
         response_dict = self._get_success_json(
-            self._post(routes.pif_multi_search, data=json.dumps(multi_query, cls=QueryEncoder),
-                       failure_message=failure_message))
+            self._post(routes.pif_multi_search, data=encode_query(multi_query, self.json_backend),
+                       failure_message=failure_message, idempotent=True))
+
+        return decode_pif_multi_search_result(response_dict['results'])
 
-        return PifMultiSearchResult(**keys_to_snake_case(response_dict['results']))
+    def pif_multi_search_batched(self, queries, batch_size=DEFAULT_BATCH_SIZE, max_workers=4):
+        """
+        Run many independent PIF queries against Citrination, packed into
+        :class:`MultiQuery` batches which are sent concurrently.
+
+        :param queries: The PIF system queries to execute.
+        :type queries: list of :class:`PifSystemReturningQuery`
+        :param batch_size: The maximum number of queries per request
+        :type batch_size: int
+        :param max_workers: The maximum number of batches in flight at once
+        :type max_workers: int
+        :return: The result element of each query, in the order the queries
+            were given
+        :rtype: list of :class:`PifMultiSearchResultElement`
+        """
+        with PifMultiSearchScheduler(self, batch_size=batch_size, max_workers=max_workers) as scheduler:
+            futures = [scheduler.submit(query) for query in queries]
+        return [future.result() for future in futures]
 
     def generate_simple_chemical_query(self, name=None, chemical_formula=None, property_name=None, property_value=None,
                                        property_min=None, property_max=None, property_units=None, reference_doi=None,
@@ -259,3 +534,96 @@ class SearchClient(BaseClient):
             return values
         else:
             return [values]
+
+
+def _validate_search_query(returning_query):
+    """
+    Checks to see that the query will not exceed the max query depth
+
+    :param returning_query: The PIF system or Dataset query to execute.
+    :type returning_query: :class:`PifSystemReturningQuery` or :class: `DatasetReturningQuery`
+    """
+    start_index = returning_query.from_index or 0
+    size = returning_query.size or 0
+
+    if start_index < 0:
+        raise CitrinationClientError(
+            "start_index cannot be negative. Please enter a value greater than or equal to zero")
+    if size < 0:
+        raise CitrinationClientError("Size cannot be negative. Please enter a value greater than or equal to zero")
+    if start_index + size > MAX_QUERY_DEPTH:
+        raise CitrinationClientError(
+            "Citrination does not support pagination past the {0}th result. Please reduce either the from_index and/or size such that their sum is below {0}".format(
+                MAX_QUERY_DEPTH))
+
+
+def _search_bounds(returning_query):
+    """
+    The index of the first hit and the maximum number of hits to return for
+    a query, capped at the maximum query size.
+
+    :return: A tuple of the from index and size
+    :rtype: tuple
+    """
+    from_index = returning_query.from_index or 0
+    if returning_query.size != None:
+        size = min(returning_query.size, client_config.max_query_size)
+    else:
+        size = client_config.max_query_size
+    return from_index, size
+
+
+def _search_route(result_class):
+    """
+    The route and failure message for searches returning ``result_class``.
+
+    :return: A tuple of the route and failure message
+    :rtype: tuple
+    """
+    if result_class == PifSearchResult:
+        return routes.pif_search, "Error while making PIF search request"
+    elif result_class == DatasetSearchResult:
+        return routes.dataset_search, "Error while making dataset search request"
+    raise CitrinationClientError("Unsupported search result class {}".format(result_class))
+
+
+def _pif_uid_query(uids, dataset_ids=None):
+    """
+    Builds a query returning the systems of the PIFs with the given uids.
+
+    :param uids: The uids of the PIFs
+    :type uids: list of str
+    :param dataset_ids: If supplied, only PIFs in these datasets are matched
+    :type dataset_ids: list
+    :return: The query
+    :rtype: :class:`PifSystemReturningQuery`
+    """
+    uids = list(OrderedDict.fromkeys(uids))
+    dataset = None
+    size = len(uids)
+    if dataset_ids is not None:
+        dataset_ids = list(OrderedDict.fromkeys(str(d) for d in dataset_ids))
+        dataset = DatasetQuery(id=[Filter(equal=d) for d in dataset_ids])
+        # A uid can be reused in different datasets
+        size *= len(dataset_ids)
+    return PifSystemReturningQuery(
+        query=DataQuery(dataset=dataset, system=PifSystemQuery(uid=[Filter(equal=uid) for uid in uids])),
+        size=size,
+        return_system=True)
+
+def _hit_cache_key(hit_id, dataset, dataset_version):
+    """
+    The PIF cache key of a search hit, whose ID is made up of its dataset,
+    dataset version and uid. None if the ID is not in that form.
+    """
+    parts = (hit_id or "").split("/")
+    if len(parts) < 3 or dataset is None or dataset_version is None:
+        return None
+    return pif_cache_key(dataset, dataset_version, "/".join(parts[2:]))
+
+def _return_system_override(include_system):
+    """
+    Only override the return_system flag of a query when the caller has
+    opted out of system payloads.
+    """
+    return None if include_system else False
@@ -0,0 +1,64 @@
+from citrination_client.base.json_backend import default_json_backend
+from citrination_client.search.query_encoder import QueryEncoder, encode_query
+
+class CompiledQuery(object):
+    """
+    A returning query which has been serialized to JSON once so that it can be
+    sent for many pages of results. Only the pagination parameters change from
+    page to page, so they are spliced into the serialized body rather than
+    copying and re-encoding the entire query tree for every request.
+    """
+
+    def __init__(self, returning_query, return_system=None, json_backend=None):
+        """
+        Constructor.
+
+        :param returning_query: The query to compile
+        :type returning_query: :class:`BaseReturningQuery`
+        :param return_system: If not None, overrides whether the matched PIF
+            systems are returned with each hit
+        :type return_system: bool
+        :param json_backend: The backend used to encode the query. If not
+            supplied, the standard library's json module is used.
+        :type json_backend: :class:`JsonBackend`
+        """
+        body = QueryEncoder().default(returning_query)
+        body.pop("from", None)
+        body.pop("size", None)
+        if return_system is not None:
+            body["returnSystem"] = return_system
+        self._body = encode_query(body, json_backend or default_json_backend())
+        self._from_index = returning_query.from_index
+        self._size = returning_query.size
+
+    @property
+    def from_index(self):
+        return self._from_index
+
+    @property
+    def size(self):
+        return self._size
+
+    def serialize(self, from_index=None, size=None):
+        """
+        Serializes the query for a single page of results.
+
+        :param from_index: The index of the first hit on the page. None
+            to omit the parameter.
+        :type from_index: int
+        :param size: The number of hits to request. None to omit the parameter.
+        :type size: int
+        :return: The UTF-8 encoded JSON request body
+        :rtype: bytes
+        """
+        pagination = []
+        if from_index is not None:
+            pagination.append(('"from":' + str(int(from_index))).encode("ascii"))
+        if size is not None:
+            pagination.append(('"size":' + str(int(size))).encode("ascii"))
+
+        if not pagination:
+            return self._body
+        if self._body[1:].strip() == b"}":
+            return b"{" + b",".join(pagination) + b"}"
+        return b"{" + b",".join(pagination) + b"," + self._body[1:]
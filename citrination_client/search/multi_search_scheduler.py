@@ -0,0 +1,102 @@
+from citrination_client.base.errors import CitrinationClientError
+from citrination_client.search.core.query.multi_query import MultiQuery
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+
+DEFAULT_BATCH_SIZE = 25
+
+
+class PifMultiSearchScheduler(object):
+    """
+    Packs independently submitted PIF queries into :class:`MultiQuery`
+    batches, which are sent with ``pif_multi_search`` on a pool of threads.
+    Each query gets a future which resolves to its own
+    :class:`PifMultiSearchResultElement`, so thousands of queries need only
+    dozens of requests.
+
+    A batch is sent as soon as it is full. Call :meth:`flush` to send a
+    partial batch, or use the scheduler as a context manager to send it and
+    wait for every batch on exit.
+    """
+
+    def __init__(self, search_client, batch_size=DEFAULT_BATCH_SIZE, max_workers=4):
+        """
+        Constructor.
+
+        :param search_client: The client used to run the batches
+        :type search_client: :class:`SearchClient`
+        :param batch_size: The maximum number of queries per request
+        :type batch_size: int
+        :param max_workers: The maximum number of batches in flight at once
+        :type max_workers: int
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._client = search_client
+        self._batch_size = batch_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._pending = []
+
+    @property
+    def batch_size(self):
+        return self._batch_size
+
+    def submit(self, pif_system_returning_query):
+        """
+        Schedules a query to run in the next batch.
+
+        :param pif_system_returning_query: The PIF system query to execute.
+        :type pif_system_returning_query: :class:`PifSystemReturningQuery`
+        :return: A future resolving to the result element of the query
+        :rtype: :class:`concurrent.futures.Future`
+        """
+        self._client._validate_search_query(pif_system_returning_query)
+        future = Future()
+        with self._lock:
+            self._pending.append((pif_system_returning_query, future))
+            if len(self._pending) >= self._batch_size:
+                self._dispatch()
+        return future
+
+    def flush(self):
+        """
+        Sends the queries which have been submitted but not yet sent.
+        """
+        with self._lock:
+            if self._pending:
+                self._dispatch()
+
+    def close(self):
+        """
+        Sends any remaining queries and waits for every batch to finish.
+        """
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _dispatch(self):
+        batch, self._pending = self._pending, []
+        self._executor.submit(self._run_batch, batch)
+
+    def _run_batch(self, batch):
+        try:
+            multi_result = self._client.pif_multi_search(MultiQuery(queries=[query for query, _ in batch]))
+            elements = multi_result.results or []
+            if len(elements) != len(batch):
+                raise CitrinationClientError(
+                    "Expected {} multi search results but got {}".format(len(batch), len(elements)))
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), element in zip(batch, elements):
+            future.set_result(element)
@@ -0,0 +1,140 @@
+from citrination_client.util.arrays import to_typed_array, object_array
+
+from collections import OrderedDict
+
+
+class ExtractedColumns(object):
+    """
+    Collects the ``extracted`` values of many :class:`PifSearchHit` objects
+    into one typed array per extracted key. Keys which are missing from some
+    hits are null filled: NaN in numeric columns and None otherwise.
+
+    Columns are NumPy arrays when NumPy is installed. Otherwise numeric
+    columns are :mod:`array` arrays and all other columns are lists.
+    """
+
+    def __init__(self, include_paths=False):
+        """
+        Constructor.
+
+        :param include_paths: Whether to also collect the ``extracted_path``
+            of each hit into columns of their own
+        :type include_paths: bool
+        """
+        self._include_paths = include_paths
+        self._num_rows = 0
+        self._values = OrderedDict()
+        self._paths = OrderedDict()
+        self._columns = None
+        self._path_columns = None
+
+    def __len__(self):
+        return self._num_rows
+
+    def __getitem__(self, key):
+        return self.columns[key]
+
+    def __contains__(self, key):
+        return key in self._values
+
+    @property
+    def keys(self):
+        """
+        The extracted keys, in the order they were first encountered.
+
+        :rtype: list of str
+        """
+        return list(self._values.keys())
+
+    @property
+    def columns(self):
+        """
+        A dictionary of extracted key to column of values.
+        """
+        if self._columns is None:
+            self._columns = OrderedDict((k, to_typed_array(v)) for k, v in self._values.items())
+        return self._columns
+
+    @property
+    def path_columns(self):
+        """
+        A dictionary of extracted key to column of paths in the PIF that the
+        values were extracted from. Empty unless ``include_paths`` is set.
+        """
+        if self._path_columns is None:
+            self._path_columns = OrderedDict((k, object_array(v)) for k, v in self._paths.items())
+        return self._path_columns
+
+    def add_hit(self, hit):
+        """
+        Appends a row for a single search hit.
+
+        :param hit: The hit to add
+        :type hit: :class:`PifSearchHit`
+        """
+        _append_row(self._values, hit.extracted, self._num_rows)
+        if self._include_paths:
+            _append_row(self._paths, hit.extracted_path, self._num_rows)
+        self._num_rows += 1
+        self._columns = None
+        self._path_columns = None
+
+    def add_hits(self, hits):
+        """
+        Appends a row for each of a sequence of search hits.
+
+        :param hits: The hits to add
+        :type hits: iterable of :class:`PifSearchHit`
+        """
+        for hit in hits:
+            self.add_hit(hit)
+
+    def to_pandas(self):
+        """
+        Builds a pandas DataFrame with one column per extracted key. Path
+        columns, if collected, are suffixed with ``_path``.
+
+        :rtype: pandas.DataFrame
+        """
+        import pandas
+        return pandas.DataFrame(self._all_columns(), columns=self._column_names())
+
+    def to_arrow(self):
+        """
+        Builds a pyarrow Table with one column per extracted key. Path
+        columns, if collected, are suffixed with ``_path``.
+
+        :rtype: pyarrow.Table
+        """
+        import pyarrow
+        columns = self._all_columns()
+        names = self._column_names()
+        return pyarrow.table([columns[n] for n in names], names=names)
+
+    def _column_names(self):
+        return self.keys + [_path_column_name(k) for k in self._paths]
+
+    def _all_columns(self):
+        columns = OrderedDict(self.columns)
+        for k, v in self.path_columns.items():
+            columns[_path_column_name(k)] = v
+        return columns
+
+
+def _path_column_name(key):
+    return "{}_path".format(key)
+
+
+def _append_row(columns, row, num_rows):
+    """
+    Appends the values of a row dictionary to the column lists, null filling
+    the columns missing from the row and back filling new columns.
+    """
+    row = row or {}
+    for key, value in row.items():
+        if key not in columns:
+            columns[key] = [None] * num_rows
+        columns[key].append(value)
+    for key, values in columns.items():
+        if len(values) == num_rows:
+            values.append(None)
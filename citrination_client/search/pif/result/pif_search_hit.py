@@ -19,7 +19,8 @@ class PifSearchHit(Serializable):
         :param dataset_version: Integer with the dataset version of the record.
         :param score: Score with the relevancy of the result.
         :param updated_at: String with the last time that the record was updated.
-        :param system: Pif System object that matched.
+        :param system: Pif System object that matched, or its JSON string or dictionary
+            representation. Raw representations are parsed on first access.
         :param extracted: Dictionary with a map of extracted property names to values.
         :param extracted_path: Dictionary with a map of extracted property names to paths in a PIF.
         """
@@ -102,17 +103,15 @@ class PifSearchHit(Serializable):
 
     @property
     def system(self):
+        if self._system is not None and not isinstance(self._system, Pio):
+            self._system = _load_system(self._system)
         return self._system
 
     @system.setter
     def system(self, system):
-        if system is None:
-            self._system = None
-        elif isinstance(system, string_types):
-            self._system = pif.loads(system)
-        elif isinstance(system, dict):
-            self._system = pif.loado(system)
-        elif isinstance(system, Pio):
+        # Strings and dictionaries are kept as they are and only parsed into
+        # a Pio the first time the system is read
+        if system is None or isinstance(system, (string_types, dict, Pio)):
             self._system = system
         else:
             raise TypeError('Not a valid system type: must be string, dict, or Pio, but got ' + str(type(system)))
@@ -144,3 +143,21 @@ class PifSearchHit(Serializable):
     @extracted_path.deleter
     def extracted_path(self):
         self._extracted_path = None
+
+    def as_dictionary(self):
+        # Parse a raw system before serializing so that it is written as a PIF
+        self.system
+        return super(PifSearchHit, self).as_dictionary()
+
+
+def _load_system(system):
+    """
+    Parses a raw system payload into a Pio.
+
+    :param system: The system as a JSON string or a dictionary
+    :return: The parsed system
+    :rtype: :class:`Pio`
+    """
+    if isinstance(system, string_types):
+        return pif.loads(system)
+    return pif.loado(system)
@@ -0,0 +1,60 @@
+from citrination_client.search import ExtractedColumns, PifSearchHit
+from citrination_client.util import arrays
+from array import array
+import math
+import pytest
+
+hits = [
+    PifSearchHit(extracted={"formula": "GaN", "band_gap": 3.4, "count": 1},
+                 extracted_path={"formula": "/chemicalFormula"}),
+    PifSearchHit(extracted={"formula": "Si", "count": 2}),
+    PifSearchHit(extracted={"formula": "C", "band_gap": 5, "count": 3, "color": "clear"}),
+]
+
+
+def _columns(**kwargs):
+    columns = ExtractedColumns(**kwargs)
+    columns.add_hits(hits)
+    return columns
+
+
+def test_columns_are_typed_and_null_filled():
+    columns = _columns()
+    assert len(columns) == 3
+    assert columns.keys == ["formula", "band_gap", "count", "color"]
+    assert list(columns["formula"]) == ["GaN", "Si", "C"]
+    assert columns["count"].dtype.kind == "i"
+    assert columns["band_gap"].dtype.kind == "f"
+    assert columns["band_gap"][0] == 3.4
+    assert math.isnan(columns["band_gap"][1])
+    assert list(columns["color"]) == [None, None, "clear"]
+
+
+def test_paths_collected_on_request():
+    assert _columns().path_columns == {}
+    paths = _columns(include_paths=True).path_columns
+    assert list(paths["formula"]) == ["/chemicalFormula", None, None]
+
+
+def test_columns_without_numpy(monkeypatch):
+    monkeypatch.setattr(arrays, "numpy", None)
+    columns = _columns()
+    assert isinstance(columns["count"], array)
+    assert list(columns["count"]) == [1, 2, 3]
+    assert columns["band_gap"].typecode == "d"
+    assert columns["formula"] == ["GaN", "Si", "C"]
+
+
+def test_columns_rebuilt_after_new_hits():
+    columns = _columns()
+    assert len(columns["count"]) == 3
+    columns.add_hit(PifSearchHit(extracted={"count": 4}))
+    assert list(columns["count"]) == [1, 2, 3, 4]
+    assert list(columns["formula"]) == ["GaN", "Si", "C", None]
+
+
+def test_to_pandas():
+    pandas = pytest.importorskip("pandas")
+    frame = _columns(include_paths=True).to_pandas()
+    assert list(frame.columns) == ["formula", "band_gap", "count", "color", "formula_path"]
+    assert frame["count"].tolist() == [1, 2, 3]
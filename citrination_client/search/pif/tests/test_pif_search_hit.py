@@ -0,0 +1,45 @@
+from citrination_client.search import PifSearchHit
+from pypif.obj.system import System
+from pypif import pif
+import json
+import pytest
+
+system_dict = {"category": "system", "uid": "abc123", "names": ["Gallium nitride"]}
+
+
+def test_system_parsed_lazily():
+    """
+    Tests that a raw system is only parsed when it is first accessed, and
+    that the parsed system is reused afterward
+    """
+    hit = PifSearchHit(id="abc123", system=system_dict, extracted={"name": "Gallium nitride"})
+    assert hit._system is system_dict
+
+    system = hit.system
+    assert isinstance(system, System)
+    assert system.uid == "abc123"
+    assert hit.system is system
+
+
+def test_system_from_string():
+    hit = PifSearchHit(system=json.dumps(system_dict))
+    assert hit.system.names == ["Gallium nitride"]
+
+
+def test_system_object_kept():
+    system = pif.loado(system_dict)
+    hit = PifSearchHit(system=system)
+    assert hit.system is system
+
+
+def test_invalid_system_type():
+    with pytest.raises(TypeError):
+        PifSearchHit(system=1)
+
+
+def test_as_dictionary_serializes_lazy_system():
+    """
+    Tests that serializing a hit writes the system as a PIF
+    """
+    hit = PifSearchHit(id="abc123", system=system_dict)
+    assert hit.as_dictionary()["system"] == pif.loado(system_dict).as_dictionary()
@@ -1,4 +1,4 @@
-from pypif.util.case import to_camel_case
+from citrination_client.search.query_serializer import camel_case_key, query_to_dictionary
 from pypif.util.case import keys_to_snake_case
 
 import json
@@ -18,11 +18,11 @@ class QueryEncoder(json.JSONEncoder):
         if obj is None:
             return []
         elif isinstance(obj, list):
-            return [i.as_dictionary() for i in obj]
+            return [query_to_dictionary(i) for i in obj]
         elif isinstance(obj, dict):
             return self._keys_to_camel_case(obj)
         else:
-            return obj.as_dictionary()
+            return query_to_dictionary(obj)
 
     def _keys_to_camel_case(self, obj):
         """
@@ -31,4 +31,20 @@ class QueryEncoder(json.JSONEncoder):
         :param obj: Dictionary to convert keys to camel case.
         :return: Dictionary with the input values and all keys in camel case
         """
-        return dict((to_camel_case(key), value) for (key, value) in obj.items())
+        return dict((camel_case_key(key), value) for (key, value) in obj.items())
+
+
+def encode_query(query, json_backend):
+    """
+    Encodes a query as a JSON request body.
+
+    :param query: The query to encode
+    :param json_backend: The backend used to encode the query
+    :type json_backend: :class:`JsonBackend`
+    :return: The UTF-8 encoded request body
+    :rtype: bytes
+    """
+    return json_backend.dumps(query, default=_encoder.default)
+
+
+_encoder = QueryEncoder()
@@ -0,0 +1,102 @@
+from pypif.util.case import to_camel_case
+from pypif.util.serializable import Serializable
+
+_DEFAULT_AS_DICTIONARY = Serializable.__dict__["as_dictionary"]
+
+# Camel case forms of keys, by snake case key
+_camel_case_keys = {}
+
+# Functions converting instances of a type to dictionaries, by type. None
+# marks a type whose instances are written as they are.
+_converters = {}
+
+
+def camel_case_key(key):
+    """
+    Converts a snake case key to camel case, remembering the result.
+
+    :param key: The snake case key
+    :type key: str
+    :return: The camel case key
+    :rtype: str
+    """
+    try:
+        return _camel_case_keys[key]
+    except KeyError:
+        camel_case = _camel_case_keys[key] = to_camel_case(key)
+        return camel_case
+
+
+def query_to_dictionary(obj):
+    """
+    Converts a query, or any other :class:`Serializable`, to the same
+    dictionary as its ``as_dictionary`` method. Classes which do not
+    override ``as_dictionary`` are converted with a serializer compiled once
+    per class, which looks up the camel case form of each attribute in a
+    table rather than recomputing it for every object.
+
+    :param obj: The object to convert
+    :return: The dictionary representing the object
+    :rtype: dict
+    """
+    converter = _converter(type(obj))
+    if converter is None:
+        return obj.as_dictionary()
+    return converter(obj)
+
+
+def _converter(cls):
+    try:
+        return _converters[cls]
+    except KeyError:
+        converter = _converters[cls] = _compile(cls)
+        return converter
+
+
+def _convert(value):
+    converter = _converter(type(value))
+    return value if converter is None else converter(value)
+
+
+def _convert_list(values):
+    return [_convert(value) for value in values]
+
+
+def _call_as_dictionary(obj):
+    return obj.as_dictionary()
+
+
+def _compile(cls):
+    """
+    Builds the function converting instances of a class in the same way as
+    :meth:`Serializable._convert_to_dictionary`.
+    """
+    if issubclass(cls, list):
+        return _convert_list
+    if not hasattr(cls, "as_dictionary"):
+        return None
+    if _class_attribute(cls, "as_dictionary") is not _DEFAULT_AS_DICTIONARY:
+        return _call_as_dictionary
+
+    keys = {}
+
+    def convert(obj):
+        dictionary = {}
+        for name, value in obj.__dict__.items():
+            if value is None:
+                continue
+            try:
+                key = keys[name]
+            except KeyError:
+                key = keys[name] = to_camel_case(name)
+            dictionary[key] = _convert(value)
+        return dictionary
+
+    return convert
+
+
+def _class_attribute(cls, name):
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return None
@@ -0,0 +1,96 @@
+from citrination_client.search.dataset.result.dataset_search_hit import DatasetSearchHit
+from citrination_client.search.dataset.result.dataset_search_result import DatasetSearchResult
+from citrination_client.search.file.result.file_search_hit import FileSearchHit
+from citrination_client.search.file.result.file_search_result import FileSearchResult
+from citrination_client.search.pif.result.pif_multi_search_result import PifMultiSearchResult
+from citrination_client.search.pif.result.pif_multi_search_result_element import PifMultiSearchResultElement
+from citrination_client.search.pif.result.pif_search_hit import PifSearchHit
+from citrination_client.search.pif.result.pif_search_result import PifSearchResult
+
+from pypif.util.case import to_snake_case
+
+# The class of the hits in each class of search result
+_HIT_CLASSES = {
+    PifSearchResult: PifSearchHit,
+    DatasetSearchResult: DatasetSearchHit,
+    FileSearchResult: FileSearchHit
+}
+
+# Snake case forms of keys, by camel case key
+_snake_case_keys = {}
+
+
+def snake_case_key(key):
+    """
+    Converts a camel case key to snake case, remembering the result.
+
+    :param key: The camel case key
+    :type key: str
+    :return: The snake case key
+    :rtype: str
+    """
+    try:
+        return _snake_case_keys[key]
+    except KeyError:
+        snake_case = _snake_case_keys[key] = to_snake_case(key)
+        return snake_case
+
+
+def keys_to_snake_case(dictionary):
+    """
+    Copies a dictionary with its keys converted to snake case. Only the top
+    level keys are converted, as with :func:`pypif.util.case.keys_to_snake_case`.
+
+    :param dictionary: The dictionary with camel case keys
+    :type dictionary: dict
+    :return: The dictionary with snake case keys
+    :rtype: dict
+    """
+    return dict((snake_case_key(key), value) for key, value in dictionary.items())
+
+
+def decode_search_result(results, result_class):
+    """
+    Builds a page of search results from the ``results`` of a search
+    response. Only the keys of the page and its hits are converted; the
+    values of each hit, including the PIF systems, are handed to the hit
+    untouched, so a system is only parsed when it is first accessed.
+
+    :param results: The results of the response
+    :type results: dict
+    :param result_class: The class of the page of results
+    :return: The page of results
+    :rtype: ``result_class``
+    """
+    fields = keys_to_snake_case(results)
+    hit_class = _HIT_CLASSES.get(result_class)
+    hits = fields.get("hits")
+    if hit_class is not None and hits is not None:
+        fields["hits"] = [hit_class(**keys_to_snake_case(hit)) if isinstance(hit, dict) else hit for hit in hits]
+    return result_class(**fields)
+
+
+def decode_pif_multi_search_result(results):
+    """
+    Builds the result of a PIF multi search from the ``results`` of its
+    response, decoding each query's results with :func:`decode_search_result`.
+
+    :param results: The results of the response
+    :type results: dict
+    :return: The results of each query
+    :rtype: :class:`PifMultiSearchResult`
+    """
+    fields = keys_to_snake_case(results)
+    elements = fields.get("results")
+    if elements is not None:
+        fields["results"] = [_decode_pif_multi_search_result_element(e) if isinstance(e, dict) else e
+                             for e in elements]
+    return PifMultiSearchResult(**fields)
+
+
+def _decode_pif_multi_search_result_element(element):
+    fields = keys_to_snake_case(element)
+    result = fields.get("result")
+    if isinstance(result, dict):
+        fields["result"] = decode_search_result(result, PifSearchResult)
+    return PifMultiSearchResultElement(**fields)
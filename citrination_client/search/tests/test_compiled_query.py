@@ -0,0 +1,53 @@
+from citrination_client.search import *
+from citrination_client.search.compiled_query import CompiledQuery
+from citrination_client.search.query_encoder import QueryEncoder
+from copy import deepcopy
+import json
+
+
+def _query():
+    return SearchClient("key").generate_simple_chemical_query(
+        name=["Gallium nitride", "Silicon"],
+        chemical_formula="GaN",
+        property_name="Band gap",
+        property_min=1.0,
+        property_max=4.0,
+        include_datasets=[1160],
+        from_index=20,
+        size=50)
+
+
+def test_compiled_query_matches_full_serialization():
+    """
+    Tests that the page bodies produced by a compiled query are equivalent
+    to serializing a copy of the query with the pagination updated
+    """
+    query = _query()
+    compiled = CompiledQuery(query)
+
+    expected = deepcopy(query)
+    expected.from_index = 120
+    expected.size = 10
+    assert json.loads(compiled.serialize(120, 10)) == json.loads(json.dumps(expected, cls=QueryEncoder))
+
+
+def test_compiled_query_omits_missing_pagination():
+    """
+    Tests that pagination parameters are left out of the body when None
+    """
+    compiled = CompiledQuery(PifSystemReturningQuery())
+    assert compiled.serialize() == b"{}"
+    assert json.loads(compiled.serialize(5)) == {"from": 5}
+    assert json.loads(compiled.serialize(size=7)) == {"size": 7}
+
+
+def test_compiled_query_does_not_track_later_mutation():
+    """
+    Tests that the compiled body is a snapshot of the query
+    """
+    query = _query()
+    compiled = CompiledQuery(query)
+    query.size = 1
+    query.query = None
+    assert compiled.size == 50
+    assert "query" in json.loads(compiled.serialize(0, 50))
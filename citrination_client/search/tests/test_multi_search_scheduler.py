@@ -0,0 +1,64 @@
+from citrination_client.search import *
+from citrination_client.base import RetryPolicy
+from citrination_client.base.errors import CitrinationClientError
+import json
+import pytest
+import requests_mock
+
+site = "mock://citrination"
+multi_search_url = site + "/api/search/pif/multi_pif_search"
+
+
+def _mock_multi_search(m, fail_simple=None):
+    """
+    Registers a fake multi search endpoint which answers each query with a
+    single hit whose ID is the simple search of the query. A request
+    containing ``fail_simple`` fails.
+    """
+    def callback(request, context):
+        simples = [q["query"]["simple"] for q in json.loads(request.body)["queries"]]
+        if fail_simple in simples:
+            context.status_code = 500
+            return {}
+        results = [{"status": "SUCCESS", "result": {"took": 1, "totalNumHits": 1, "hits": [{"id": s}]}}
+                   for s in simples]
+        return {"results": {"took": 1, "results": results}}
+    m.post(multi_search_url, json=callback)
+
+
+def _query(i):
+    return PifSystemReturningQuery(query=DataQuery(simple="formula{}".format(i)))
+
+
+def test_batched_results_are_returned_in_query_order():
+    """
+    Tests that queries are packed into batches and each result element is
+    returned for the query that produced it
+    """
+    client = SearchClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_multi_search(m)
+        elements = client.pif_multi_search_batched([_query(i) for i in range(103)], batch_size=10, max_workers=4)
+        batch_sizes = sorted(len(json.loads(r.body)["queries"]) for r in m.request_history)
+
+    assert [e.result.hits[0].id for e in elements] == ["formula{}".format(i) for i in range(103)]
+    assert batch_sizes == [3] + [10] * 10
+
+
+def test_failed_batches_fail_only_their_queries():
+    """
+    Tests that the futures of the queries in a failed batch raise, while the
+    other queries succeed
+    """
+    client = SearchClient("key", site, retry_policy=RetryPolicy(max_attempts=1))
+    with requests_mock.mock() as m:
+        _mock_multi_search(m, fail_simple="formula7")
+        with PifMultiSearchScheduler(client, batch_size=5, max_workers=2) as scheduler:
+            futures = [scheduler.submit(_query(i)) for i in range(12)]
+
+    for i, future in enumerate(futures):
+        if 5 <= i < 10:
+            with pytest.raises(CitrinationClientError):
+                future.result()
+        else:
+            assert future.result().result.hits[0].id == "formula{}".format(i)
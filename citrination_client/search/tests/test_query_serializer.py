@@ -0,0 +1,71 @@
+from citrination_client.search import *
+from citrination_client.search.query_encoder import QueryEncoder
+from citrination_client.search.query_serializer import query_to_dictionary
+from pypif.obj import System, Property
+import json
+
+
+def _query():
+    properties = [PropertyQuery(
+        name=FieldQuery(extract_as="property_{}".format(i), filter=Filter(equal="Property {}".format(i))),
+        value=FieldQuery(filter=[Filter(min=j, max=j + 1, logic="SHOULD") for j in range(5)]),
+        units=FieldQuery(extract_all=True)) for i in range(10)]
+    return PifSystemReturningQuery(
+        query=DataQuery(
+            dataset=DatasetQuery(id=[Filter(equal=str(i)) for i in range(3)]),
+            system=PifSystemQuery(
+                names=FieldQuery(extract_as="name", filter=Filter(exists=True)),
+                chemical_formula=ChemicalFieldQuery(filter=ChemicalFilter(equal="GaN")),
+                properties=properties)),
+        from_index=10,
+        size=100,
+        score_relevance=True,
+        return_system=False)
+
+
+def _pypif_json(obj):
+    """
+    Serializes an object using only pypif's own ``as_dictionary``.
+    """
+    return json.dumps(obj.as_dictionary())
+
+
+def test_serializer_matches_as_dictionary():
+    """
+    Tests that a large query serializes to exactly the same JSON as pypif produces
+    """
+    query = _query()
+    assert query_to_dictionary(query) == query.as_dictionary()
+    assert json.dumps(query, cls=QueryEncoder) == _pypif_json(query)
+    assert json.dumps([query, query], cls=QueryEncoder) == "[{0}, {0}]".format(_pypif_json(query))
+
+
+def test_serializer_skips_none_fields():
+    """
+    Tests that fields which are None are left out, and are written once set
+    """
+    query = FieldQuery(extract_as="band_gap")
+    assert query_to_dictionary(query) == {"extractAs": "band_gap"}
+
+    query.extract_all = True
+    assert json.dumps(query, cls=QueryEncoder) == _pypif_json(query)
+
+
+def test_serializer_uses_overridden_as_dictionary():
+    """
+    Tests that classes overriding as_dictionary, and PIFs nested in hits, are
+    serialized by their own method
+    """
+    system = System(uid="abc", properties=[Property(name="Band gap", scalars=1.5)])
+    hit = PifSearchHit(id="abc/1/1", dataset=1, dataset_version=1, score=1.0, system=system)
+    result = PifSearchResult(took=1, total_num_hits=1, max_score=1.0, hits=[hit])
+
+    assert json.dumps(result, cls=QueryEncoder) == _pypif_json(result)
+
+
+def test_encoder_camel_cases_dictionary_keys():
+    """
+    Tests that dictionaries passed to the encoder have their keys camel cased
+    """
+    assert QueryEncoder().default({"from_index": 1, "return_system": False}) == \
+        {"fromIndex": 1, "returnSystem": False}
@@ -0,0 +1,76 @@
+from citrination_client.search import *
+from citrination_client.search.result_decoder import decode_search_result, decode_pif_multi_search_result
+from pypif.util.case import keys_to_snake_case
+
+
+def _pif_results():
+    return {
+        "took": 3,
+        "totalNumHits": 2,
+        "maxScore": 1.5,
+        "hits": [{
+            "id": "abc/1/1",
+            "dataset": 1,
+            "datasetVersion": 1,
+            "score": 1.5,
+            "updatedAt": "2018-01-01",
+            "system": {"category": "system.chemical", "uid": "abc", "chemicalFormula": "GaN"},
+            "extracted": {"band_gap": "3.4"},
+            "extractedPath": {"band_gap": "properties[0].scalars[0].value"}
+        }, {
+            "id": "def/1/1",
+            "dataset": 1,
+            "datasetVersion": 1,
+            "score": 0.5
+        }]
+    }
+
+
+def test_decoding_matches_pypif():
+    """
+    Tests that decoded results are the same as converting the keys with pypif
+    """
+    expected = PifSearchResult(**keys_to_snake_case(_pif_results()))
+    decoded = decode_search_result(_pif_results(), PifSearchResult)
+
+    assert decoded.as_dictionary() == expected.as_dictionary()
+    assert decoded.hits[0].dataset_version == 1
+    assert decoded.hits[0].extracted_path == {"band_gap": "properties[0].scalars[0].value"}
+    assert decoded.hits[0].system.chemical_formula == "GaN"
+
+
+def test_decoding_leaves_systems_raw():
+    """
+    Tests that PIF systems are handed to the hits without being converted
+    """
+    results = _pif_results()
+    system = results["hits"][0]["system"]
+    decoded = decode_search_result(results, PifSearchResult)
+
+    assert decoded.hits[0]._system is system
+
+
+def test_decoding_dataset_results():
+    """
+    Tests that dataset hits are built with snake case fields
+    """
+    results = {"totalNumHits": 1, "hits": [{"id": "1", "isFeatured": True, "numPifs": 5}]}
+    decoded = decode_search_result(results, DatasetSearchResult)
+
+    assert decoded.total_num_hits == 1
+    assert decoded.hits[0].is_featured is True
+    assert decoded.hits[0].num_pifs == 5
+
+
+def test_decoding_multi_search_results():
+    """
+    Tests that each query's results in a multi search are decoded
+    """
+    results = {"took": 7, "results": [{"status": "SUCCESS", "result": _pif_results()}, {"status": "ERROR"}]}
+    decoded = decode_pif_multi_search_result(results)
+
+    assert decoded.took == 7
+    assert [e.status for e in decoded.results] == ["SUCCESS", "ERROR"]
+    assert decoded.results[0].result.total_num_hits == 2
+    assert decoded.results[0].result.hits[1].id == "def/1/1"
+    assert decoded.results[1].result is None
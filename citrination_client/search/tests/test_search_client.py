@@ -0,0 +1,199 @@
+from citrination_client.search import *
+from citrination_client.base import JsonBackend
+from citrination_client.base.errors import CitrinationClientError
+import requests_mock
+import json
+import pytest
+
+site = "mock://citrination"
+pif_search_url = site + "/api/search/pif_search"
+dataset_search_url = site + "/api/search/dataset"
+
+
+def _mock_search(m, url, total, page_cap=100):
+    """
+    Registers a fake search endpoint which serves ``total`` hits, at most
+    ``page_cap`` at a time, honoring the from and size of each request.
+    """
+    def callback(request, context):
+        body = json.loads(request.body)
+        from_index = body.get("from") or 0
+        size = body.get("size")
+        if size is None:
+            size = page_cap
+        end_index = min(total, from_index + min(size, page_cap))
+        hits = [{"id": str(i), "extracted": {"index": i}} for i in range(from_index, end_index)]
+        return {"results": {"took": 1, "totalNumHits": total, "hits": hits}}
+    m.post(url, json=callback)
+
+
+def test_parallel_pif_search_returns_hits_in_order():
+    """
+    Tests that fetching pages concurrently returns the same hits, in the
+    same order, as fetching them serially
+    """
+    client = SearchClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_search(m, pif_search_url, total=1050)
+        serial = client.pif_search(PifSystemReturningQuery())
+        parallel = client.pif_search(PifSystemReturningQuery(), parallelism=4)
+
+    assert [h.id for h in parallel.hits] == [h.id for h in serial.hits]
+    assert len(parallel.hits) == 1050
+    assert parallel.total_num_hits == 1050
+
+
+class CompactJsonBackend(JsonBackend):
+    """
+    A backend which encodes without whitespace and records what it encodes.
+    """
+
+    def __init__(self):
+        self.encoded = []
+
+    def dumps(self, obj, default=None):
+        self.encoded.append(obj)
+        return json.dumps(obj, default=default, separators=(",", ":")).encode("utf-8")
+
+
+def test_search_pages_are_encoded_with_the_client_backend():
+    """
+    Tests that the bodies of paginated searches come from the client's
+    JSON backend, with the pagination spliced in
+    """
+    backend = CompactJsonBackend()
+    client = SearchClient("key", site, json_backend=backend)
+    with requests_mock.mock() as m:
+        _mock_search(m, pif_search_url, total=250)
+        result = client.pif_search(PifSystemReturningQuery(size=250, return_system=False))
+        bodies = [r.body for r in m.request_history]
+
+    assert len(result.hits) == 250
+    assert len(backend.encoded) == 1
+    assert bodies[0] == b'{"from":0,"size":250,"returnSystem":false}'
+    assert all(isinstance(body, bytes) and b" " not in body for body in bodies)
+    assert [json.loads(body.decode("utf-8"))["from"] for body in bodies] == [0, 100, 200]
+
+
+def test_parallel_search_respects_from_and_size():
+    """
+    Tests that concurrent pagination honors from_index and size
+    """
+    client = SearchClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_search(m, dataset_search_url, total=1000)
+        result = client.dataset_search(DatasetReturningQuery(from_index=30, size=250), parallelism=3)
+
+    assert [h.id for h in result.hits] == [str(i) for i in range(30, 280)]
+
+
+def test_parallel_search_single_page():
+    """
+    Tests that only one request is made when the first page holds every hit
+    """
+    client = SearchClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_search(m, pif_search_url, total=20)
+        result = client.pif_search(PifSystemReturningQuery(), parallelism=8)
+        assert m.call_count == 1
+
+    assert len(result.hits) == 20
+
+
+def test_parallelism_must_be_positive():
+    client = SearchClient("key", site)
+    with pytest.raises(CitrinationClientError):
+        client.pif_search(PifSystemReturningQuery(), parallelism=0)
+
+
+def test_iter_pif_search_streams_pages():
+    """
+    Tests that iter_pif_search yields the first hits before requesting
+    later pages, and yields every hit in order
+    """
+    client = SearchClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_search(m, pif_search_url, total=250)
+        hits = client.iter_pif_search(PifSystemReturningQuery())
+        first = next(hits)
+        assert m.call_count == 1
+        rest = list(hits)
+        assert m.call_count == 3
+
+    assert [first.id] + [h.id for h in rest] == [str(i) for i in range(250)]
+
+
+def test_iter_dataset_search_parallel():
+    """
+    Tests that iter_dataset_search fetches ahead concurrently while keeping
+    hits in order
+    """
+    client = SearchClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_search(m, dataset_search_url, total=730)
+        hits = client.iter_dataset_search(DatasetReturningQuery(), parallelism=3)
+        assert [h.id for h in hits] == [str(i) for i in range(730)]
+
+
+def test_iter_search_validates_eagerly():
+    """
+    Tests that invalid queries are rejected when the generator is created
+    """
+    client = SearchClient("key", site)
+    with pytest.raises(CitrinationClientError):
+        client.iter_pif_search(PifSystemReturningQuery(size=-1))
+
+
+def test_pif_search_can_skip_systems():
+    """
+    Tests that opting out of systems asks Citrination not to return them
+    """
+    client = SearchClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_search(m, pif_search_url, total=10)
+        client.pif_search(PifSystemReturningQuery(return_system=True), include_system=False)
+        assert json.loads(m.last_request.body)["returnSystem"] is False
+        client.pif_search(PifSystemReturningQuery(return_system=True))
+        assert json.loads(m.last_request.body)["returnSystem"] is True
+
+
+def test_pif_search_columns():
+    """
+    Tests that the extracted values of every page are collected into columns
+    """
+    client = SearchClient("key", site)
+    with requests_mock.mock() as m:
+        _mock_search(m, pif_search_url, total=250)
+        columns = client.pif_search_columns(PifSystemReturningQuery(), parallelism=2)
+        assert json.loads(m.last_request.body)["returnSystem"] is False
+
+    assert list(columns["index"]) == list(range(250))
+
+
+def test_pif_cache_supplies_systems(tmpdir):
+    """
+    Tests that with a PIF cache, hits are requested without systems, the
+    systems of uncached hits are requested in one search, and cached systems
+    are reused by later searches
+    """
+    from citrination_client.data import PifCache
+    def callback(request, context):
+        body = json.loads(request.body)
+        if body.get("returnSystem") is False:
+            hits = [{"id": "7/1/uid{}".format(i), "dataset": 7, "datasetVersion": 1} for i in range(5)]
+        else:
+            uids = [f["equal"] for f in body["query"]["system"]["uid"]]
+            hits = [{"id": "7/1/" + uid, "dataset": 7, "datasetVersion": 1,
+                     "system": {"category": "system", "uid": uid}} for uid in uids]
+        return {"results": {"took": 1, "totalNumHits": len(hits), "hits": hits}}
+
+    client = SearchClient("key", site, pif_cache=PifCache(str(tmpdir.join("pifs.sqlite"))))
+    with requests_mock.mock() as m:
+        m.post(pif_search_url, json=callback)
+        first = client.pif_search(PifSystemReturningQuery(size=5))
+        second = client.pif_search(PifSystemReturningQuery(size=5))
+        requests_made = len(m.request_history)
+
+    assert [h.system.uid for h in first.hits] == ["uid{}".format(i) for i in range(5)]
+    assert [h.system.uid for h in second.hits] == ["uid{}".format(i) for i in range(5)]
+    assert requests_made == 3
@@ -0,0 +1,15 @@
+from citrination_client.util.lazy import lazy_attributes
+
+# Submodules are attributes of the package, imported when first accessed
+lazy_attributes(globals(), {}, {
+    "arrays": "citrination_client.util.arrays",
+    "config": "citrination_client.util.config",
+    "credentials": "citrination_client.util.credentials",
+    "env": "citrination_client.util.env",
+    "files": "citrination_client.util.files",
+    "maths": "citrination_client.util.maths",
+    "quote_finder": "citrination_client.util.quote_finder",
+    "slots": "citrination_client.util.slots"
+})
+
+del lazy_attributes
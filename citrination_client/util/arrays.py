@@ -0,0 +1,77 @@
+from array import array
+from numbers import Integral, Real
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from array import typecodes as _ARRAY_TYPECODES
+except ImportError:
+    _ARRAY_TYPECODES = "bBuhHiIlLfd"
+
+_INTEGER_TYPECODE = "q" if "q" in _ARRAY_TYPECODES else "l"
+
+
+def is_integer(value):
+    return isinstance(value, Integral) and not isinstance(value, bool)
+
+
+def is_real(value):
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def to_typed_array(values):
+    """
+    Converts a list of values into the most specific array type available:
+    integers if every value is an integer, floats (with NaN for None) if every
+    value is a number or None, and objects otherwise.
+
+    NumPy arrays are returned when NumPy is installed. Otherwise numeric
+    values are returned as :mod:`array` arrays and other values as a list.
+
+    :param values: The values to convert
+    :type values: list
+    :return: The values as an array
+    """
+    present = [v for v in values if v is not None]
+    if present and len(present) == len(values) and all(is_integer(v) for v in present):
+        if numpy is not None:
+            return numpy.array(values, dtype=numpy.int64)
+        return array(_INTEGER_TYPECODE, values)
+    if present and all(is_real(v) for v in present):
+        return float_array(values)
+    return object_array(values)
+
+
+def float_array(values):
+    """
+    Converts a list of numbers, or None, into an array of floats with NaN in
+    place of None.
+
+    :param values: The values to convert
+    :type values: list
+    :return: The values as an array of floats
+    """
+    nan = float("nan")
+    floats = [nan if v is None else float(v) for v in values]
+    if numpy is not None:
+        return numpy.array(floats, dtype=numpy.float64)
+    return array("d", floats)
+
+
+def object_array(values):
+    """
+    Converts a list of arbitrary values into an object array, or a list when
+    NumPy is not installed.
+
+    :param values: The values to convert
+    :type values: list
+    :return: The values as an object array
+    """
+    if numpy is not None:
+        column = numpy.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+    return list(values)
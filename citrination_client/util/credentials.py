@@ -1,4 +1,3 @@
-import yaml
 import os
 import sys
 import citrination_client.util.env as citr_env_vars
@@ -23,6 +22,8 @@ def load_file_as_yaml(path):
 
     :param path: The path to a YAML file
     """
+    # yaml is slow to import, and only needed when a credentials file is read
+    import yaml
     with open(path, "r") as f:
       raw_yaml = f.read()
       parsed_dict = yaml.load(raw_yaml)
@@ -70,16 +71,20 @@ def get_preferred_credentials(api_key, site, cred_file=DEFAULT_CITRINATION_CREDE
     :param site: A Citrination site URL or None
     :param cred_file: The path to a credentials file
     """
-    profile_api_key, profile_site = get_credentials_from_file(cred_file)
     if api_key is None:
         api_key =  os.environ.get(citr_env_vars.CITRINATION_API_KEY)
-    if api_key is None or len(api_key) == 0:
-        api_key = profile_api_key
-
     if site is None:
         site = os.environ.get(citr_env_vars.CITRINATION_SITE)
-    if site is None or len(site) == 0:
-        site = profile_site
+
+    # The credentials file is only read when it is needed
+    missing_api_key = api_key is None or len(api_key) == 0
+    missing_site = site is None or len(site) == 0
+    if missing_api_key or missing_site:
+        profile_api_key, profile_site = get_credentials_from_file(cred_file)
+        if missing_api_key:
+            api_key = profile_api_key
+        if missing_site:
+            site = profile_site
     if site is None:
         site = "https://citrination.com"
 
@@ -0,0 +1,19 @@
+import os
+
+
+def replace_file(source, destination):
+    """
+    Moves a file over another, replacing it atomically where the platform
+    allows.
+
+    :param source: The path of the file to move
+    :type source: str
+    :param destination: The path to move it to
+    :type destination: str
+    """
+    if hasattr(os, "replace"):
+        os.replace(source, destination)
+    else:
+        if os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
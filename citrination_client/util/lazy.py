@@ -0,0 +1,52 @@
+from importlib import import_module
+import sys
+import types
+
+
+def lazy_attributes(module_globals, attributes, submodules=None):
+    """
+    Makes attributes of a package import the modules defining them only when
+    they are first accessed, through a module ``__getattr__`` (PEP 562).
+    Python versions without module ``__getattr__`` import every attribute
+    straight away.
+
+    The package's ``__all__`` is set to its public attributes, so that star
+    imports of the package still import everything.
+
+    :param module_globals: The ``globals()`` of the package
+    :type module_globals: dict
+    :param attributes: The module defining each attribute, by attribute name
+    :type attributes: dict
+    :param submodules: The modules which are themselves attributes of the
+        package, by attribute name. They are not added to ``__all__``.
+    :type submodules: dict
+    """
+    submodules = submodules or {}
+    module_name = module_globals["__name__"]
+    defined = [name for name, value in module_globals.items()
+               if not name.startswith("_") and not isinstance(value, types.ModuleType) and value is not lazy_attributes]
+    module_globals["__all__"] = sorted(set(defined) | set(attributes))
+
+    def load(name):
+        if name in attributes:
+            value = getattr(import_module(attributes[name]), name)
+        else:
+            value = import_module(submodules[name])
+        module_globals[name] = value
+        return value
+
+    if sys.version_info < (3, 7):
+        for name in list(attributes) + list(submodules):
+            load(name)
+        return
+
+    def __getattr__(name):
+        if name not in attributes and name not in submodules:
+            raise AttributeError("module {!r} has no attribute {!r}".format(module_name, name))
+        return load(name)
+
+    def __dir__():
+        return sorted(set(module_globals) | set(attributes) | set(submodules))
+
+    module_globals["__getattr__"] = __getattr__
+    module_globals["__dir__"] = __dir__
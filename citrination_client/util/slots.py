@@ -0,0 +1,34 @@
+class Slotted(object):
+    """
+    Base for classes which declare their fields as ``__slots__``, so that
+    instances store their fields without a per-instance dictionary. Every
+    class in the hierarchy must declare ``__slots__`` for the dictionary to
+    be left out.
+
+    The fields are copied when the object is pickled or copied, including
+    with the pickle protocols which do not support slots by themselves.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def slot_names(cls):
+        """
+        The names of the slots of the class, in the order they are declared.
+
+        :rtype: tuple of str
+        """
+        names = cls.__dict__.get("_slot_names")
+        if names is None:
+            names = ()
+            for klass in reversed(cls.__mro__):
+                names += tuple(klass.__dict__.get("__slots__", ()))
+            cls._slot_names = names
+        return names
+
+    def __getstate__(self):
+        return dict((name, getattr(self, name)) for name in self.slot_names() if hasattr(self, name))
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
@@ -0,0 +1,91 @@
+from citrination_client.util.lazy import lazy_attributes
+import citrination_client
+import pytest
+import subprocess
+import sys
+
+requires_module_getattr = pytest.mark.skipif(sys.version_info < (3, 7), reason="requires module __getattr__")
+
+HEAVY_MODULES = ["requests", "yaml", "numpy", "pypif", "citrination_client.client"]
+
+
+def _imported_modules(statement):
+    """
+    Runs a statement in a fresh interpreter and returns which of the heavy
+    modules it imported.
+    """
+    script = "import sys\n{}\nprint(','.join(m for m in {!r} if m in sys.modules))".format(statement, HEAVY_MODULES)
+    output = subprocess.check_output([sys.executable, "-c", script]).decode("utf-8").strip()
+    return [m for m in output.split(",") if m]
+
+
+@requires_module_getattr
+def test_import_loads_no_dependencies():
+    """
+    Tests that importing the package does not import the clients or their dependencies
+    """
+    assert _imported_modules("import citrination_client") == []
+
+
+@requires_module_getattr
+def test_attributes_load_on_access():
+    """
+    Tests that accessing a query class imports only what it needs
+    """
+    assert _imported_modules("import citrination_client\ncitrination_client.Filter") == ["pypif"]
+    assert "citrination_client.client" in _imported_modules("from citrination_client import CitrinationClient")
+
+
+def test_lazy_attributes():
+    """
+    Tests that lazy attributes are listed, exported and resolved from their modules
+    """
+    from citrination_client.search.core.query.filter import Filter
+
+    assert citrination_client.search.Filter is Filter
+    assert citrination_client.Filter is Filter
+    assert "Filter" in citrination_client.__all__
+    assert "Filter" in dir(citrination_client)
+    assert "lazy_attributes" not in citrination_client.__all__
+    with pytest.raises(AttributeError):
+        citrination_client.NoSuchClass
+
+    namespace = {"__name__": "example", "value": 1}
+    lazy_attributes(namespace, {"OrderedDict": "collections"})
+    assert namespace["__all__"] == ["OrderedDict", "value"]
+    if sys.version_info >= (3, 7):
+        assert "OrderedDict" not in namespace
+        namespace["__getattr__"]("OrderedDict")
+    from collections import OrderedDict
+    assert namespace["OrderedDict"] is OrderedDict
+
+
+def test_lazy_submodules():
+    """
+    Tests that submodules remain attributes of the packages and that the
+    helpers are not left in their namespaces
+    """
+    from citrination_client.base import errors
+    from citrination_client.models import design, routes
+    from citrination_client.util import credentials
+
+    assert citrination_client.errors is errors
+    assert citrination_client.routes is routes
+    assert citrination_client.design is design
+    assert citrination_client.models.design is design
+    assert citrination_client.util.credentials is credentials
+    assert citrination_client.base.base_client.__name__ == "citrination_client.base.base_client"
+    assert "errors" in dir(citrination_client)
+    assert "errors" not in citrination_client.__all__
+    for package in [citrination_client, citrination_client.base, citrination_client.util]:
+        assert "lazy_attributes" not in dir(package)
+    assert "sys" not in dir(citrination_client)
+
+    namespace = {"__name__": "example"}
+    lazy_attributes(namespace, {}, {"path": "os.path"})
+    assert namespace["__all__"] == []
+    if sys.version_info >= (3, 7):
+        assert "path" in namespace["__dir__"]()
+        namespace["__getattr__"]("path")
+    import os.path
+    assert namespace["path"] is os.path
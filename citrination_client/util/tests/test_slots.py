@@ -0,0 +1,49 @@
+from citrination_client.models import PredictedValue
+from citrination_client.util.slots import Slotted
+from copy import copy, deepcopy
+import pickle
+import pytest
+
+
+def test_predicted_value_has_no_instance_dictionary():
+    """
+    Tests that predicted values store their fields only in slots
+    """
+    value = PredictedValue("Band gap", 1.5, 0.1)
+    assert not hasattr(value, "__dict__")
+    assert PredictedValue.slot_names() == ("_key", "_value", "_loss")
+    with pytest.raises(AttributeError):
+        value.extra = 1
+
+    value.value = 2.0
+    del value.loss
+    assert (value.key, value.value, value.loss) == ("Band gap", 2.0, None)
+
+
+def test_slotted_objects_copy_and_pickle():
+    """
+    Tests that slotted objects keep their fields when copied and pickled,
+    with every pickle protocol
+    """
+    value = PredictedValue("Band gap", 1.5, 0.1)
+    copies = [copy(value), deepcopy(value)] + \
+        [pickle.loads(pickle.dumps(value, protocol)) for protocol in range(pickle.HIGHEST_PROTOCOL + 1)]
+    for copied in copies:
+        assert isinstance(copied, PredictedValue)
+        assert (copied.key, copied.value, copied.loss) == ("Band gap", 1.5, 0.1)
+
+
+def test_slot_names_include_base_classes():
+    """
+    Tests that the slots of every class in the hierarchy are listed, in order
+    """
+    class Point(Slotted):
+        __slots__ = ("x", "y")
+
+    class LabelledPoint(Point):
+        __slots__ = ("label",)
+
+    point = LabelledPoint()
+    point.x, point.y = 1, 2
+    assert LabelledPoint.slot_names() == ("x", "y", "label")
+    assert point.__getstate__() == {"x": 1, "y": 2}
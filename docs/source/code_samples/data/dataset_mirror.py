@@ -0,0 +1,16 @@
+from citrination_client.data import DatasetMirror
+import json
+import os
+
+# ... client initialization left out
+data_client = client.data
+
+# Mirror version 3 of dataset 1 under ~/citrination_mirror
+mirror = DatasetMirror(data_client, 1, 3, os.path.expanduser("~/citrination_mirror"))
+mirror.sync(max_workers=8)
+
+# Later runs read from the local store without touching the network
+for path in mirror.paths():
+    with mirror.open(path) as f:
+        if path.endswith(".json"):
+            record = json.loads(f.read().decode("utf-8"))
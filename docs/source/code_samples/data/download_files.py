@@ -0,0 +1,11 @@
+# ... client initialization left out
+data_client = client.data
+
+dataset_files = data_client.get_dataset_files(1)
+
+# Download 8 files at a time, splitting files over 64MB into 64MB ranges
+result = data_client.download_files(dataset_files, "dataset_1/", max_workers=8,
+                                    range_size=64 * 1024 * 1024)
+if not result.successful():
+    print(result.failures)
+print("{:.1f} MB/s".format(result.megabytes_per_second))
@@ -0,0 +1,12 @@
+# ... client initialization left out
+data_client = client.data
+dataset_id = 1
+
+uids = ["000496A81BDD616A5BBA1FC4D3B5AC1A", "0006C4C1D1F3A4E8A4CE2B7F5AEA2A1B"]
+
+# One result per uid, in the same order
+for result in data_client.get_pifs(dataset_id, uids, max_workers=8):
+    if result.successful():
+        print(result.pif.uid)
+    else:
+        print("Could not retrieve {}: {}".format(result.uid, result.error))
@@ -0,0 +1,9 @@
+from citrination_client import CitrinationClient, PifCache
+
+# Keep up to 1GB of compressed PIFs between runs
+pif_cache = PifCache("pifs.sqlite", max_bytes=1024 * 1024 * 1024)
+client = CitrinationClient("my_api_key", pif_cache=pif_cache)
+
+# Only the first call for this version of the record makes a request
+pif = client.data.get_pif(1, "1DF1C8EB706363DS2G3", dataset_version=3)
+pif = client.data.get_pif(1, "1DF1C8EB706363DS2G3", dataset_version=3)
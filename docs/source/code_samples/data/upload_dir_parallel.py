@@ -0,0 +1,7 @@
+# ... client initialization left out
+data_client = client.data
+
+result = data_client.upload(1, "characterizations/", max_workers=16)
+
+print("{} files uploaded, {} failed".format(len(result.successes), len(result.failures)))
+print("{:.1f} files/s, {:.2f} MB/s".format(result.files_per_second, result.megabytes_per_second))
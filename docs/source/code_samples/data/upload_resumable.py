@@ -0,0 +1,6 @@
+# ... client initialization left out
+data_client = client.data
+
+# If this is interrupted, running it again picks up where it left off
+result = data_client.upload(1, "raw_instrument_data/", max_workers=4,
+                            journal="raw_instrument_data.journal")
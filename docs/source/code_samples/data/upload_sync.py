@@ -0,0 +1,7 @@
+# ... client initialization left out
+data_client = client.data
+
+# Only files which are new or have changed since the last sync are uploaded
+result = data_client.upload_sync(1, "raw_instrument_data/", max_workers=8,
+                                 manifest="raw_instrument_data.manifest")
+print("Uploaded {} files, skipped {}".format(len(result.successes), len(result.skipped)))
@@ -0,0 +1,15 @@
+from citrination_client import AsyncCitrinationClient, PifSystemReturningQuery
+import asyncio
+
+async def main():
+    async with AsyncCitrinationClient("my_api_key") as client:
+        # Run several predictions concurrently
+        results = await asyncio.gather(*[
+            client.predict("524", {"formula": formula}) for formula in ["NaCl", "KCl", "LiF"]
+        ])
+
+        # Consume search hits page by page as they arrive
+        async for hit in client.search.iter_pif_search(PifSystemReturningQuery(size=500)):
+            print(hit.id)
+
+asyncio.run(main())
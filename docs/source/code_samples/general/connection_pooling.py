@@ -0,0 +1,4 @@
+from citrination_client import CitrinationClient
+
+# Keep up to 20 connections open per host
+client = CitrinationClient("my_api_key", pool_maxsize=20)
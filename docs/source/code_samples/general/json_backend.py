@@ -0,0 +1,6 @@
+from citrination_client import CitrinationClient, get_json_backend
+
+# Encode and decode request and response bodies with orjson
+client = CitrinationClient("my_api_key", json_backend=get_json_backend("orjson"))
+
+print(client.json_backend.name)
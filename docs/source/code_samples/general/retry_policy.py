@@ -0,0 +1,7 @@
+from citrination_client import CitrinationClient, RetryPolicy
+
+# Make up to six attempts, waiting at most ten seconds between them
+policy = RetryPolicy(max_attempts=6, max_delay=10.0)
+client = CitrinationClient("my_api_key", retry_policy=policy)
+
+print(client.search.retry_stats)
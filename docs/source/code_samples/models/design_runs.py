@@ -0,0 +1,21 @@
+from citrination_client.models import Target, DesignRunMonitor
+
+# ... client initialization left out
+models_client = client.models
+data_view_id = "1234"
+
+# Wait up to an hour for a single run, then fetch its results
+run = models_client.submit_design_run(data_view_id, num_candidates=10, effort=5,
+                                      target=Target("Property Band gap", "Max"))
+results = models_client.wait_for_design_run(data_view_id, run.uuid, timeout=3600)
+print(results.best_materials)
+
+# Follow many runs at once, making at most one request per second in total
+monitor = DesignRunMonitor(models_client, max_requests_per_second=1.0)
+for effort in range(1, 11):
+    monitor.add(data_view_id, models_client.submit_design_run(data_view_id, 10, effort))
+for monitored in monitor.wait(timeout=7200):
+    if monitored.successful():
+        print(monitored.uuid, len(monitored.results.next_experiments))
+    else:
+        print(monitored.uuid, monitored.error)
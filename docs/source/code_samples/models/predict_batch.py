@@ -0,0 +1,8 @@
+# ... client initialization left out
+
+models_client = client.models
+
+inputs = [{"formula": formula} for formula in formulas]
+
+prediction_results = models_client.predict_batch(
+    "4106", inputs, chunk_size=500, max_workers=4)
@@ -0,0 +1,12 @@
+# ... client initialization left out
+
+models_client = client.models
+
+table = models_client.predict_table("4106", inputs)
+
+# Every predicted band gap, and its loss, as arrays
+band_gaps = table["Property Band gap"].values
+band_gap_losses = table["Property Band gap"].losses
+
+# The prediction for the first candidate
+first_band_gap = table[0].get_value("Property Band gap").value
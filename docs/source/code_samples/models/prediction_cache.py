@@ -0,0 +1,12 @@
+from citrination_client import CitrinationClient, SqlitePredictionCache
+
+cache = SqlitePredictionCache("predictions.db", max_size=100000)
+client = CitrinationClient("my_api_key", prediction_cache=cache)
+
+models_client = client.models
+
+# Only the candidates which have not been predicted before are sent
+results = models_client.predict("4106", inputs)
+
+# Forget the predictions for a data view after it has been retrained
+models_client.invalidate_prediction_cache("4106")
@@ -0,0 +1,7 @@
+# ... client initialization and query construction left out
+
+search_client = client.search
+
+# Process each record while later pages are still being fetched
+for hit in search_client.iter_pif_search(query, parallelism=4):
+    print(hit.id, hit.extracted)
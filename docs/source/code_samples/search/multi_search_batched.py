@@ -0,0 +1,25 @@
+from citrination_client.search import PifSystemReturningQuery, DataQuery, PifSystemQuery, ChemicalFieldQuery, \
+    ChemicalFilter, PifMultiSearchScheduler
+
+# ... client initialization left out
+search_client = client.search
+
+formulas = ["Al2O3", "SiO2", "TiO2", "ZnO", "MgO"]
+queries = [
+    PifSystemReturningQuery(
+        size=10,
+        query=DataQuery(
+            system=PifSystemQuery(
+                chemical_formula=ChemicalFieldQuery(filter=ChemicalFilter(equal=formula)))))
+    for formula in formulas
+]
+
+# One result element per query, in the same order, from a handful of requests
+elements = search_client.pif_multi_search_batched(queries, batch_size=25, max_workers=4)
+for formula, element in zip(formulas, elements):
+    print(formula, element.result.total_num_hits)
+
+# Queries produced over time can be submitted to a scheduler instead
+with PifMultiSearchScheduler(search_client, batch_size=25) as scheduler:
+    futures = dict((formula, scheduler.submit(query)) for formula, query in zip(formulas, queries))
+hits = dict((formula, future.result().result.hits) for formula, future in futures.items())
@@ -0,0 +1,11 @@
+# ... client initialization left out
+
+search_client = client.search
+
+query = PifSystemReturningQuery(
+            query=DataQuery(
+                dataset=DatasetQuery(
+                    id=Filter(equal='1160'))))
+
+# Fetch up to four pages of results at a time
+results = search_client.pif_search(query, parallelism=4)
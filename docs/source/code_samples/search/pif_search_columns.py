@@ -0,0 +1,11 @@
+# ... client initialization left out
+
+search_client = client.search
+
+query = search_client.generate_simple_chemical_query(
+    property_name="Band gap", include_datasets=[1160])
+
+columns = search_client.pif_search_columns(query, parallelism=4)
+
+band_gaps = columns["property_value"]
+frame = columns.to_pandas()
@@ -9,7 +9,8 @@ setup(name='citrination-client',
           'requests<3',
           'pypif',
           'six<2',
-          'pyyaml'
+          'pyyaml',
+          'futures; python_version < "3"'
       ],
       extras_require={
         "dev": [
@@ -19,5 +20,11 @@ setup(name='citrination-client',
         "test": [
           'requests_mock',
           'pytest',
+        ],
+        "async": [
+          'aiohttp; python_version >= "3.6"',
+        ],
+        "fast-json": [
+          'orjson; python_version >= "3.6"',
         ]
       })